@@ -1,9 +1,6 @@
 import typing as t
 from datetime import datetime, timezone
 
-import dateutil.parser
-import humanize
-
 from ..riches import rich_colours
 
 
@@ -17,6 +14,9 @@ class HumanThings:
         Converts a UNIX timestamp or ISO 8601 datetime string to a human-readable relative time.
         If parsing fails, returns the original input unchanged.
         """
+        import dateutil.parser
+        import humanize
+
         if isinstance(inhuman_datetime, float):
             then = datetime.fromtimestamp(inhuman_datetime, tz=timezone.utc)
         else:
@@ -37,6 +37,8 @@ class HumanThings:
         """
         Format a number using abbreviations like k, M, B, etc.
         """
+        import humanize
+
         word = humanize.intword(inhuman_number)
         return (
             word.replace(" thousand", "K")
@@ -47,4 +49,6 @@ class HumanThings:
 
     @classmethod
     def human_filesize(cls, inhuman_filesize: int) -> str:
+        import humanize
+
         return humanize.naturalsize(value=inhuman_filesize, binary=True)
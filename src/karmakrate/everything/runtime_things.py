@@ -1,18 +1,23 @@
+import json
 import os
 import subprocess
+import tempfile
+import time
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor
 
-import packaging.version
-import requests
 from karmakrate.everything.human_things import HumanThings
 from knewkarma.core.client import USER_AGENT
 from knewkarma.meta.about import Project
 from knewkarma.meta.version import Version
-from rich.status import Status
 
+from ..handlers.io_handlers import FileHandler
 from ..riches import rich_colours
 from ..riches.rich_logging import console
 
+if t.TYPE_CHECKING:
+    import requests
+
 __all__ = ["RuntimeThings"]
 
 
@@ -27,34 +32,164 @@ class RuntimeThings:
         self.package_name = package_name
         self.version_cls = version_cls
 
-    @staticmethod
+    # Where responses of the update and status checks are cached, and for how long (in seconds).
+    CACHE_FILE: str = os.path.join(FileHandler.PARENT_DIR, "cache", "runtime.json")
+    CACHE_TTL: t.Dict[str, int] = {"status": 300, "updates": 6 * 60 * 60}
+    # Seconds to wait for a check's server; the check threads are joined at exit, so a hung
+    # request would otherwise keep the process alive after the command is done.
+    REQUEST_TIMEOUT: float = 5
+
+    @classmethod
     def send_request(
+        cls,
         url: str,
-        session: requests.Session,
+        session: "requests.Session",
+        ttl: t.Optional[int] = None,
     ) -> t.Union[t.Dict, t.List, str, None]:
+        """
+        :param url: URL to get JSON from.
+        :type url: str
+        :param session: Session to send the request with.
+        :type session: requests.Session
+        :param ttl: If set, a response cached less than this many seconds ago is returned
+            instead of sending the request, and a fresh response is cached.
+        :type ttl: t.Optional[int]
+        """
+        if ttl:
+            entry: t.Optional[t.Dict] = cls._read_cache().get(url)
+            if entry and time.time() - entry["fetched_at"] < ttl:
+                return entry["data"]
+
         with session.get(
             url=url,
             headers={"User-Agent": USER_AGENT},
+            timeout=cls.REQUEST_TIMEOUT,
         ) as response:
-            return response.json()
+            data = response.json()
+
+        if ttl:
+            cls._write_cache(url=url, data=data)
+
+        return data
+
+    @classmethod
+    def _read_cache(cls) -> t.Dict[str, t.Dict]:
+        try:
+            with open(cls.CACHE_FILE) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    @classmethod
+    def _write_cache(cls, url: str, data: t.Any):
+        directory: str = os.path.dirname(cls.CACHE_FILE)
+        FileHandler.pathfinder(directories=directory)
+
+        cache: t.Dict[str, t.Dict] = cls._read_cache()
+        cache[url] = {"fetched_at": time.time(), "data": data}
+
+        # Replaced atomically, as concurrent runs may be writing to it too. Failing to cache a
+        # response doesn't fail the check it belongs to.
+        try:
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(descriptor, "w") as temp_file:
+                json.dump(cache, temp_file)
+            os.replace(temp_path, cls.CACHE_FILE)
+        except (OSError, TypeError, ValueError):
+            os.unlink(temp_path)
 
     @classmethod
     def clear_screen(cls):
         subprocess.run(["cls" if os.name == "nt" else "clear"])
 
-    def check_status(
-        self,
-        session: requests.Session,
-        status: Status,
-    ) -> t.Union[t.List[t.Dict], None]:
+    def start_checks(self) -> t.Dict[str, Future]:
+        """
+        Starts the update and server status checks in background threads, so they run while
+        the actual command proceeds. Both checks are served from the on-disk cache while it is
+        fresh, so a run against a warm cache sends no requests at all.
+
+        :return: Futures of the checks' results, keyed by check, to pass to :meth:`report_checks`.
+        :rtype: t.Dict[str, Future]
+        """
+        executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="runtime-checks"
+        )
+        checks: t.Dict[str, Future] = {
+            "update": executor.submit(self._run_check, self.fetch_updates),
+            "server status": executor.submit(self._run_check, self.fetch_status),
+        }
+        executor.shutdown(wait=False)
+
+        return checks
+
+    @staticmethod
+    def _run_check(fetch: t.Callable[..., t.Any]) -> t.Any:
+        import requests
 
-        if isinstance(status, Status):
-            status.update(f"Checking server status...")
+        with requests.Session() as session:
+            return fetch(session=session)
 
+    def report_checks(self, checks: t.Dict[str, Future], timeout: float = 5):
+        """
+        Prints the results of checks started with :meth:`start_checks`.
+
+        :param checks: The futures returned by :meth:`start_checks`.
+        :type checks: t.Dict[str, Future]
+        :param timeout: Maximum number of seconds to wait for unfinished checks, in all.
+        :type timeout: float
+        """
+        deadline: float = time.monotonic() + timeout
+        results: t.Dict[str, t.Any] = {}
+        for name, check in checks.items():
+            try:
+                results[name] = check.result(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except TimeoutError:
+                console.log(
+                    f"{rich_colours.BOLD_YELLOW}⚠{rich_colours.BOLD_YELLOW_RESET} Couldn't complete the {name} check: timed out after {timeout}s"
+                )
+            except Exception as error:
+                console.log(
+                    f"{rich_colours.BOLD_YELLOW}⚠{rich_colours.BOLD_YELLOW_RESET} Couldn't complete the {name} check: {error or type(error).__name__}"
+                )
+
+        if "update" in results:
+            self.report_updates(pypi_response=results["update"])
+        if "server status" in results:
+            self.report_status(*results["server status"])
+
+    def fetch_status(
+        self, session: "requests.Session"
+    ) -> t.Tuple[t.Dict, t.Optional[t.List[t.Dict]]]:
+        """
+        :return: Reddit's status, and its components if it isn't fully operational.
+        :rtype: t.Tuple[t.Dict, t.Optional[t.List[t.Dict]]]
+        """
         status_response: dict = self.send_request(
-            url=self.ENDPOINTS["status"], session=session
+            url=self.ENDPOINTS["status"], session=session, ttl=self.CACHE_TTL["status"]
         )
 
+        components: t.Optional[t.List[t.Dict]] = None
+        if status_response.get("status").get("indicator") != "none":
+            status_components: t.Dict = self.send_request(
+                url=self.ENDPOINTS["components"],
+                session=session,
+                ttl=self.CACHE_TTL["status"],
+            )
+            if isinstance(status_components, t.Dict):
+                components = status_components.get("components")
+
+        return status_response, components
+
+    @staticmethod
+    def report_status(
+        status_response: t.Dict, components: t.Optional[t.List[t.Dict]] = None
+    ) -> t.Union[t.List[t.Dict], None]:
         indicator = status_response.get("status").get("indicator")
         description = status_response.get("status").get("description")
         if description:
@@ -66,38 +201,29 @@ class RuntimeThings:
                 console.log(
                     f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {description} ({rich_colours.YELLOW}{indicator}{rich_colours.YELLOW_RESET})"
                 )
+                return components
+        return None
 
-                if isinstance(status, Status):
-                    status.update("Getting status components...")
-
-                status_components: t.Dict = self.send_request(
-                    url=self.ENDPOINTS["components"],
-                    session=session,
-                )
-
-                if isinstance(status_components, t.Dict):
-                    components: t.List[t.Dict] = status_components.get("components")
+    def fetch_updates(self, session: "requests.Session") -> t.Dict:
+        """
+        :return: The package's PyPI metadata.
+        :rtype: t.Dict
+        """
+        return self.send_request(
+            url=f"https://pypi.org/pypi/{Project.package}/json",
+            session=session,
+            ttl=self.CACHE_TTL["updates"],
+        )
 
-                    return components
-        return None
+    @staticmethod
+    def report_updates(pypi_response: t.Dict):
+        import packaging.version
 
-    def check_updates(
-        self,
-        session: requests.Session,
-        status: Status,
-    ):
         package_name = Project.package
         local_version = Version.full_version
 
-        if isinstance(status, Status):
-            status.update("Checking for updates...")
-
-        response = self.send_request(
-            url=f"https://pypi.org/pypi/{package_name}/json", session=session
-        )
-
-        latest_version = response.get("info").get("version")
-        release_date = response.get("releases")[latest_version][0]["upload_time"]
+        latest_version = pypi_response.get("info").get("version")
+        release_date = pypi_response.get("releases")[latest_version][0]["upload_time"]
 
         local_ver = packaging.version.parse(local_version)
         latest_ver = packaging.version.parse(latest_version)
@@ -1,9 +1,7 @@
 import os
+import re
 import typing as t
 
-from dotenv import load_dotenv
-from rich.prompt import Prompt
-
 from .io_handlers import FileHandler
 from ..riches import rich_colours
 from ..riches.rich_logging import console
@@ -13,9 +11,13 @@ class AuthHandler:
     ENV_CLIENT_ID = "REDDIT_CLIENT_ID"
     ENV_CLIENT_SECRET = "REDDIT_CLIENT_SECRET"
     ENV_FILE = os.path.join(FileHandler.AUTH_DIR, ".env")
+    # Extra credential pairs, e.g. REDDIT_CLIENT_ID_2 and REDDIT_CLIENT_SECRET_2.
+    ENV_POOL_PATTERN = re.compile(rf"^{ENV_CLIENT_ID}_(\d+)$")
 
     @classmethod
     def read(cls) -> t.Dict[str, str]:
+        from dotenv import load_dotenv
+
         FileHandler.pathfinder(directories=[FileHandler.AUTH_DIR])
 
         if os.path.exists(cls.ENV_FILE):
@@ -43,10 +45,48 @@ class AuthHandler:
             )
             return cls.write()
 
+    @classmethod
+    def read_all(cls) -> t.List[t.Dict[str, str]]:
+        """
+        Reads the main credentials, followed by any numbered pairs (``REDDIT_CLIENT_ID_<n>`` and
+        ``REDDIT_CLIENT_SECRET_<n>``) set in the .env file or the environment, ordered by number.
+
+        :return: A list of credentials, one per registered app.
+        :rtype: t.List[t.Dict[str, str]]
+        """
+        credentials: t.List[t.Dict[str, str]] = [cls.read()]
+        numbers: t.List[int] = sorted(
+            int(match.group(1))
+            for match in map(cls.ENV_POOL_PATTERN.match, os.environ)
+            if match
+        )
+
+        for number in numbers:
+            client_id = os.getenv(f"{cls.ENV_CLIENT_ID}_{number}")
+            client_secret = os.getenv(f"{cls.ENV_CLIENT_SECRET}_{number}")
+            if not client_secret:
+                console.log(
+                    f"{rich_colours.BOLD_YELLOW}⚠{rich_colours.BOLD_YELLOW_RESET} {cls.ENV_CLIENT_SECRET}_{number} is missing. Skipping {cls.ENV_CLIENT_ID}_{number}."
+                )
+                continue
+            if client_id not in (credential["client_id"] for credential in credentials):
+                credentials.append(
+                    {"client_id": client_id, "client_secret": client_secret}
+                )
+
+        if len(credentials) > 1:
+            console.print(
+                f"{rich_colours.BOLD_BLUE}＊{rich_colours.BOLD_BLUE_RESET} Loaded {len(credentials)} credential pairs."
+            )
+
+        return credentials
+
     @classmethod
     def write(
         cls, client_id: t.Optional[str] = None, client_secret: t.Optional[str] = None
     ) -> t.Dict[str, str]:
+        from rich.prompt import Prompt
+
         console.print("Prompting for Reddit API credentials.")
 
         client_id = client_id or Prompt.ask("Enter your Reddit API Client ID")
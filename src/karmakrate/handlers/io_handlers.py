@@ -1,56 +1,180 @@
+import csv
 import json
 import os
+import shutil
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 
-import pandas as pd
-from praw.models import Submission, Redditor, Comment
-from praw.models.reddit.subreddit import WikiPage, Subreddit
 from rich.status import Status
 
 from ..everything.human_things import HumanThings
+from ..riches import rich_colours
 from ..riches.rich_logging import console
-
-__all__ = ["FileHandler", "DataFrameHandler"]
+from . import schemas
+
+if t.TYPE_CHECKING:
+    import pandas as pd
+    from praw.models import Submission, Redditor, Comment
+    from praw.models.reddit.subreddit import WikiPage, Subreddit
+    from knewkarma.core.comment_tree import CommentTree
+
+__all__ = ["FileHandler", "DataFrameHandler", "StreamHandler"]
+
+
+# Types of cell values every export format can write as they are.
+_SCALAR_TYPES: t.Tuple[type, ...] = (str, int, float, bool, type(None))
+
+
+def _to_scalar(value: t.Any) -> t.Any:
+    """
+    Serializes nested values (lists, dicts, sets, tuples) to JSON, and other objects (e.g., PRAW
+    models) to their string form. Scalars are returned as they are.
+    """
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, (list, dict, tuple)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    if isinstance(value, (set, frozenset)):
+        return json.dumps(sorted(value, key=str), ensure_ascii=False, default=str)
+    return str(value)
+
+
+def _praw_to_dict(obj: t.Any) -> dict:
+    """
+    Converts a PRAW object to a dictionary by inspecting its __dict__.
+    Filters out private/internal attributes.
+    """
+    raw = vars(obj)
+    clean = {k: v for k, v in raw.items() if not k.startswith("_")}
+    return clean
+
+
+def _write_format(
+    file_format: str,
+    dataframe: "pd.DataFrame",
+    filepath: str,
+    compression: str,
+    row_group_size: int,
+):
+    """
+    Writes a DataFrame in one format.
+
+    :param file_format: The format to write (e.g., "csv").
+    :type file_format: str
+    :param dataframe: The DataFrame to write, already scalarized if the format needs it.
+    :type dataframe: pd.DataFrame
+    :param filepath: Path of the file to write.
+    :type filepath: str
+    :param compression: Codec for the columnar formats ("zstd", "snappy" or "none").
+    :type compression: str
+    :param row_group_size: Rows per Parquet row group.
+    :type row_group_size: int
+    """
+    if file_format == "csv":
+        dataframe.to_csv(filepath, encoding="utf-8")
+    elif file_format == "html":
+        dataframe.to_html(filepath, escape=False, encoding="utf-8")
+    elif file_format == "json":
+        dataframe.to_json(filepath, date_format="iso", force_ascii=False, indent=4)
+    elif file_format == "jsonl":
+        dataframe.to_json(
+            filepath,
+            orient="records",
+            lines=True,
+            date_format="iso",
+            force_ascii=False,
+        )
+    elif file_format == "feather":
+        dataframe.reset_index(drop=True).to_feather(
+            filepath,
+            compression={"zstd": "zstd", "snappy": "lz4"}.get(
+                compression, "uncompressed"
+            ),
+        )
+    elif file_format == "parquet":
+        dataframe.to_parquet(
+            filepath,
+            engine="pyarrow",
+            compression=None if compression == "none" else compression,
+            index=False,
+            row_group_size=row_group_size,
+        )
+    elif file_format == "xml":
+        dataframe.to_xml(filepath, parser="etree", encoding="utf-8")
 
 
 class DataFrameHandler:
-    EXPORT_FORMATS = t.Literal["csv", "html", "json", "xml"]
+    EXPORT_FORMATS = t.Literal[
+        "csv", "feather", "html", "json", "jsonl", "parquet", "xml"
+    ]
+    # Formats written through pyarrow, an optional dependency (``pip install knewkarma[arrow]``).
+    ARROW_FORMATS: t.Tuple[str, ...] = ("feather", "parquet")
+    COMPRESSIONS = t.Literal["zstd", "snappy", "none"]
+    # Rows per Parquet row group; exports of one command accumulate in one directory, which
+    # pandas and pyarrow read back as a single dataset.
+    ROW_GROUP_SIZE: int = 64 * 1024
 
     @classmethod
     def build(
         cls,
         data: t.Union[
-            Redditor,
-            Subreddit,
-            Submission,
-            WikiPage,
-            Comment,
-            t.List[t.Union[Redditor, Subreddit, Submission, WikiPage, Comment]],
+            "Redditor",
+            "Subreddit",
+            "Submission",
+            "WikiPage",
+            "Comment",
+            t.List[
+                t.Union["Redditor", "Subreddit", "Submission", "WikiPage", "Comment"]
+            ],
             t.List[t.Tuple[str, t.Any]],
         ],
         status: Status,
-    ) -> pd.DataFrame:
+    ) -> "pd.DataFrame":
+        import pandas as pd
+        from knewkarma.core.comment_tree import CommentTree
 
         if isinstance(status, Status):
             status.update("Loading data into a DataFrame dataframe...")
 
-        def praw_to_dict(obj: t.Any) -> dict:
-            """
-            Converts a PRAW object to a dictionary by inspecting its __dict__.
-            Filters out private/internal attributes.
-            """
-            raw = vars(obj)
-            clean = {k: v for k, v in raw.items() if not k.startswith("_")}
-            return clean
+        schema: t.Optional[t.List[schemas.Field]] = None
+
+        # Handle a compact comment tree, which is already columnar
+        if isinstance(data, CommentTree):
+            transformed_data = data.to_columns()
+            schema = schemas.COMMENT_TREE
+
+        # Handle comment trees of several posts, tagging each row with its post
+        elif (
+            isinstance(data, list)
+            and data
+            and all(isinstance(item, CommentTree) for item in data)
+        ):
+            transformed_data = {}
+            for tree in data:
+                columns = {
+                    "submission_id": [tree.submission_id] * len(tree),
+                    **tree.to_columns(),
+                }
+                for key, values in columns.items():
+                    transformed_data.setdefault(key, []).extend(values)
+            schema = schemas.COMMENT_TREE
+
+        # Handle PRAW objects of a kind with a declared schema, projected to typed columns
+        elif (
+            typed_dataframe := schemas.to_frame(
+                objects=data if isinstance(data, list) else [data]
+            )
+        ) is not None:
+            return typed_dataframe.dropna(axis=1, how="all")
 
         # Handle a single PRAW object
-        if hasattr(data, "__dict__") and not isinstance(data, list):
-            transformed_data = [praw_to_dict(data)]
+        elif hasattr(data, "__dict__") and not isinstance(data, list):
+            transformed_data = [_praw_to_dict(data)]
 
         # Handle list of PRAW objects
         elif isinstance(data, list) and all(hasattr(item, "__dict__") for item in data):
-            transformed_data = [praw_to_dict(item) for item in data]
+            transformed_data = [_praw_to_dict(item) for item in data]
 
         # Handle list of (key, value) tuples
         elif isinstance(data, list) and all(
@@ -64,25 +188,81 @@ class DataFrameHandler:
         # Optional: display all rows when debugging
         pd.set_option("display.max_rows", None)
 
-        # Build DataFrame, drop all-null columns
+        # Build DataFrame, typed if it has a schema, drop all-null columns
         df = pd.DataFrame(transformed_data)
+        if schema is not None:
+            df = schemas.coerce(dataframe=df, schema=schema)
         return df.dropna(axis=1, how="all")
 
+    @staticmethod
+    def scalarize(dataframe: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Makes every cell a scalar, as XML and Arrow need, by serializing the non-scalar ones
+        once (see :func:`_to_scalar`). Only object columns that hold such values are rewritten;
+        typed columns are shared with the original DataFrame.
+
+        :param dataframe: The DataFrame to scalarize.
+        :type dataframe: pd.DataFrame
+        :return: A DataFrame whose every cell is a scalar.
+        :rtype: pd.DataFrame
+        """
+        import pandas as pd
+
+        converted: t.Dict[str, "pd.Series"] = {}
+        for column in dataframe.columns[dataframe.dtypes == object]:
+            values = dataframe[column]
+            non_scalar = ~values.map(type).isin(_SCALAR_TYPES).to_numpy()
+            if non_scalar.any():
+                cells = values.to_numpy(dtype=object, copy=True)
+                cells[non_scalar] = [_to_scalar(value) for value in cells[non_scalar]]
+                converted[column] = pd.Series(cells, index=dataframe.index)
+
+        if not converted:
+            return dataframe
+
+        dataframe = dataframe.copy(deep=False)
+        for column, values in converted.items():
+            dataframe[column] = values
+        return dataframe
+
+    @staticmethod
+    def to_arrow_frame(dataframe: "pd.DataFrame") -> "pd.DataFrame":
+        """
+        Makes every column of a scalarized DataFrame (see :meth:`scalarize`) representable as
+        a typed Arrow column, by storing columns that still mix types as strings.
+
+        :param dataframe: The scalarized DataFrame to convert.
+        :type dataframe: pd.DataFrame
+        :return: A DataFrame pyarrow can write.
+        :rtype: pd.DataFrame
+        """
+        dataframe = dataframe.copy(deep=False)
+        for column in dataframe.columns[dataframe.dtypes == object]:
+            values = dataframe[column]
+            types: t.Set[type] = set(map(type, values.dropna()))
+            if len(types) > 1 and not types <= {int, float}:
+                dataframe[column] = values.map(
+                    lambda value: None if value is None else str(value)
+                )
+
+        return dataframe.infer_objects()
+
     @classmethod
     def export(
         cls,
-        dataframe: pd.DataFrame,
+        dataframe: "pd.DataFrame",
         filename: str,
         directory: str,
         formats: t.List[EXPORT_FORMATS],
         status: Status,
+        compression: COMPRESSIONS = "zstd",
     ):
         """
         Exports a pandas DataFrame to one or more file formats, saving the output files to the specified directory.
 
-        This method includes preprocessing specifically for XML export to ensure that all values in the
-        DataFrame are scalar values (e.g., strings, integers, floats, or None), avoiding issues with
-        non-scalar types such as lists or dictionaries.
+        Formats are written concurrently, one thread each. For XML and the columnar formats, non-scalar values
+        (e.g., lists or dictionaries) are serialized once beforehand (see :meth:`scalarize`);
+        the other formats are written from the DataFrame as it is.
 
         :param dataframe: The pandas DataFrame to export.
         :type dataframe: pd.DataFrame
@@ -90,70 +270,267 @@ class DataFrameHandler:
         :type filename: str
         :param directory: The root directory under which subdirectories for each format (e.g., "csv", "xml") will be used.
         :type directory: str
-        :param formats: A list of output formats to export the data to. Must be one or more of ["csv", "html", "json", "xml"].
-        :type formats: List[Literal["csv", "html", "json", "xml"]]
+        :param formats: A list of output formats to export the data to. Must be one or more of ["csv", "feather", "html", "json", "jsonl", "parquet", "xml"].
+        :type formats: List[Literal["csv", "feather", "html", "json", "jsonl", "parquet", "xml"]]
+        :param compression: Codec for the columnar formats. Feather has no snappy codec, so it
+            uses lz4 instead.
+        :type compression: Literal["zstd", "snappy", "none"]
         """
 
         if isinstance(status, Status):
             status.update(f"Exporting data to {formats}...")
 
-        def sanitize_for_xml(df: pd.DataFrame) -> pd.DataFrame:
-            """
-            Converts all non-scalar values in the DataFrame to strings.
-
-            This avoids pandas XML export errors by ensuring that each DataFrame cell contains a scalar value.
-
-            :param df: The DataFrame to sanitize.
-            :type df: pd.DataFrame
-            :return: A sanitized DataFrame with all non-scalar values converted to strings.
-            :rtype: pd.DataFrame
-            """
-
-            def scalarize(value: t.Any) -> t.Any:
-                if isinstance(value, (list, dict, set)):
-                    return json.dumps(value)
-                return value
-
-            return df.apply(lambda col: col.map(scalarize))
-
-        # Preprocess DataFrame for XML if needed
-        if "xml" in formats:
-            dataframe = sanitize_for_xml(dataframe)
+        arrow_formats: t.List[str] = [
+            file_format for file_format in formats if file_format in cls.ARROW_FORMATS
+        ]
+        if arrow_formats:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                console.print(
+                    f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} "
+                    f"Exporting to {', '.join(arrow_formats)} needs pyarrow "
+                    "(pip install knewkarma\\[arrow]), skipping."
+                )
+                formats = [
+                    file_format
+                    for file_format in formats
+                    if file_format not in cls.ARROW_FORMATS
+                ]
+                arrow_formats = []
+
+        # XML and Arrow need scalar cells; serialize the nested ones once, for all of them.
+        scalar_dataframe: "pd.DataFrame" = (
+            cls.scalarize(dataframe=dataframe)
+            if "xml" in formats or arrow_formats
+            else dataframe
+        )
+        arrow_dataframe: "pd.DataFrame" = (
+            cls.to_arrow_frame(dataframe=scalar_dataframe)
+            if arrow_formats
+            else scalar_dataframe
+        )
 
-        file_mapping: t.Dict[str, t.Callable[[], None]] = {
-            "csv": lambda: dataframe.to_csv(
-                os.path.join(directory, "csv", f"{filename}.csv"), encoding="utf-8"
-            ),
-            "html": lambda: dataframe.to_html(
-                os.path.join(directory, "html", f"{filename}.html"),
-                escape=False,
-                encoding="utf-8",
-            ),
-            "json": lambda: dataframe.to_json(
-                os.path.join(directory, "json", f"{filename}.json"),
-                force_ascii=False,
-                indent=4,
-            ),
-            "xml": lambda: dataframe.to_xml(
-                os.path.join(directory, "xml", f"{filename}.xml"),
-                parser="etree",
-                encoding="utf-8",
-            ),
+        frames: t.Dict[str, "pd.DataFrame"] = {
+            file_format: (
+                arrow_dataframe
+                if file_format in cls.ARROW_FORMATS
+                else scalar_dataframe if file_format == "xml" else dataframe
+            )
+            for file_format in formats
+            if file_format in t.get_args(cls.EXPORT_FORMATS)
         }
-
-        for file_format in formats:
-            if file_format in file_mapping:
-                filepath: str = os.path.join(
-                    directory, file_format, f"{filename}.{file_format}"
+        if not frames:
+            return
+
+        def log_export(file_format: str):
+            filepath: str = os.path.join(
+                directory, file_format, f"{filename}.{file_format}"
+            )
+            console.log(
+                f"{HumanThings.human_filesize(inhuman_filesize=os.path.getsize(filepath))} written to [link file://{filepath}]{filepath}"
+            )
+
+        if len(frames) == 1:
+            for file_format, frame in frames.items():
+                _write_format(
+                    file_format=file_format,
+                    dataframe=frame,
+                    filepath=os.path.join(
+                        directory, file_format, f"{filename}.{file_format}"
+                    ),
+                    compression=compression,
+                    row_group_size=cls.ROW_GROUP_SIZE,
                 )
+                log_export(file_format=file_format)
+            return
+
+        # Threads share the frames, where worker processes would each be sent a pickled copy
+        # (and be forked from a process that has threads running); the Arrow writers release
+        # the GIL while they encode.
+        with ThreadPoolExecutor(max_workers=len(frames)) as executor:
+            futures: t.Dict[Future, str] = {
+                executor.submit(
+                    _write_format,
+                    file_format=file_format,
+                    dataframe=frame,
+                    filepath=os.path.join(
+                        directory, file_format, f"{filename}.{file_format}"
+                    ),
+                    compression=compression,
+                    row_group_size=cls.ROW_GROUP_SIZE,
+                ): file_format
+                for file_format, frame in frames.items()
+            }
+            for future in as_completed(futures):
+                future.result()
+                log_export(file_format=futures[future])
+
+
+class StreamHandler:
+    """
+    Exports items to CSV and JSON Lines as they are produced (e.g., by a listing generator),
+    a batch at a time, so memory stays flat regardless of how many items there are.
+
+    The columns are those of the first batch, in order of appearance; columns that first
+    appear later are appended. As the CSV header can only be known once every row is in,
+    CSV rows are written to a ``.part`` file, which gets its header when the export is closed.
+    """
+
+    FORMATS: t.Tuple[str, ...] = ("csv", "jsonl")
+    BATCH_SIZE: int = 500
+
+    def __init__(self, filename: str, directory: str, formats: t.List[str]):
+        """
+        :param filename: The base name of the files (without extension).
+        :type filename: str
+        :param directory: The root directory under which subdirectories for each format are used.
+        :type directory: str
+        :param formats: The formats to export to, any of :attr:`FORMATS`.
+        :type formats: List[str]
+        """
+        self.paths: t.Dict[str, str] = {
+            file_format: os.path.join(
+                directory, file_format, f"{filename}.{file_format}"
+            )
+            for file_format in formats
+            if file_format in self.FORMATS
+        }
+        self.columns: t.List[str] = []
+        self.row_count: int = 0
+        self._batch: t.List[t.Dict[str, t.Any]] = []
+        self._files: t.Dict[str, t.TextIO] = {}
+        self._csv_writer: t.Optional[t.Any] = None
 
-                # Execute the export function for the current format
-                file_mapping[file_format]()
+    @classmethod
+    def tee(
+        cls,
+        items: t.Iterable,
+        filename: str,
+        directory: str,
+        formats: t.List[str],
+        status: Status,
+    ) -> t.Iterator:
+        """
+        Yields items unchanged, exporting each one along the way.
 
-                # Log export status
-                console.log(
-                    f"{HumanThings.human_filesize(inhuman_filesize=os.path.getsize(filepath))} written to [link file://{filepath}]{filepath}"
+        :param items: The items to pass through and export.
+        :type items: Iterable
+        :param filename: The base name of the files (without extension).
+        :type filename: str
+        :param directory: The root directory under which subdirectories for each format are used.
+        :type directory: str
+        :param formats: The formats to export to, any of :attr:`FORMATS`.
+        :type formats: List[str]
+        :return: A generator of the original items.
+        :rtype: Iterator
+        """
+        exporter = cls(filename=filename, directory=directory, formats=formats)
+        try:
+            for item in items:
+                exporter.write(item=item)
+                yield item
+        finally:
+            exporter.close(status=status)
+
+    @staticmethod
+    def rows(item: t.Any) -> t.Iterator[t.Dict[str, t.Any]]:
+        """
+        :param item: A PRAW object, or a comment tree.
+        :return: The rows the item is exported as.
+        :rtype: Iterator[Dict[str, Any]]
+        """
+        from knewkarma.core.comment_tree import CommentTree
+
+        schema: t.Optional[t.List[schemas.Field]] = schemas.schema_for(item)
+        if isinstance(item, CommentTree):
+            columns: t.Dict[str, t.Sequence] = item.to_columns()
+            for index in range(len(item)):
+                yield schemas.timestamps_to_datetimes(
+                    row={
+                        "submission_id": item.submission_id,
+                        **{key: values[index] for key, values in columns.items()},
+                    },
+                    schema=schemas.COMMENT_TREE,
+                )
+        elif schema is not None:
+            yield schemas.project(obj=item, schema=schema)
+        else:
+            yield _praw_to_dict(item)
+
+    def write(self, item: t.Any):
+        """
+        :param item: A PRAW object, or a comment tree, to export.
+        """
+        self._batch.extend(self.rows(item=item))
+        if len(self._batch) >= self.BATCH_SIZE:
+            self._flush()
+
+    def close(self, status: Status):
+        """Writes what's left of the last batch, and completes the CSV file with its header."""
+        self._flush()
+        for file in self._files.values():
+            file.close()
+
+        if "csv" in self._files:
+            if isinstance(status, Status):
+                status.update("Writing the CSV header...")
+
+            part_path: str = f"{self.paths['csv']}.part"
+            with open(self.paths["csv"], "w", newline="", encoding="utf-8") as file:
+                csv.writer(file).writerow(self.columns)
+                with open(part_path, newline="", encoding="utf-8") as part:
+                    shutil.copyfileobj(part, file)
+            os.remove(part_path)
+
+        for file_format in self._files:
+            filepath: str = self.paths[file_format]
+            console.log(
+                f"{HumanThings.human_filesize(inhuman_filesize=os.path.getsize(filepath))} "
+                f"({self.row_count} rows) written to [link file://{filepath}]{filepath}"
+            )
+
+    def _flush(self):
+        if not self._batch:
+            return
+
+        if not self._files:
+            self._open()
+
+        for row in self._batch:
+            for key in row:
+                if key not in self.columns:
+                    self.columns.append(key)
+
+        if self._csv_writer is not None:
+            self._csv_writer.writerows(
+                [_to_scalar(row.get(column)) for column in self.columns]
+                for row in self._batch
+            )
+        if "jsonl" in self._files:
+            self._files["jsonl"].writelines(
+                json.dumps(
+                    {column: row.get(column) for column in self.columns},
+                    ensure_ascii=False,
+                    default=str,
+                )
+                + "\n"
+                for row in self._batch
+            )
+
+        self.row_count += len(self._batch)
+        self._batch = []
+
+    def _open(self):
+        for file_format, filepath in self.paths.items():
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            if file_format == "csv":
+                self._files["csv"] = open(
+                    f"{filepath}.part", "w", newline="", encoding="utf-8"
                 )
+                self._csv_writer = csv.writer(self._files["csv"])
+            else:
+                self._files[file_format] = open(filepath, "w", encoding="utf-8")
 
 
 class FileHandler:
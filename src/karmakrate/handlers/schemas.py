@@ -0,0 +1,242 @@
+import typing as t
+from datetime import datetime, timezone
+
+if t.TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = [
+    "Field",
+    "SCHEMAS",
+    "COMMENT_TREE",
+    "schema_for",
+    "project",
+    "timestamps_to_datetimes",
+    "to_frame",
+    "coerce",
+]
+
+# Types of attribute values exported as-is; anything else is exported as its string form.
+_SCALARS: t.Set[type] = {str, int, float, bool, type(None)}
+
+DTYPES = t.Literal["bool", "category", "datetime", "float", "int", "string"]
+
+
+class Field(t.NamedTuple):
+    """A column of an exported object kind."""
+
+    name: str
+    dtype: DTYPES
+
+
+# Columns exported per PRAW model, keyed by class name. Nested objects (e.g., ``author``,
+# ``subreddit``) are flattened to their name.
+SCHEMAS: t.Dict[str, t.List[Field]] = {
+    "Submission": [
+        Field("id", "string"),
+        Field("name", "string"),
+        Field("title", "string"),
+        Field("author", "category"),
+        Field("subreddit", "category"),
+        Field("source_subreddit", "category"),
+        Field("link_flair_text", "category"),
+        Field("domain", "category"),
+        Field("score", "int"),
+        Field("upvote_ratio", "float"),
+        Field("num_comments", "int"),
+        Field("created_utc", "datetime"),
+        Field("over_18", "bool"),
+        Field("spoiler", "bool"),
+        Field("stickied", "bool"),
+        Field("locked", "bool"),
+        Field("is_self", "bool"),
+        Field("selftext", "string"),
+        Field("url", "string"),
+        Field("permalink", "string"),
+    ],
+    "Comment": [
+        Field("id", "string"),
+        Field("name", "string"),
+        Field("link_id", "string"),
+        Field("parent_id", "string"),
+        Field("author", "category"),
+        Field("subreddit", "category"),
+        Field("source_subreddit", "category"),
+        Field("author_flair_text", "category"),
+        Field("score", "int"),
+        Field("controversiality", "int"),
+        Field("created_utc", "datetime"),
+        Field("is_submitter", "bool"),
+        Field("stickied", "bool"),
+        Field("body", "string"),
+        Field("permalink", "string"),
+    ],
+    "Redditor": [
+        Field("id", "string"),
+        Field("name", "string"),
+        Field("link_karma", "int"),
+        Field("comment_karma", "int"),
+        Field("total_karma", "int"),
+        Field("created_utc", "datetime"),
+        Field("is_mod", "bool"),
+        Field("is_gold", "bool"),
+        Field("is_employee", "bool"),
+        Field("verified", "bool"),
+        Field("has_verified_email", "bool"),
+        Field("icon_img", "string"),
+    ],
+    "Subreddit": [
+        Field("id", "string"),
+        Field("name", "string"),
+        Field("display_name", "string"),
+        Field("title", "string"),
+        Field("subreddit_type", "category"),
+        Field("lang", "category"),
+        Field("subscribers", "int"),
+        Field("accounts_active", "int"),
+        Field("created_utc", "datetime"),
+        Field("over18", "bool"),
+        Field("public_description", "string"),
+        Field("url", "string"),
+    ],
+    "WikiPage": [
+        Field("subreddit", "category"),
+        Field("source_subreddit", "category"),
+        Field("name", "string"),
+        Field("revision_by", "category"),
+        Field("revision_date", "datetime"),
+        Field("content_md", "string"),
+    ],
+}
+
+# Columns of a comment tree (see ``CommentTree.to_columns``), with the post each comment
+# belongs to when several trees are exported together.
+COMMENT_TREE: t.List[Field] = [
+    Field("submission_id", "category"),
+    Field("id", "string"),
+    Field("parent_id", "string"),
+    Field("depth", "int"),
+    Field("author", "category"),
+    Field("body", "string"),
+    Field("score", "int"),
+    Field("created_utc", "datetime"),
+    Field("reply_count", "int"),
+    Field("award_count", "int"),
+    Field("permalink", "string"),
+]
+
+
+def schema_for(obj: t.Any) -> t.Optional[t.List[Field]]:
+    """
+    :param obj: An object to export (e.g., a ``Submission``).
+    :type obj: t.Any
+    :return: The object's schema, or None if its kind has none.
+    :rtype: t.Optional[t.List[Field]]
+    """
+    return SCHEMAS.get(type(obj).__name__)
+
+
+def project(obj: t.Any, schema: t.List[Field]) -> t.Dict[str, t.Any]:
+    """
+    Reads an object's schema fields into a row, without fetching anything: values are taken
+    from what the object was built with, so lazy PRAW objects stay lazy.
+
+    :param obj: The object to project.
+    :type obj: t.Any
+    :param schema: The object's schema.
+    :type schema: t.List[Field]
+    :return: The object's row, with nested objects flattened and timestamps as UTC datetimes.
+    :rtype: t.Dict[str, t.Any]
+    """
+    names: t.List[str] = [field.name for field in schema]
+    return timestamps_to_datetimes(
+        row=dict(zip(names, _values(obj, names))), schema=schema
+    )
+
+
+def timestamps_to_datetimes(
+    row: t.Dict[str, t.Any], schema: t.List[Field]
+) -> t.Dict[str, t.Any]:
+    """
+    :param row: A row of the schema's columns (some may be missing).
+    :type row: t.Dict[str, t.Any]
+    :param schema: The row's schema.
+    :type schema: t.List[Field]
+    :return: The row, with the timestamps of its datetime fields as UTC datetimes.
+    :rtype: t.Dict[str, t.Any]
+    """
+    for field in schema:
+        if field.dtype == "datetime" and isinstance(row.get(field.name), (int, float)):
+            row[field.name] = datetime.fromtimestamp(row[field.name], tz=timezone.utc)
+
+    return row
+
+
+def _values(obj: t.Any, names: t.List[str]) -> t.List[t.Any]:
+    """Reads an object's attributes, flattening nested objects (e.g., a Redditor) to their name."""
+    return [
+        value if type(value) in _SCALARS else str(value)
+        for value in map(vars(obj).get, names)
+    ]
+
+
+def to_frame(objects: t.Sequence[t.Any]) -> t.Optional["pd.DataFrame"]:
+    """
+    Builds a typed DataFrame of objects of one kind, with one column per schema field.
+
+    :param objects: Objects of one kind.
+    :type objects: t.Sequence[t.Any]
+    :return: The DataFrame, or None if the objects have no schema or mix kinds.
+    :rtype: t.Optional[pd.DataFrame]
+    """
+    import pandas as pd
+
+    if not objects:
+        return None
+
+    schema: t.Optional[t.List[Field]] = schema_for(objects[0])
+    if schema is None or any(type(obj) is not type(objects[0]) for obj in objects):
+        return None
+
+    names: t.List[str] = [field.name for field in schema]
+    return coerce(
+        dataframe=pd.DataFrame([_values(obj, names) for obj in objects], columns=names),
+        schema=schema,
+    )
+
+
+def coerce(dataframe: "pd.DataFrame", schema: t.List[Field]) -> "pd.DataFrame":
+    """
+    Converts a DataFrame's columns to their schema's dtypes, in place.
+
+    :param dataframe: The DataFrame to convert. Columns the schema lacks are left as they are.
+    :type dataframe: pd.DataFrame
+    :param schema: The schema of the DataFrame's columns.
+    :type schema: t.List[Field]
+    :return: The DataFrame.
+    :rtype: pd.DataFrame
+    """
+    import pandas as pd
+
+    for field in schema:
+        if field.name not in dataframe:
+            continue
+
+        column = dataframe[field.name]
+        if field.dtype == "datetime":
+            dataframe[field.name] = pd.to_datetime(
+                pd.to_numeric(column, errors="coerce"), unit="s", utc=True
+            )
+        elif field.dtype == "int":
+            dataframe[field.name] = pd.to_numeric(column, errors="coerce").astype(
+                "Int64"
+            )
+        elif field.dtype == "float":
+            dataframe[field.name] = pd.to_numeric(column, errors="coerce").astype(
+                "Float64"
+            )
+        elif field.dtype == "bool":
+            dataframe[field.name] = column.astype("boolean")
+        else:
+            dataframe[field.name] = column.astype(field.dtype)
+
+    return dataframe
@@ -0,0 +1,245 @@
+import os
+import sqlite3
+import time
+import typing as t
+
+from rich.status import Status
+
+from ..riches import rich_colours
+from ..riches.rich_logging import console
+from . import schemas
+
+__all__ = ["SQLiteHandler"]
+
+
+class SQLiteHandler:
+    """
+    A SQLite sink for fetched Reddit objects, with one table per kind (see
+    :data:`~karmakrate.handlers.schemas.SCHEMAS`) keyed by fullname.
+
+    Objects are upserted in batches, so re-running a crawl updates rows in place instead of
+    adding copies. Values an object lacks (e.g., in a partial profile) leave those already
+    stored as they are. Usable as a context manager::
+
+        with SQLiteHandler(path="reddit.sqlite3") as sink:
+            sink.write(items=posts)
+    """
+
+    # Table each kind is stored in.
+    TABLES: t.Dict[str, str] = {
+        "Submission": "submissions",
+        "Comment": "comments",
+        "Redditor": "redditors",
+        "Subreddit": "subreddits",
+        "WikiPage": "wiki_pages",
+    }
+    # Columns indexed wherever a table has them.
+    INDEXED: t.Tuple[str, ...] = ("subreddit", "author", "created_utc")
+    SQL_TYPES: t.Dict[str, str] = {
+        "bool": "INTEGER",
+        "category": "TEXT",
+        "datetime": "REAL",
+        "float": "REAL",
+        "int": "INTEGER",
+        "string": "TEXT",
+    }
+    # Rows upserted per transaction.
+    BATCH_SIZE: int = 5000
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the database (created if missing).
+        :type path: str
+        """
+        self.path = path
+        self.row_count: int = 0
+        self._batches: t.Dict[str, t.List[t.Tuple]] = {}
+        self._statements: t.Dict[str, str] = {}
+        self._skipped: t.Set[str] = set()
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+
+    def __enter__(self) -> "SQLiteHandler":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @classmethod
+    def tee(cls, items: t.Iterable, path: str, status: Status) -> t.Iterator:
+        """
+        Yields items unchanged, upserting each one along the way.
+
+        :param items: The items to pass through and store.
+        :type items: Iterable
+        :param path: Path to the database.
+        :type path: str
+        :param status: Optional status object for updating progress.
+        :type status: Status
+        :return: A generator of the original items.
+        :rtype: Iterator
+        """
+        sink = cls(path=path)
+        try:
+            for item in items:
+                sink.write(items=[item])
+                yield item
+        finally:
+            sink.close(status=status)
+
+    @classmethod
+    def export(cls, data: t.Any, path: str, status: Status):
+        """
+        Upserts a result (a single object, or a list of them).
+
+        :param data: The result to store.
+        :param path: Path to the database.
+        :type path: str
+        :param status: Optional status object for updating progress.
+        :type status: Status
+        """
+        if isinstance(status, Status):
+            status.update(f"Upserting data into {path}...")
+
+        with cls(path=path) as sink:
+            sink.write(items=data if isinstance(data, list) else [data])
+
+    def write(self, items: t.Iterable[t.Any]):
+        """
+        :param items: PRAW objects and/or comment trees to store.
+        :type items: t.Iterable[t.Any]
+        """
+        fetched_at: float = time.time()
+        for item in items:
+            for kind, row in self._rows(item=item):
+                fullname: t.Optional[str] = self._fullname(kind=kind, row=row)
+                if fullname is None:
+                    continue
+
+                batch: t.List[t.Tuple] = self._batches.setdefault(kind, [])
+                batch.append(
+                    (
+                        fullname,
+                        *(row.get(field.name) for field in schemas.SCHEMAS[kind]),
+                        fetched_at,
+                    )
+                )
+                if len(batch) >= self.BATCH_SIZE:
+                    self._flush(kind=kind)
+
+    def close(self, status: t.Optional[Status] = None):
+        """
+        Upserts what's left of every batch, and closes the database.
+
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        """
+        if isinstance(status, Status) and self._batches:
+            status.update(f"Upserting the last rows into {self.path}...")
+
+        for kind in list(self._batches):
+            self._flush(kind=kind)
+        self._connection.close()
+
+        if self.row_count:
+            console.log(
+                f"{self.row_count} rows upserted into [link file://{self.path}]{self.path}"
+            )
+
+    def _rows(self, item: t.Any) -> t.Iterator[t.Tuple[str, t.Dict[str, t.Any]]]:
+        from knewkarma.core.comment_tree import CommentTree
+
+        if isinstance(item, CommentTree):
+            subreddit: str = item.subreddit.removeprefix("r/")
+            columns: t.Dict[str, t.Sequence] = item.to_columns()
+            for values in zip(*columns.values()):
+                row: t.Dict[str, t.Any] = dict(zip(columns.keys(), values))
+                yield "Comment", {
+                    **row,
+                    "name": f"t1_{row['id']}",
+                    "link_id": f"t3_{item.submission_id}",
+                    "subreddit": subreddit,
+                }
+            return
+
+        kind: str = type(item).__name__
+        if kind not in self.TABLES:
+            if kind not in self._skipped:
+                self._skipped.add(kind)
+                console.print(
+                    f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} "
+                    f"{kind} objects can't be stored in SQLite, skipping."
+                )
+            return
+
+        row = schemas.project(obj=item, schema=schemas.SCHEMAS[kind])
+        for field in schemas.SCHEMAS[kind]:
+            if field.dtype == "datetime" and row[field.name] is not None:
+                row[field.name] = row[field.name].timestamp()
+        yield kind, row
+
+    @staticmethod
+    def _fullname(kind: str, row: t.Dict[str, t.Any]) -> t.Optional[str]:
+        if kind == "Redditor":
+            return f"t2_{row['id']}" if row.get("id") else None
+        if kind == "WikiPage":
+            return f"{row['subreddit']}/{row['name']}" if row.get("name") else None
+        return row.get("name")
+
+    def _flush(self, kind: str):
+        batch: t.List[t.Tuple] = self._batches.pop(kind, [])
+        if not batch:
+            return
+
+        statement: str = self._statements.get(kind) or self._prepare(kind=kind)
+        self._connection.execute("BEGIN")
+        try:
+            self._connection.executemany(statement, batch)
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+        self.row_count += len(batch)
+
+    def _prepare(self, kind: str) -> str:
+        """Creates (or extends) the kind's table and indexes, and returns its upsert statement."""
+        table: str = self.TABLES[kind]
+        fields: t.List[schemas.Field] = schemas.SCHEMAS[kind]
+
+        self._connection.execute(
+            f"CREATE TABLE IF NOT EXISTS {table} (fullname TEXT PRIMARY KEY)"
+        )
+        existing: t.Set[str] = {
+            column[1]
+            for column in self._connection.execute(f"PRAGMA table_info({table})")
+        }
+        for name, sql_type in [
+            *((field.name, self.SQL_TYPES[field.dtype]) for field in fields),
+            ("fetched_at", "REAL"),
+        ]:
+            if name not in existing:
+                self._connection.execute(
+                    f"ALTER TABLE {table} ADD COLUMN {name} {sql_type}"
+                )
+        for field in fields:
+            if field.name in self.INDEXED:
+                self._connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table}_{field.name} "
+                    f"ON {table} ({field.name})"
+                )
+
+        columns: t.List[str] = [field.name for field in fields]
+        self._statements[kind] = (
+            f"INSERT INTO {table} (fullname, {', '.join(columns)}, fetched_at) "
+            f"VALUES ({', '.join('?' * (len(columns) + 2))}) "
+            f"ON CONFLICT (fullname) DO UPDATE SET "
+            + ", ".join(
+                f"{column} = COALESCE(excluded.{column}, {table}.{column})"
+                for column in columns
+            )
+            + ", fetched_at = excluded.fetched_at"
+        )
+        return self._statements[kind]
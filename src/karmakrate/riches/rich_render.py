@@ -1,6 +1,7 @@
+import itertools
 import typing as t
 
-from praw.models import Submission, Redditor, Comment, WikiPage
+from praw.models import Submission, Redditor, Comment, WikiPage, MoreComments
 from praw.models.reddit.subreddit import Subreddit
 from rich.console import RenderableType, Group
 from rich.markdown import Markdown
@@ -10,6 +11,7 @@ from rich.rule import Rule
 from rich.table import Table
 from rich.text import Text
 
+from knewkarma.core.comment_tree import CommentTree
 from . import rich_colours
 from .rich_logging import console
 from ..everything.human_things import HumanThings
@@ -27,6 +29,9 @@ class Render:
         cls,
         data: t.Union[
             t.List[t.Union[Redditor, Submission, Subreddit, Comment, WikiPage]],
+            t.Iterator[t.Union[Redditor, Submission, Subreddit, Comment, WikiPage]],
+            t.Iterator[CommentTree],
+            CommentTree,
             Redditor,
             Submission,
             Subreddit,
@@ -36,22 +41,40 @@ class Render:
     ):
         """
         Dynamically dispatch the appropriate rendering method based on data type.
+
+        Iterators (e.g., paginated listings) are rendered item by item as they are consumed.
         """
 
-        if isinstance(data, list) and data:
-            item = data[0]
+        if isinstance(data, t.Iterator):
+            item = next(data, None)
+            if item is None:
+                console.print("[dim]No data to display.[/]")
+                return None
+            list_data = itertools.chain([item], data)
+        elif isinstance(data, list) and data:
+            item, list_data = data[0], data
+        else:
+            list_data = None
+
+        if list_data is not None:
             if isinstance(item, Submission):
-                return cls._posts(data)
+                return cls._posts(list_data)
             elif isinstance(item, Comment):
-                return cls._comments(data)
+                return cls._comments(list_data)
             elif isinstance(item, Redditor):
-                return cls._users(data)
+                return cls._users(list_data)
             elif isinstance(item, Subreddit):
-                return cls._subreddits(data)
+                return cls._subreddits(list_data)
             elif isinstance(item, WikiPage):
-                return cls._wiki_pages(data)
+                return cls._wiki_pages(list_data)
+            elif isinstance(item, CommentTree):
+                for tree in list_data:
+                    cls._comment_tree(tree)
+                return None
 
         # Handle single item input
+        elif isinstance(data, CommentTree):
+            return cls._comment_tree(data)
         elif isinstance(data, Submission):
             return cls._post(data)
         elif isinstance(data, Comment):
@@ -124,19 +147,22 @@ class Render:
 
     @classmethod
     def _user(cls, data: Redditor, print_panel: bool = True):
-        subreddit = getattr(data, "subreddit")
-        is_suspended = hasattr(data, "is_suspended")
+        # Partial profiles (e.g., looked up by account id) have no subreddit or 'created'.
+        subreddit = vars(data).get("subreddit")
+        is_suspended = vars(data).get("is_suspended", False)
 
         if is_suspended:
             return None
 
+        created: float = vars(data).get("created", vars(data).get("created_utc", 0.0))
         header_content = (
             f"{rich_colours.BOLD}{rich_colours.POWDER_BLUE}{data.name}{rich_colours.RESET}{rich_colours.RESET} "
-            f"· {HumanThings.human_datetime(inhuman_datetime=0 if is_suspended else data.created)}\n"
-            f"{rich_colours.GREY}{subreddit.display_name_prefixed}{rich_colours.RESET}"
+            f"· {HumanThings.human_datetime(inhuman_datetime=0 if is_suspended else created)}"
         )
+        if subreddit is not None:
+            header_content = f"{header_content}\n{rich_colours.GREY}{subreddit.display_name_prefixed}{rich_colours.RESET}"
 
-        if subreddit.over_18:
+        if subreddit is not None and subreddit.over_18:
             header_content = f"{rich_colours.BOLD_RED}NSFW{rich_colours.BOLD_RED_RESET} · {header_content}"
 
         footer_data = {
@@ -156,13 +182,15 @@ class Render:
         footer_content = cls._footer_table(footer_data=footer_data)
 
         panel_parts = []
-        if subreddit.public_description:
+        if subreddit is not None and subreddit.public_description:
             panel_parts.append(subreddit.public_description)
 
         text = "\n\n".join(panel_parts)
 
         return cls._panel(
-            title=cls._set_item_url(url=f"{BASE_URL}{subreddit.url}"),
+            title=cls._set_item_url(
+                url=f"{BASE_URL}{subreddit.url if subreddit is not None else f'/user/{data.name}/'}"
+            ),
             header=header_content,
             content=text,
             footer=footer_content,
@@ -171,42 +199,59 @@ class Render:
         )
 
     @classmethod
-    def _users(cls, data: t.List[Redditor], print_panel: bool = True):
-        panels = []
+    def _users(cls, data: t.Iterable[Redditor]):
+        has_panels: bool = False
 
         for user_data in data:
-            panel = cls._user(user_data, print_panel=print_panel)
+            panel = cls._user(user_data, print_panel=True)
             if panel is not None:
-                panels.append(panel)
+                has_panels = True
 
-        if panels:
-            panel_group = Group(*panels)
-            console.print(panel_group)
-        else:
+        if not has_panels:
             console.print("[dim]No valid users to display.[/]")
 
     @classmethod
     def _comment(cls, data: Comment, print_panel: bool = True):
-        panel_parts: t.List[str] = []
         # Skip fully deleted or removed comments
         if data.author is None:
             return None
 
         author = data.author
-        post_title = getattr(data, "link_title", None)
-        body: str = getattr(data, "body")
-
         subreddit: str = getattr(data, "subreddit_name_prefixed", "")
-        subreddit = (
-            f"self" if subreddit.lower() == f"u/{author.name.lower()}" else subreddit
-        )
-        permalink: str = getattr(data, "permalink", "")
         created: int = 0 if getattr(data, "created", None) is None else data.created
-        score = HumanThings.human_number(inhuman_number=data.score)
-        data.replies.replace_more(limit=None)  # Expand all 'MoreComments'
-        all_replies = data.replies.list()  # Flatten and get all replies as a list
         awards: list = getattr(data, "all_awardings", [])
 
+        return cls._comment_panel(
+            author=author.name,
+            body=getattr(data, "body"),
+            post_title=getattr(data, "link_title", None),
+            subreddit=subreddit,
+            permalink=getattr(data, "permalink", ""),
+            created=created,
+            score=data.score,
+            reply_count=cls._reply_count(data=data),
+            award_count=len(awards),
+            print_panel=print_panel,
+        )
+
+    @classmethod
+    def _comment_panel(
+        cls,
+        author: str,
+        body: str,
+        post_title: t.Optional[str],
+        subreddit: str,
+        permalink: str,
+        created: float,
+        score: int,
+        reply_count: int,
+        award_count: int,
+        print_panel: bool = True,
+    ) -> Panel:
+        panel_parts: t.List[str] = []
+        subreddit = f"self" if subreddit.lower() == f"u/{author.lower()}" else subreddit
+        score = HumanThings.human_number(inhuman_number=score)
+
         if post_title:
             panel_parts.append(f"> {post_title}")
         if body:
@@ -216,15 +261,13 @@ class Render:
         header_content: str = (
             f"{rich_colours.BOLD}{rich_colours.POWDER_BLUE}{subreddit}{rich_colours.RESET}{rich_colours.RESET} · "
             f"{HumanThings.human_datetime(inhuman_datetime=created)}\n"
-            f"{rich_colours.GREY}{escape(author.name)}{rich_colours.RESET}"
+            f"{rich_colours.GREY}{escape(author)}{rich_colours.RESET}"
         )
 
         footer_content: str = (
-            f"{rich_colours.ORANGE_RED}🡅{rich_colours.RESET} {"[dim]" 
-            if score == 0 
-            else rich_colours.POWDER_BLUE}{score}{rich_colours.RESET} {rich_colours.SOFT_BLUE}🡇{rich_colours.RESET} "
-            f"💬{rich_colours.POWDER_BLUE}{HumanThings.human_number(inhuman_number=len(all_replies))}{rich_colours.RESET} "
-            f"{rich_colours.BOLD_YELLOW}🏆{HumanThings.human_number(inhuman_number=len(awards))}{rich_colours.BOLD_YELLOW_RESET}"
+            f"{rich_colours.ORANGE_RED}🡅{rich_colours.RESET} {'[dim]' if score == 0 else rich_colours.POWDER_BLUE}{score}{rich_colours.RESET} {rich_colours.SOFT_BLUE}🡇{rich_colours.RESET} "
+            f"💬{rich_colours.POWDER_BLUE}{HumanThings.human_number(inhuman_number=reply_count)}{rich_colours.RESET} "
+            f"{rich_colours.BOLD_YELLOW}🏆{HumanThings.human_number(inhuman_number=award_count)}{rich_colours.BOLD_YELLOW_RESET}"
         )
 
         return cls._panel(
@@ -236,18 +279,60 @@ class Render:
             print_panel=print_panel,
         )
 
-    @classmethod
-    def _comments(cls, data: t.List[Comment]):
-        panels: t.List[Panel] = []
+    @staticmethod
+    def _reply_count(data: Comment) -> int:
+        """
+        Counts all replies under a comment without making any network requests.
 
-        for item in data:
-            panel = cls._comment(data=item, print_panel=False)
+        A count computed by the fetch stage (``_reply_count``) is used if present. Otherwise, the
+        replies already loaded into the comment's tree are counted, and every unexpanded
+        'MoreComments' stub adds the number of comments it stands for.
 
-            if panel is not None:
-                panels.append(panel)
+        :param data: The comment whose replies to count.
+        :type data: Comment
+        :return: The total number of replies, at any depth.
+        :rtype: int
+        """
+        reply_count: t.Optional[int] = vars(data).get("_reply_count")
+        if reply_count is not None:
+            return reply_count
+
+        reply_count = 0
+        pending: t.List = list(vars(data).get("_replies", []))
+        while pending:
+            reply = pending.pop()
+            if isinstance(reply, MoreComments):
+                reply_count += reply.count or 0
+            else:
+                reply_count += 1
+                pending.extend(vars(reply).get("_replies", []))
+
+        return reply_count
+
+    @classmethod
+    def _comments(cls, data: t.Iterable[Comment]):
+        for item in data:
+            cls._comment(data=item, print_panel=True)
 
-        panel_group = Group(*panels)
-        console.print(panel_group)
+    @classmethod
+    def _comment_tree(cls, data: CommentTree):
+        for index in range(len(data)):
+            # Skip fully deleted or removed comments
+            if data.authors[index] is None:
+                continue
+
+            cls._comment_panel(
+                author=data.authors[index],
+                body=data.bodies[index],
+                post_title=None,
+                subreddit=data.subreddit,
+                permalink=data.permalink(index=index),
+                created=data.created_utc[index],
+                score=data.scores[index],
+                reply_count=data.reply_counts[index],
+                award_count=data.award_counts[index],
+                print_panel=True,
+            )
 
     @classmethod
     def _post(cls, data: Submission, print_panel: bool = True) -> t.Union[Panel, None]:
@@ -272,16 +357,12 @@ class Render:
         score = HumanThings.human_number(inhuman_number=data.score)
         header_content: str = (
             f"{rich_colours.BOLD}{rich_colours.POWDER_BLUE}{subreddit_name}{rich_colours.RESET}{rich_colours.RESET} · "
-            f"{HumanThings.human_datetime(inhuman_datetime=0
-            if getattr(data, "created", None) 
-               is None else data.created)}\n"
+            f"{HumanThings.human_datetime(inhuman_datetime=0 if getattr(data, 'created', None) is None else data.created)}\n"
             f"{rich_colours.GREY}{escape(author)}{rich_colours.RESET}"
         )
 
         footer_content: str = (
-            f"{rich_colours.ORANGE_RED}🡅{rich_colours.RESET} {"[dim]" 
-            if score == 0 
-            else rich_colours.POWDER_BLUE}{score}{rich_colours.RESET} {rich_colours.SOFT_BLUE}🡇{rich_colours.RESET} "
+            f"{rich_colours.ORANGE_RED}🡅{rich_colours.RESET} {'[dim]' if score == 0 else rich_colours.POWDER_BLUE}{score}{rich_colours.RESET} {rich_colours.SOFT_BLUE}🡇{rich_colours.RESET} "
             f"💬{rich_colours.POWDER_BLUE}{HumanThings.human_number(inhuman_number=data.num_comments)}{rich_colours.RESET} "
             f"{rich_colours.BOLD_YELLOW}🏆{HumanThings.human_number(inhuman_number=len(data.all_awardings))}{rich_colours.BOLD_YELLOW_RESET}"
         )
@@ -299,17 +380,10 @@ class Render:
         )
 
     @classmethod
-    def _posts(cls, data: t.List[Submission]):
-        """Render and print a list of posts/comments using the `post` method."""
-        panels: t.List[Panel] = []
-
+    def _posts(cls, data: t.Iterable[Submission]):
+        """Render and print posts one by one, as they are consumed, using the `post` method."""
         for item in data:
-            panel = cls._post(data=item, print_panel=False)
-            if panel is not None:
-                panels.append(panel)
-
-        panel_group = Group(*panels)
-        console.print(panel_group)
+            cls._post(data=item, print_panel=True)
 
     @classmethod
     def _subreddit(
@@ -340,7 +414,7 @@ class Render:
 
         header_content: str = (
             f"{rich_colours.BOLD}{data.display_name_prefixed}{rich_colours.RESET} · "
-            f"{HumanThings.human_datetime(inhuman_datetime=0 if getattr(data, "created", None) is None else data.created)}"
+            f"{HumanThings.human_datetime(inhuman_datetime=0 if getattr(data, 'created', None) is None else data.created)}"
         )
 
         if "user" not in data.subreddit_type:
@@ -363,15 +437,9 @@ class Render:
         )
 
     @classmethod
-    def _subreddits(cls, data: t.List[Subreddit]):
-        panels = []
+    def _subreddits(cls, data: t.Iterable[Subreddit]):
         for subreddit in data:
-            panel = cls._subreddit(data=subreddit, print_panel=False)
-            if panel:
-                panels.append(panel)
-
-        panels_group = Group(*panels)
-        console.print(panels_group)
+            cls._subreddit(data=subreddit, print_panel=True)
 
     @classmethod
     def _wiki_page(cls, data: WikiPage, print_panel: bool = True):
@@ -398,15 +466,9 @@ class Render:
         )
 
     @classmethod
-    def _wiki_pages(cls, data: t.List[WikiPage]):
-        panels = []
+    def _wiki_pages(cls, data: t.Iterable[WikiPage]):
         for page in data:
-            panel = cls._wiki_page(data=page, print_panel=False)
-            if panel:
-                panels.append(panel)
-
-        panels_group = Group(*panels)
-        console.print(panels_group)
+            cls._wiki_page(data=page, print_panel=True)
 
     @classmethod
     def _panel(
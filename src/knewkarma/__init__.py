@@ -1,4 +1,11 @@
-from .core import post, posts, search, subreddit, subreddits, user, users
-
+import importlib
+import typing as t
 
 __all__ = ["post", "posts", "search", "subreddit", "subreddits", "user", "users"]
+
+
+def __getattr__(name: str) -> t.Any:
+    # Core modules pull in praw, so they are only imported when first accessed.
+    if name in __all__:
+        return importlib.import_module(f".core.{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
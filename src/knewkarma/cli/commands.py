@@ -7,18 +7,14 @@ from karmakrate.handlers.auth_handler import AuthHandler
 from karmakrate.riches.rich_logging import console
 
 from .main import run
-from ..core.client import LISTINGS, SORT, TIME_FILTERS
-from ..core.post import Post
-from ..core.posts import Posts
-from ..core.search import Search
-from ..core.subreddit import Subreddit
-from ..core.subreddits import Subreddits
-from ..core.user import User
-from ..core.users import Users
+from ..core.client import LISTINGS, SORT, TIME_FILTERS, configure
 from ..meta.about import Project
 from ..meta.license import License
 from ..meta.version import Version
 
+if t.TYPE_CHECKING:
+    from ..core.listing import Predicates
+
 __all__ = ["start"]
 
 
@@ -31,17 +27,69 @@ def set_window_title(text: t.Optional[str] = None):
     console.set_window_title(title)
 
 
+def read_names(file: t.TextIO, prefixes: t.Tuple[str, ...]) -> t.Iterator[str]:
+    """
+    Reads one name per line from a file (or stdin), skipping blank lines and ``#`` comments,
+    and stripping prefixes like ``r/`` or ``u/``.
+    """
+    for line in file:
+        name: str = line.split("#", 1)[0].strip()
+        for prefix in prefixes:
+            if name.lower().startswith(prefix):
+                name = name[len(prefix) :]
+                break
+        if name:
+            yield name
+
+
 def global_options(func: t.Callable) -> t.Callable:
     """
     Decorator to add global CLI options like sort, timeframe, export, etc.,
     and inject them into ctx.obj for use within the command.
     """
 
+    @click.option(
+        "--batch",
+        is_flag=True,
+        envvar="KNEWKARMA_BATCH",
+        help="Batch mode: skip update/status checks and screen clearing (for scripts and cron jobs)",
+    )
+    @click.option(
+        "--cache",
+        is_flag=True,
+        envvar="KNEWKARMA_CACHE",
+        help="Cache API responses on disk, and reuse (or revalidate) them on repeated runs",
+    )
+    @click.option(
+        "--author",
+        "authors",
+        multiple=True,
+        help="Only keep posts/comments by this user (repeatable)",
+    )
+    @click.option(
+        "--compression",
+        default="zstd",
+        show_default=True,
+        type=click.Choice(["zstd", "snappy", "none"]),
+        help="Compression codec for parquet and feather exports",
+    )
     @click.option(
         "-e",
         "--export",
         type=str,
-        help="A comma-separated list <w/o whitespaces> of file types to export the output to <supported: csv,html,json,xml>",
+        help="A comma-separated list <w/o whitespaces> of file types to export the output to <supported: csv,feather,html,json,jsonl,parquet,sqlite,xml>",
+    )
+    @click.option(
+        "--flair",
+        "flairs",
+        multiple=True,
+        help="Only keep posts with this flair (repeatable)",
+    )
+    @click.option(
+        "--incremental",
+        is_flag=True,
+        envvar="KNEWKARMA_INCREMENTAL",
+        help="Stop reading newest-first listings at what the last run already fetched",
     )
     @click.option(
         "--listing",
@@ -58,6 +106,23 @@ def global_options(func: t.Callable) -> t.Callable:
         type=int,
         help="Maximum data output limit <max 100 if searching for users>",
     )
+    @click.option(
+        "--min-score",
+        type=int,
+        help="Only keep posts/comments with at least this score",
+    )
+    @click.option(
+        "--resume",
+        is_flag=True,
+        envvar="KNEWKARMA_RESUME",
+        help="Checkpoint listings as they are read, and resume those an interrupted run left off",
+    )
+    @click.option(
+        "--shared-ratelimit",
+        is_flag=True,
+        envvar="KNEWKARMA_SHARED_RATELIMIT",
+        help="Share one rate-limit budget with other knewkarma processes on this host",
+    )
     @click.option(
         "-s",
         "--sort",
@@ -82,21 +147,71 @@ def global_options(func: t.Callable) -> t.Callable:
         sort: SORT,
         limit: int,
         export: str,
+        compression: str,
+        authors: t.Tuple[str, ...],
+        flairs: t.Tuple[str, ...],
+        min_score: t.Optional[int],
+        incremental: bool,
         listing: str,
+        resume: bool,
+        shared_ratelimit: bool,
+        batch: bool,
+        cache: bool,
         *args,
         **kwargs,
     ):
+        if shared_ratelimit:
+            configure(shared_ratelimit=True)
+        if cache:
+            configure(response_cache=True)
+        if resume:
+            configure(resume=True)
+        if incremental:
+            configure(incremental=True)
+
         ctx.ensure_object(dict)
         ctx.obj["time_filter"] = time_filter
         ctx.obj["sort"] = sort
         ctx.obj["limit"] = limit
         ctx.obj["export"] = export
+        ctx.obj["compression"] = compression
         ctx.obj["listing"] = listing
+        ctx.obj["authors"] = authors
+        ctx.obj["flairs"] = flairs
+        ctx.obj["min_score"] = min_score
+        ctx.obj["batch"] = batch or ctx.obj.get("batch", False)
+        ctx.obj["cache"] = cache or ctx.obj.get("cache", False)
         return ctx.invoke(func, *args, **kwargs)
 
     return wrapper
 
 
+def read_predicates(ctx: click.Context) -> "Predicates":
+    """
+    Builds the conditions set by ``--min-score``, ``--author`` and ``--flair``.
+
+    :param ctx: The current Click context.
+    :type ctx: click.Context
+    :return: Conditions for :func:`~knewkarma.core.listing.paginate`.
+    :rtype: Predicates
+    """
+    from ..core.listing import Predicates
+
+    return Predicates(
+        min_score=ctx.obj["min_score"],
+        authors=(
+            frozenset(author.lower() for author in ctx.obj["authors"])
+            if ctx.obj["authors"]
+            else None
+        ),
+        flairs=(
+            frozenset(flair.lower() for flair in ctx.obj["flairs"])
+            if ctx.obj["flairs"]
+            else None
+        ),
+    )
+
+
 def help_callback(ctx: click.Context, _, value: bool):
     """
     Custom callback function for handling the '--help' option in Click commands.
@@ -178,21 +293,90 @@ def licence(
 
 @cli.command(
     name="post",
-    help="Use this command to get an individual post's data including its comments.",
+    help="Use this command to get the data of one or more posts, including their comments.",
 )
-@click.argument("id")
+@click.argument("ids", nargs=-1)
 @click.option("--info", is_flag=True, help="Get post info (w/o comments)")
 @click.option("--comments", is_flag=True, help="Get post comments")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="File with one post id or URL per line (use - for stdin)",
+)
+@click.option(
+    "--expand",
+    default=0,
+    show_default=True,
+    type=int,
+    help="Maximum number of 'load more comments' requests to spend expanding the comment tree",
+)
+@click.option(
+    "--max-depth",
+    type=int,
+    help="Leave 'load more comments' stubs nested deeper than this unexpanded",
+)
+@click.option(
+    "--workers",
+    default=4,
+    show_default=True,
+    type=int,
+    help="Maximum number of comment expansion requests to run concurrently",
+)
+@click.option(
+    "--post-workers",
+    default=4,
+    show_default=True,
+    type=int,
+    help="Maximum number of posts to get comments from concurrently",
+)
 @global_options
 @click.pass_context
-def post(ctx: click.Context, id: str, info: bool, comments: bool):
+def post(
+    ctx: click.Context,
+    ids: t.Tuple[str, ...],
+    info: bool,
+    comments: bool,
+    input_file: t.Optional[t.TextIO],
+    expand: int,
+    max_depth: t.Optional[int],
+    workers: int,
+    post_workers: int,
+):
+    from ..core.post import Post
+
     export: str = ctx.obj["export"]
 
-    r_post = Post(id=id)
-    method_map: t.Dict = {
-        "comments": lambda session, status, logger: r_post.comments(status=status),
-        "info": lambda session, status, logger: r_post.info(status=status),
-    }
+    if not ids and input_file is None:
+        raise click.UsageError("Provide post ids or URLs, or a file of them with -i.")
+
+    if len(ids) == 1 and input_file is None:
+        r_post = Post(id=ids[0])
+        method_map: t.Dict = {
+            "comments": lambda status, logger: r_post.comments(
+                status=status, expand_limit=expand, max_depth=max_depth, workers=workers
+            ),
+            "info": lambda status, logger: r_post.info(status=status),
+        }
+    else:
+        # Read up front, so a file (or stdin) can feed both --info and --comments.
+        lines: t.List[str] = (
+            list(read_names(file=input_file, prefixes=())) if input_file else []
+        )
+        method_map = {
+            "comments": lambda status, logger: Post.bulk_comments(
+                ids=[*ids, *lines],
+                status=status,
+                posts=post_workers,
+                expand_limit=expand,
+                max_depth=max_depth,
+                workers=workers,
+            ),
+            "info": lambda status, logger: Post.bulk_info(
+                ids=[*ids, *lines], status=status
+            ),
+        }
 
     run(
         ctx=ctx,
@@ -254,6 +438,7 @@ def cmd_posts(
     :param rising: Flag to get posts from the rising listing.
     :type rising: bool
     """
+    from ..core.posts import Posts
 
     time_filter: TIME_FILTERS = ctx.obj["time_filter"]
     sort: SORT = ctx.obj["sort"]
@@ -261,30 +446,25 @@ def cmd_posts(
     export: str = ctx.obj["export"]
 
     method_map: t.Dict = {
-        "best": lambda session, status, logger: Posts.best(
+        "best": lambda status, logger: Posts.best(
             limit=limit,
             status=status,
-            session=session,
         ),
-        "controversial": lambda session, status, logger: Posts.controversial(
+        "controversial": lambda status, logger: Posts.controversial(
             limit=limit,
+            time_filter=time_filter,
             status=status,
-            session=session,
-        ),
-        "front_page": lambda session, status, logger: Posts.front_page(
-            limit=limit, status=status, session=session
         ),
-        "new": lambda session, status, logger: Posts.new(
-            limit=limit, status=status, session=session
+        "front_page": lambda status, logger: Posts.front_page(
+            limit=limit, status=status
         ),
-        "top": lambda session, status, logger: Posts.top(
+        "new": lambda status, logger: Posts.new(limit=limit, status=status),
+        "top": lambda status, logger: Posts.top(
             limit=limit,
+            time_filter=time_filter,
             status=status,
-            session=session,
-        ),
-        "rising": lambda session, status, logger: Posts.rising(
-            limit=limit, status=status, session=session
         ),
+        "rising": lambda status, logger: Posts.rising(limit=limit, status=status),
     }
 
     run(
@@ -327,6 +507,7 @@ def cmd_search(
     :param users: Flag to search users.
     :type users: bool
     """
+    from ..core.search import Search
 
     sort: SORT = ctx.obj["sort"]
     limit: int = ctx.obj["limit"]
@@ -336,15 +517,11 @@ def cmd_search(
         query=query,
     )
     method_map: t.Dict = {
-        "posts": lambda session, status, logger: search.posts(
-            limit=limit, status=status, session=session
-        ),
-        "subreddits": lambda session, status, logger: search.subreddits(
-            limit=limit, session=session, status=status
-        ),
-        "users": lambda session, status, logger: search.users(
-            limit=limit, status=status, session=session
+        "posts": lambda status, logger: search.posts(limit=limit, status=status),
+        "subreddits": lambda status, logger: search.subreddits(
+            limit=limit, status=status
         ),
+        "users": lambda status, logger: search.users(limit=limit, status=status),
     }
 
     run(
@@ -389,20 +566,32 @@ def user(
     profile: bool,
     top_subreddits: int,
 ):
+    from ..core.user import User
+
     time_filter: TIME_FILTERS = ctx.obj["time_filter"]
     limit: int = ctx.obj["limit"]
     export: str = ctx.obj["export"]
     listing: LISTINGS = ctx.obj["listing"]
 
+    where = read_predicates(ctx=ctx)
+
     r_user = User(username=username)
     method_map: t.Dict = {
         "comments": lambda status, logger: r_user.comments(
-            limit=limit, listing=listing, status=status
+            limit=limit,
+            listing=listing,
+            time_filter=time_filter,
+            where=where,
+            status=status,
         ),
         "moderated": lambda status, logger: r_user.moderated(status=status),
         "overview": lambda status, logger: r_user.overview(status=status),
         "posts": lambda status, logger: r_user.posts(
-            limit=limit, listing=listing, status=status
+            limit=limit,
+            listing=listing,
+            time_filter=time_filter,
+            where=where,
+            status=status,
         ),
         "profile": lambda status, logger: r_user.profile(status=status),
         "top_subreddits": lambda status, logger: r_user.top_subreddits(
@@ -440,11 +629,31 @@ def user(
     is_flag=True,
     help="Get popular users",
 )
+@click.option(
+    "--profiles",
+    is_flag=True,
+    help="Get the profiles of users listed in --input (usernames or t2_ account ids)",
+)
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="File with one username per line (use - for stdin)",
+)
 @global_options
 @click.pass_context
-def cmd_users(ctx: click.Context, _all: bool, new: bool, popular: bool):
+def cmd_users(
+    ctx: click.Context,
+    _all: bool,
+    new: bool,
+    popular: bool,
+    profiles: bool,
+    input_file: t.Optional[t.TextIO],
+):
     """
-    Retrieve various users such as new, popular, and all users.
+    Retrieve various users such as new, popular, and all users, or the profiles of many
+    users at once.
 
     :param ctx: The Click context object.
     :type ctx: click.Context
@@ -454,85 +663,170 @@ def cmd_users(ctx: click.Context, _all: bool, new: bool, popular: bool):
     :type new: bool
     :param popular: Flag to get popular users.
     :type popular: bool
+    :param profiles: Flag to get the profiles of the users listed in the input file.
+    :type profiles: bool
+    :param input_file: File with one username per line.
+    :type input_file: t.Optional[t.TextIO]
     """
+    from ..core.user import User
+    from ..core.users import Users
+
+    if profiles and input_file is None:
+        raise click.UsageError("--profiles needs a list of users from -i/--input.")
 
     export: str = ctx.obj["export"]
     time_filter: TIME_FILTERS = ctx.obj["time_filter"]
     limit: int = ctx.obj["limit"]
 
     method_map: t.Dict = {
-        "all": lambda session, status, logger: Users.all(
-            session=session,
+        "all": lambda status, logger: Users.all(
             limit=limit,
             status=status,
         ),
-        "new": lambda session, status, logger: Users.new(
-            session=session,
+        "new": lambda status, logger: Users.new(
             limit=limit,
             status=status,
         ),
-        "popular": lambda session, status, logger: Users.popular(
-            session=session,
+        "popular": lambda status, logger: Users.popular(
             limit=limit,
             status=status,
         ),
+        "profiles": lambda status, logger: User.bulk_profiles(
+            names=read_names(file=input_file, prefixes=("u/", "/u/")),
+            status=status,
+        ),
     }
 
     run(
         ctx=ctx,
         method_map=method_map,
         export=export,
-        all=all,
+        all=_all,
         new=new,
         popular=popular,
+        profiles=profiles,
     )
 
 
 @cli.command(
     name="subreddit",
-    help="Get data from a specified subreddit.",
+    help="Get data from one or more subreddits.",
 )
-@click.argument("display_name")
+@click.argument("display_names", nargs=-1)
 @click.option("--comments", is_flag=True, type=str, help="Get comments")
 @click.option("--posts", is_flag=True, help="Get posts")
 @click.option("--profile", is_flag=True, help="Get profile")
 @click.option("--search", type=str, help="Search for posts that match a query")
 @click.option("--wiki-pages", is_flag=True, help="Get wiki pages")
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="File with one subreddit name per line (use - for stdin)",
+)
+@click.option(
+    "--workers",
+    default=4,
+    show_default=True,
+    type=int,
+    help="Maximum number of subreddits (or groups of them) to crawl concurrently",
+)
 @global_options
 @click.pass_context
 def subreddit(
     ctx: click.Context,
-    display_name: str,
+    display_names: t.Tuple[str, ...],
     comments: bool,
     posts: bool,
     profile: bool,
     search: str,
     wiki_pages: bool,
+    input_file: t.Optional[t.TextIO],
+    workers: int,
 ):
+    from ..core.subreddit import Subreddit
+
     time_filter: TIME_FILTERS = ctx.obj["time_filter"]
     sort: SORT = ctx.obj["sort"]
     limit: int = ctx.obj["limit"]
     export: str = ctx.obj["export"]
     listing: LISTINGS = ctx.obj["listing"]
 
-    r_subreddit = Subreddit(display_name=display_name)
-    method_map = {
-        "comments": lambda status, logger: r_subreddit.comments(
-            limit=limit, status=status
-        ),
-        "posts": lambda status, logger: r_subreddit.posts(
-            limit=limit, listing=listing, status=status
-        ),
-        "profile": lambda status, logger: r_subreddit.profile(status=status),
-        "search": lambda status, logger: r_subreddit.search(
-            query=search,
-            limit=limit,
-            sort=sort,
-            time_filter=time_filter,
-            status=status,
-        ),
-        "wiki_pages": lambda status, logger: r_subreddit.wiki_pages(status=status),
-    }
+    if not display_names and input_file is None:
+        raise click.UsageError(
+            "Provide subreddit names, or a file of them with -i/--input."
+        )
+
+    where = read_predicates(ctx=ctx)
+    if len(display_names) == 1 and input_file is None:
+        r_subreddit = Subreddit(display_name=display_names[0])
+        method_map = {
+            "comments": lambda status, logger: r_subreddit.comments(
+                limit=limit, time_filter=time_filter, where=where, status=status
+            ),
+            "posts": lambda status, logger: r_subreddit.posts(
+                limit=limit,
+                listing=listing,
+                time_filter=time_filter,
+                where=where,
+                status=status,
+            ),
+            "profile": lambda status, logger: r_subreddit.profile(status=status),
+            "search": lambda status, logger: r_subreddit.search(
+                query=search,
+                limit=limit,
+                sort=sort,
+                time_filter=time_filter,
+                status=status,
+            ),
+            "wiki_pages": lambda status, logger: r_subreddit.wiki_pages(status=status),
+        }
+    else:
+        # Fan out over every subreddit; read up front so the names can feed every flag.
+        names: t.List[str] = [
+            *display_names,
+            *(
+                read_names(file=input_file, prefixes=("r/", "/r/"))
+                if input_file
+                else []
+            ),
+        ]
+        method_map = {
+            "comments": lambda status, logger: Subreddit.group_comments(
+                names=names,
+                limit=limit,
+                time_filter=time_filter,
+                where=where,
+                workers=workers,
+                status=status,
+            ),
+            "posts": lambda status, logger: Subreddit.group_posts(
+                names=names,
+                limit=limit,
+                listing=listing,
+                time_filter=time_filter,
+                where=where,
+                workers=workers,
+                status=status,
+            ),
+            "profile": lambda status, logger: Subreddit.bulk_profiles(
+                names=names, status=status
+            ),
+            "search": lambda status, logger: Subreddit.group_search(
+                names=names,
+                query=search,
+                limit=limit,
+                sort=sort,
+                time_filter=time_filter,
+                workers=workers,
+                status=status,
+            ),
+            "wiki_pages": lambda status, logger: Subreddit.fan_out(
+                names=names, method="wiki_pages", workers=workers, status=status
+            ),
+        }
+
     run(
         ctx=ctx,
         method_map=method_map,
@@ -569,13 +863,32 @@ def subreddit(
     is_flag=True,
     help="Get popular subreddits",
 )
+@click.option(
+    "--profiles",
+    is_flag=True,
+    help="Get the profiles of subreddits listed in --input",
+)
+@click.option(
+    "-i",
+    "--input",
+    "input_file",
+    type=click.File("r"),
+    help="File with one subreddit name per line (use - for stdin)",
+)
 @global_options
 @click.pass_context
 def cmd_subreddits(
-    ctx: click.Context, _all: bool, default: bool, new: bool, popular: bool
+    ctx: click.Context,
+    _all: bool,
+    default: bool,
+    new: bool,
+    popular: bool,
+    profiles: bool,
+    input_file: t.Optional[t.TextIO],
 ):
     """
-    Retrieve various subreddits such as new, popular, default, and all subreddits.
+    Retrieve various subreddits such as new, popular, default, and all subreddits, or the
+    profiles of many subreddits at once.
 
     :param ctx: The Click context object.
     :type ctx: click.Context
@@ -587,25 +900,35 @@ def cmd_subreddits(
     :type new: bool
     :param popular: Flag to get popular subreddits.
     :type popular: bool
+    :param profiles: Flag to get the profiles of the subreddits listed in the input file.
+    :type profiles: bool
+    :param input_file: File with one subreddit name per line.
+    :type input_file: t.Optional[t.TextIO]
     """
+    from ..core.subreddit import Subreddit
+    from ..core.subreddits import Subreddits
+
+    if profiles and input_file is None:
+        raise click.UsageError("--profiles needs a list of subreddits from -i/--input.")
 
     export: str = ctx.obj["export"]
     limit: int = ctx.obj["limit"]
 
     method_map: t.Dict = {
-        "all": lambda session, status, logger: Subreddits.all(
+        "all": lambda status, logger: Subreddits.all(
             limit=limit,
-            session=session,
             status=status,
         ),
-        "default": lambda session, status, logger: Subreddits.default(
-            limit=limit, session=session, status=status
+        "default": lambda status, logger: Subreddits.default(
+            limit=limit, status=status
         ),
-        "new": lambda session, status, logger: Subreddits.new(
-            limit=limit, session=session, status=status
+        "new": lambda status, logger: Subreddits.new(limit=limit, status=status),
+        "popular": lambda status, logger: Subreddits.popular(
+            limit=limit, status=status
         ),
-        "popular": lambda session, status, logger: Subreddits.popular(
-            limit=limit, session=session, status=status
+        "profiles": lambda status, logger: Subreddit.bulk_profiles(
+            names=read_names(file=input_file, prefixes=("r/", "/r/")),
+            status=status,
         ),
     }
 
@@ -613,10 +936,11 @@ def cmd_subreddits(
         ctx=ctx,
         method_map=method_map,
         export=export,
-        all=all,
+        all=_all,
         default=default,
         new=new,
         popular=popular,
+        profiles=profiles,
     )
 
 
@@ -1,31 +1,214 @@
+import contextlib
 import inspect
 import os
+import queue
+import threading
 import typing as t
-from datetime import datetime
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
-import requests
 import rich_click as click
 from karmakrate.everything.runtime_things import RuntimeThings
-from karmakrate.handlers.io_handlers import DataFrameHandler, FileHandler
+from karmakrate.handlers.io_handlers import FileHandler
 from karmakrate.riches import rich_colours
 from karmakrate.riches.rich_logging import console, logger
-from karmakrate.riches.rich_render import Render
-from prawcore import exceptions
 from rich.status import Status
 
 from ..meta.about import Project
 from ..meta.version import Version
 
+if t.TYPE_CHECKING:
+    import requests
+
 __all__ = ["run"]
 
 NORMAL_ERROR_PREFIX: str = f"{rich_colours.RED}⚠{rich_colours.RED_RESET}"
 CRITICAL_ERROR_PREFIX: str = f"{rich_colours.BOLD_RED}⚠{rich_colours.BOLD_RED_RESET}"
 WARNING_PREFIX: str = f"{rich_colours.BOLD_YELLOW}⚠{rich_colours.BOLD_YELLOW_RESET}"
 
+# Database the ``sqlite`` export format upserts into.
+SQLITE_EXPORT: str = os.path.join(
+    FileHandler.PARENT_DIR, "exports", "knewkarma.sqlite3"
+)
+
+# Maximum number of a command's methods (e.g., listings) to fetch at once.
+MAX_CONCURRENT_METHODS: int = 4
+# Maximum number of a streamed result's items fetched ahead of rendering and exporting them.
+PREFETCH_SIZE: int = 500
+
+
+class Prefetched:
+    """
+    A streamed result read ahead by a worker thread into a bounded queue, so fetching overlaps
+    with rendering and exporting, while at most :data:`PREFETCH_SIZE` items are held at once.
+    """
+
+    # Marks the end of the result in the queue.
+    _END = object()
+
+    def __init__(self, items: t.Iterator, stop: threading.Event):
+        """
+        :param items: The result to read ahead.
+        :type items: Iterator
+        :param stop: Set once nothing will be read from the result anymore.
+        :type stop: threading.Event
+        """
+        self._items = items
+        self._stop = stop
+        self._closed = threading.Event()
+        self._queue: queue.Queue = queue.Queue(maxsize=PREFETCH_SIZE)
+        self._done: bool = False
+
+    def __iter__(self) -> "Prefetched":
+        return self
+
+    def __next__(self) -> t.Any:
+        if self._done:
+            raise StopIteration
+
+        item, error = self._queue.get()
+        if item is self._END:
+            self._done = True
+            if error is not None:
+                raise error
+            raise StopIteration
+
+        return item
+
+    def pump(self):
+        """Reads the result into the queue until it ends, fails, or is closed."""
+        try:
+            for item in self._items:
+                if not self._put((item, None)):
+                    return
+        except Exception as error:
+            self._put((self._END, error))
+        else:
+            self._put((self._END, None))
+
+    def close(self):
+        """Stops reading ahead, e.g., once the result's reader has given up on it."""
+        self._closed.set()
+
+    def _put(self, entry: t.Tuple[t.Any, t.Optional[Exception]]) -> bool:
+        while not (self._closed.is_set() or self._stop.is_set()):
+            try:
+                self._queue.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+
+def collect_into(items: t.Iterable, collection: t.List) -> t.Iterator:
+    """
+    Yields items unchanged, appending each one to the given collection along the way.
+
+    :param items: The items to pass through.
+    :type items: Iterable
+    :param collection: The list to append each item to.
+    :type collection: List
+    :return: A generator of the original items.
+    :rtype: Iterator
+    """
+    for item in items:
+        collection.append(item)
+        yield item
+
+
+def call_method(method: t.Callable, **kwargs: t.Any) -> t.Any:
+    """
+    Calls a method with only the keyword arguments it accepts.
+
+    :param method: The method to call.
+    :type method: Callable
+    :param kwargs: Candidate keyword arguments (e.g., ``status``, ``session``, ``logger``).
+    :return: Whatever the method returns.
+    """
+    # 🔍 Filter out only those kwargs that the method actually accepts
+    sig = inspect.signature(method)
+    accepted_kwargs = {
+        key: value for key, value in kwargs.items() if key in sig.parameters
+    }
+
+    # 👇 Add direct assignment variables to the accepted args if needed
+    if "session" in sig.parameters:
+        accepted_kwargs["session"] = kwargs.get("session")
+    if "status" in sig.parameters:
+        accepted_kwargs["status"] = kwargs.get("status")
+    if "logger" in sig.parameters:
+        accepted_kwargs["logger"] = kwargs.get("logger")
+
+    return method(**accepted_kwargs)
+
+
+def prefetch_method(
+    method: t.Callable, ready: Future, stop: threading.Event, **kwargs: t.Any
+):
+    """
+    Calls a method on a worker thread, and hands its result over through ``ready``.
+
+    A streamed result is handed over as a :class:`Prefetched` iterator as soon as the method
+    returns, and this thread keeps reading it ahead until it ends, or is closed.
+
+    :param method: The method to call.
+    :type method: Callable
+    :param ready: Resolved with the method's result, or the error it raised.
+    :type ready: Future
+    :param stop: Set once the command stops reading results.
+    :type stop: threading.Event
+    :param kwargs: Candidate keyword arguments, as for :func:`call_method`.
+    """
+    if stop.is_set():
+        return
+
+    try:
+        response_data = call_method(method=method, **kwargs)
+    except Exception as error:
+        ready.set_exception(error)
+        return
+
+    if not isinstance(response_data, t.Iterator):
+        ready.set_result(response_data)
+        return
+
+    prefetched = Prefetched(items=response_data, stop=stop)
+    ready.set_result(prefetched)
+    prefetched.pump()
+
+
+@contextlib.contextmanager
+def report_errors() -> t.Iterator[None]:
+    """Logs any error raised while running a command's method, instead of propagating it."""
+    from prawcore import exceptions
+
+    try:
+        yield
+    except exceptions.TooManyRequests as too_many_requests:
+        logger.warning(f"{WARNING_PREFIX} Woah! Chill out, dude: {too_many_requests}")
+    except exceptions.BadRequest as bad_request:
+        logger.error(
+            f"{NORMAL_ERROR_PREFIX} A BadRequest error occurred: {bad_request}"
+        )
+    except exceptions.ServerError as server_error:
+        logger.error(f"{NORMAL_ERROR_PREFIX} A ServerError occurred: {server_error}")
+    except exceptions.RequestException as response_exception:
+        logger.error(
+            f"{NORMAL_ERROR_PREFIX} A ResponseException error occurred: {response_exception}"
+        )
+    except exceptions.PrawcoreException as prawcore_exception:
+        logger.critical(
+            f"{CRITICAL_ERROR_PREFIX} A PrawcoreException error: {prawcore_exception}"
+        )
+    except Exception as error:
+        logger.critical(
+            f"{CRITICAL_ERROR_PREFIX} An unexpected error occurred: {error}"
+        )
+
 
 def invoke_method(
     method: t.Callable,
-    **kwargs: t.Union[str, click.Context, requests.Session, Status],
+    **kwargs: t.Union[str, click.Context, "requests.Session", Status],
 ):
     """
     Invoke a method with the keyword arguments it accepts, and optionally export the result.
@@ -33,7 +216,7 @@ def invoke_method(
     :param method: The method to invoke.
     :type method: Callable
     :param kwargs: Keyword arguments that may include:
-        - ``export`` (str): Comma-separated list of export formats (e.g., "csv,json").
+        - ``export`` (str): Comma-separated list of export formats (e.g., "csv,jsonl,sqlite").
         - ``status`` (Status): A Rich status indicator.
         - ``session`` (requests.Session): An HTTP session to use.
         - ``argument`` (str): The argument that triggered the method.
@@ -44,58 +227,97 @@ def invoke_method(
 
     :return: None
     """
+    from karmakrate.handlers.io_handlers import DataFrameHandler, StreamHandler
+    from karmakrate.handlers.sqlite_handler import SQLiteHandler
+    from karmakrate.riches.rich_render import Render
+
     ctx: click.Context = kwargs.get("ctx")
-    session = kwargs.get("session")
     status = kwargs.get("status")
 
     command: str = ctx.command.name
     argument: str = kwargs.get("argument")
 
     status.update(f"Initialising {ctx.command.name} module...")
-    # 🔍 Filter out only those kwargs that the method actually accepts
-    sig = inspect.signature(method)
-    accepted_kwargs = {
-        key: value for key, value in kwargs.items() if key in sig.parameters
-    }
-
-    # 👇 Add direct assignment variables to the accepted args if needed
-    if "session" in sig.parameters:
-        accepted_kwargs["session"] = session
-    if "status" in sig.parameters:
-        accepted_kwargs["status"] = status
-    if "logger" in sig.parameters:
-        accepted_kwargs["logger"] = kwargs.get("logger")
 
     # 🧠 Actually call the method
-    response_data: t.Union[t.List, t.Dict, str, bool, t.Any] = method(**accepted_kwargs)
+    response_data: t.Union[t.List, t.Dict, str, bool, t.Any] = call_method(
+        method=method, **kwargs
+    )
 
-    if response_data:
-        Render.panels(data=response_data)
-        if kwargs.get("export"):
-            exports_child_dir: str = os.path.join(
-                FileHandler.PARENT_DIR,
-                "exports",
-                command,
-                argument,
-            )
+    export_to: t.List[str] = (
+        kwargs.get("export").split(",") if kwargs.get("export") else []
+    )
+    exports_child_dir: str = os.path.join(
+        FileHandler.PARENT_DIR,
+        "exports",
+        command,
+        argument,
+    )
+    filename: str = FileHandler.time_to_filename()
 
-            FileHandler.pathfinder(
-                directories=[
-                    os.path.join(exports_child_dir, extension)
-                    for extension in ["csv", "html", "json", "xml"]
-                ],
-            )
+    # Every command upserts into the same database, so re-runs update rows in place.
+    to_sqlite: bool = "sqlite" in export_to
+    export_to = [file_format for file_format in export_to if file_format != "sqlite"]
+    if to_sqlite and isinstance(response_data, t.Iterator):
+        response_data = SQLiteHandler.tee(
+            items=response_data, path=SQLITE_EXPORT, status=status
+        )
+        to_sqlite = False
 
-            export_to: t.List[str] = kwargs.get("export").split(",")
-            dataframe = DataFrameHandler.build(data=response_data, status=status)
-            DataFrameHandler.export(
-                dataframe=dataframe,
-                filename=FileHandler.time_to_filename(),
+    if isinstance(response_data, t.Iterator) and export_to:
+        # Listings are streamed; CSV and JSON Lines are written as items go by, and what gets
+        # rendered is kept only if it also has to be exported to the other formats.
+        streamed: t.List[str] = [
+            file_format
+            for file_format in export_to
+            if file_format in StreamHandler.FORMATS
+        ]
+        export_to = [
+            file_format
+            for file_format in export_to
+            if file_format not in StreamHandler.FORMATS
+        ]
+        if streamed:
+            response_data = StreamHandler.tee(
+                items=response_data,
+                filename=filename,
                 directory=exports_child_dir,
-                formats=export_to,
+                formats=streamed,
                 status=status,
             )
 
+        if export_to:
+            rendered_data: t.List = []
+            Render.panels(
+                data=collect_into(items=response_data, collection=rendered_data)
+            )
+            response_data = rendered_data
+        else:
+            Render.panels(data=response_data)
+            response_data = None
+    elif response_data:
+        Render.panels(data=response_data)
+
+    if response_data and to_sqlite:
+        SQLiteHandler.export(data=response_data, path=SQLITE_EXPORT, status=status)
+
+    if response_data and export_to:
+        FileHandler.pathfinder(
+            directories=[
+                os.path.join(exports_child_dir, extension) for extension in export_to
+            ],
+        )
+
+        dataframe = DataFrameHandler.build(data=response_data, status=status)
+        DataFrameHandler.export(
+            dataframe=dataframe,
+            filename=filename,
+            directory=exports_child_dir,
+            formats=export_to,
+            status=status,
+            compression=ctx.obj.get("compression", "zstd"),
+        )
+
 
 def route_to_method(
     ctx: click.Context,
@@ -126,23 +348,31 @@ def route_to_method(
     runtime_operations = RuntimeThings(
         package_name=Project.package, version_cls=Version
     )
+    batch: bool = ctx.obj.get("batch", False)
 
-    is_valid_arg: bool = False
+    enabled: t.Dict[str, t.Callable] = {
+        argument: method
+        for argument, method in method_map.items()
+        if kwargs.get(argument)
+    }
+    if not enabled:
+        ctx.command.get_usage(ctx=ctx)
+        return
 
-    for argument, method in method_map.items():
-        if kwargs.get(argument):
-            is_valid_arg = True
-            start_time: datetime = datetime.now()
-            try:
-                runtime_operations.clear_screen()
-                with Status(
-                    status=f"Starting",
-                    console=console,
-                ) as status:
-                    with requests.Session() as session:
-                        runtime_operations.check_updates(session=session, status=status)
-                        runtime_operations.check_status(session=session, status=status)
+    checks: t.Optional[t.Dict[str, Future]] = None
+    if not batch:
+        runtime_operations.clear_screen()
+        checks = runtime_operations.start_checks()
 
+    try:
+        with Status(
+            status=f"Starting",
+            console=console,
+        ) as status:
+            if len(enabled) == 1:
+                # A single result is streamed straight into the renderer.
+                ((argument, method),) = enabled.items()
+                with report_errors():
                     invoke_method(
                         method=method,
                         status=status,
@@ -150,43 +380,61 @@ def route_to_method(
                         export=export,
                         argument=argument,
                     )
-            except exceptions.TooManyRequests as too_many_requests:
-                logger.warning(
-                    f"{WARNING_PREFIX} Woah! Chill out, dude: {too_many_requests}"
-                )
-            except exceptions.BadRequest as bad_request:
-                logger.error(
-                    f"{NORMAL_ERROR_PREFIX} A BadRequest error occurred: {bad_request}"
-                )
-            except exceptions.ServerError as server_error:
-                logger.error(
-                    f"{NORMAL_ERROR_PREFIX} A ServerError occurred: {server_error}"
-                )
-            except exceptions.RequestException as response_exception:
-                logger.error(
-                    f"{NORMAL_ERROR_PREFIX} A ResponseException error occurred: {response_exception}"
-                )
-            except exceptions.PrawcoreException as prawcore_exception:
-                logger.critical(
-                    f"{CRITICAL_ERROR_PREFIX} A PrawcoreException error: {prawcore_exception}"
-                )
-            except Exception as error:
-                logger.critical(
-                    f"{CRITICAL_ERROR_PREFIX} An unexpected error occurred: {error}"
-                )
-            finally:
-                console.print(
-                    f":keyboard: {rich_colours.BOLD_BLUE}[link=https://github.com/{Project.package}-io]GitHub[/link]{rich_colours.BOLD_BLUE_RESET}"
-                    " | "
-                    f":books: {rich_colours.BOLD_BLUE}[link=https://{Project.package}.readthedocs.io]Documentation[/link]{rich_colours.BOLD_BLUE_RESET}"
-                    " | "
-                    f":black_heart: {rich_colours.BOLD_BLUE}[link=https://opencollective.com/{Project.package}]Become a Sponsor[/link]{rich_colours.BOLD_BLUE_RESET}",
-                    justify="center",
-                    style=rich_colours.BOLD_WHITE.strip("[,]"),
-                )
-
-    if not is_valid_arg:
-        ctx.command.get_usage(ctx=ctx)
+            else:
+                # Several results are fetched concurrently (sharing one client pool and
+                # rate-limit budget), and each is rendered and exported as soon as it's in,
+                # while streamed ones keep being fetched ahead of their reader.
+                ready: t.Dict[Future, str] = {
+                    Future(): argument for argument in enabled
+                }
+                stop = threading.Event()
+                with ThreadPoolExecutor(
+                    max_workers=min(MAX_CONCURRENT_METHODS, len(enabled))
+                ) as executor:
+                    for future, argument in ready.items():
+                        executor.submit(
+                            prefetch_method,
+                            method=enabled[argument],
+                            ready=future,
+                            stop=stop,
+                            status=status,
+                            ctx=ctx,
+                        )
+                    try:
+                        for future in as_completed(ready):
+                            with report_errors():
+                                invoke_method(
+                                    method=future.result,
+                                    status=status,
+                                    ctx=ctx,
+                                    export=export,
+                                    argument=ready[future],
+                                )
+                            # Frees the worker if the result wasn't read to the end.
+                            if future.exception() is None and isinstance(
+                                future.result(), Prefetched
+                            ):
+                                future.result().close()
+                    finally:
+                        stop.set()
+    finally:
+        console.print(
+            f":keyboard: {rich_colours.BOLD_BLUE}[link=https://github.com/{Project.package}-io]GitHub[/link]{rich_colours.BOLD_BLUE_RESET}"
+            " | "
+            f":books: {rich_colours.BOLD_BLUE}[link=https://{Project.package}.readthedocs.io]Documentation[/link]{rich_colours.BOLD_BLUE_RESET}"
+            " | "
+            f":black_heart: {rich_colours.BOLD_BLUE}[link=https://opencollective.com/{Project.package}]Become a Sponsor[/link]{rich_colours.BOLD_BLUE_RESET}",
+            justify="center",
+            style=rich_colours.BOLD_WHITE.strip("[,]"),
+        )
+
+    if checks is not None:
+        runtime_operations.report_checks(checks=checks)
+
+    if ctx.obj.get("cache"):
+        from ..core.client import pool
+
+        console.log(pool().response_cache.summary())
 
 
 def run(
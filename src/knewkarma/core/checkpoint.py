@@ -0,0 +1,97 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import typing as t
+
+from karmakrate.handlers.io_handlers import FileHandler
+
+__all__ = ["Checkpoint"]
+
+
+class Checkpoint:
+    """
+    On-disk progress of one paginated listing crawl (a "job"), so an interrupted crawl can be
+    resumed without paying for the pages it already fetched again.
+
+    A job is identified by its endpoint, query parameters and limit. Its directory holds every
+    raw page fetched so far (``pages.jsonl``), and the ``after`` cursor and size of that file as
+    of the last page (``state.json``), which is replaced atomically after the page is written.
+    The fullnames seen are not stored, as replaying the pages yields them again.
+    """
+
+    DIRECTORY: str = os.path.join(FileHandler.PARENT_DIR, "checkpoints")
+
+    def __init__(
+        self, endpoint: str, params: t.Dict[str, t.Any], limit: t.Optional[int]
+    ):
+        """
+        :param endpoint: API path of the listing.
+        :type endpoint: str
+        :param params: Query parameters sent with every page request.
+        :type params: t.Dict[str, t.Any]
+        :param limit: Maximum number of items the job yields.
+        :type limit: t.Optional[int]
+        """
+        job: str = json.dumps([endpoint, sorted(params.items()), limit], default=str)
+        self.path: str = os.path.join(
+            self.DIRECTORY, hashlib.sha1(job.encode()).hexdigest()[:16]
+        )
+        self._pages_file: str = os.path.join(self.path, "pages.jsonl")
+        self._state_file: str = os.path.join(self.path, "state.json")
+
+    def exists(self) -> bool:
+        return os.path.exists(self._state_file)
+
+    def state(self) -> t.Dict[str, t.Any]:
+        """
+        :return: The cursor (``after``) and committed size of the pages file (``size``) as of
+            the last saved page.
+        :rtype: t.Dict[str, t.Any]
+        """
+        try:
+            with open(self._state_file) as state_file:
+                return json.load(state_file)
+        except (OSError, ValueError):
+            return {"after": None, "size": 0}
+
+    def pages(self) -> t.Iterator[t.Dict[str, t.Any]]:
+        """
+        :return: A generator of the raw pages saved so far, in the order they were fetched.
+        :rtype: t.Iterator[t.Dict[str, t.Any]]
+        """
+        size: int = self.state()["size"]
+        if not size:
+            return
+
+        with open(self._pages_file, "rb") as pages_file:
+            # Anything past the committed size belongs to a page whose state was never saved.
+            for line in pages_file.read(size).splitlines():
+                yield json.loads(line)
+
+    def save_page(self, page: t.Dict[str, t.Any], after: t.Optional[str]):
+        """
+        Appends a raw page, then commits the cursor that follows from it.
+
+        :param page: The raw page, as returned by the API.
+        :type page: t.Dict[str, t.Any]
+        :param after: The cursor of the next page.
+        :type after: t.Optional[str]
+        """
+        os.makedirs(self.path, exist_ok=True)
+        state: t.Dict[str, t.Any] = self.state()
+
+        with open(self._pages_file, "ab") as pages_file:
+            pages_file.truncate(state["size"])
+            pages_file.write(json.dumps(page).encode() + b"\n")
+            size: int = pages_file.tell()
+
+        descriptor, temp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(descriptor, "w") as temp_file:
+            json.dump({"after": after, "size": size}, temp_file)
+        os.replace(temp_path, self._state_file)
+
+    def clear(self):
+        """Deletes the job's progress, e.g., once it has completed."""
+        shutil.rmtree(self.path, ignore_errors=True)
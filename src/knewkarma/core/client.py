@@ -1,12 +1,20 @@
+import functools
+import os
+import threading
 import typing as t
 from platform import platform, python_version
 
-import praw
-
 from karmakrate.handlers.auth_handler import AuthHandler
+from karmakrate.handlers.io_handlers import FileHandler
 from ..meta.about import Project
 from ..meta.version import Version
 
+if t.TYPE_CHECKING:
+    import praw
+
+    from .existence import ExistenceCache
+    from .watermark import WatermarkStore
+
 USER_AGENT: str = (
     f"{Project.name.replace(' ', '-')}/{Version.release} "
     f"(Python {python_version} on {platform}; +{Project.documentation})"
@@ -15,8 +23,218 @@ LISTINGS = t.Literal["controversial", "gilded", "hot", "new", "rising", "top"]
 TIME_FILTERS = t.Literal["all", "hour", "day", "week", "month", "year"]
 SORT = t.Literal["relevance", "hot", "top", "new", "lucene", "all"]
 
-reddit = praw.Reddit(
-    client_id=AuthHandler.read()["client_id"],
-    client_secret=AuthHandler.read()["client_secret"],
-    user_agent=USER_AGENT,
+# Database through which processes share a rate-limit budget, see :func:`configure`.
+RATELIMIT_DB: str = os.path.join(FileHandler.PARENT_DIR, "ratelimit.sqlite3")
+# Access tokens reused across runs until they expire, next to the credentials they belong to.
+TOKEN_CACHE: str = os.path.join(FileHandler.AUTH_DIR, "tokens.json")
+
+# Database of cached API responses, see :func:`configure`.
+RESPONSE_CACHE: str = os.path.join(FileHandler.PARENT_DIR, "cache", "responses.sqlite3")
+# Where existence checks are persisted when the response cache is enabled.
+EXISTENCE_CACHE: str = os.path.join(
+    FileHandler.PARENT_DIR, "cache", "existence.sqlite3"
 )
+# Newest items seen per listing, for incremental runs, see :func:`configure`.
+WATERMARKS: str = os.path.join(FileHandler.PARENT_DIR, "watermarks.json")
+
+_settings: t.Dict[str, t.Any] = {
+    "shared_ratelimit": False,
+    "response_cache": False,
+    "resume": False,
+    "incremental": False,
+}
+
+
+def configure(
+    shared_ratelimit: t.Optional[bool] = None,
+    response_cache: t.Optional[bool] = None,
+    resume: t.Optional[bool] = None,
+    incremental: t.Optional[bool] = None,
+):
+    """
+    Changes how the shared client is built. Takes effect the next time :func:`pool` is built.
+
+    :param shared_ratelimit: Whether to share one rate-limit budget (per OAuth app) with every
+        other process on this host that has it enabled, instead of assuming the whole budget.
+    :type shared_ratelimit: t.Optional[bool]
+    :param response_cache: Whether to serve repeated GET requests from an on-disk cache, and
+        persist existence checks across runs.
+    :type response_cache: t.Optional[bool]
+    :param resume: Whether paginated crawls save a checkpoint as they go, and pick up from the
+        one an interrupted run left behind, instead of starting over.
+    :type resume: t.Optional[bool]
+    :param incremental: Whether chronological listings stop at the newest item an earlier run
+        fetched, instead of being read up to the limit.
+    :type incremental: t.Optional[bool]
+    """
+    if shared_ratelimit is not None:
+        _settings["shared_ratelimit"] = shared_ratelimit
+    if response_cache is not None:
+        _settings["response_cache"] = response_cache
+    if resume is not None:
+        _settings["resume"] = resume
+    if incremental is not None:
+        _settings["incremental"] = incremental
+
+    pool.cache_clear()
+    existence_cache.cache_clear()
+
+
+def setting(name: str) -> t.Any:
+    """
+    :param name: Name of a setting, as passed to :func:`configure`.
+    :type name: str
+    :return: The setting's current value.
+    :rtype: t.Any
+    """
+    return _settings[name]
+
+
+class ClientPool:
+    """
+    Spreads requests across one authenticated client per registered app.
+
+    Every client paces itself with its own token bucket, which doubles as its health state: a
+    client whose budget is spent, or that is cooling down after throttled or failed requests,
+    is passed over until it is ready again.
+    """
+
+    def __init__(
+        self,
+        credentials: t.List[t.Dict[str, str]],
+        shared_ratelimit: bool,
+        response_cache: bool = False,
+    ):
+        """
+        :param credentials: Credentials of every app to build a client for.
+        :type credentials: t.List[t.Dict[str, str]]
+        :param shared_ratelimit: Whether each app's budget is shared with other processes.
+        :type shared_ratelimit: bool
+        :param response_cache: Whether to cache GET responses on disk.
+        :type response_cache: bool
+        """
+        import praw
+
+        from .response_cache import ResponseCache
+        from .scheduler import ScheduledRequestor, SharedTokenBucket, TokenBucket
+        from .token_cache import TokenCache
+
+        self.buckets: t.List[TokenBucket] = []
+        self.clients: t.List[praw.Reddit] = []
+        self.response_cache: t.Optional[ResponseCache] = (
+            ResponseCache(path=RESPONSE_CACHE) if response_cache else None
+        )
+        token_cache = TokenCache(path=TOKEN_CACHE)
+
+        for credential in credentials:
+            bucket: TokenBucket = (
+                SharedTokenBucket(path=RATELIMIT_DB, key=credential["client_id"])
+                if shared_ratelimit
+                else TokenBucket()
+            )
+            self.buckets.append(bucket)
+            self.clients.append(
+                praw.Reddit(
+                    client_id=credential["client_id"],
+                    client_secret=credential["client_secret"],
+                    user_agent=USER_AGENT,
+                    requestor_class=ScheduledRequestor,
+                    requestor_kwargs={
+                        "bucket": bucket,
+                        "token_cache": token_cache,
+                        "response_cache": self.response_cache,
+                    },
+                )
+            )
+
+        self._next: int = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def next(self) -> "praw.Reddit":
+        """
+        :return: The next ready client in round-robin order, or the one that will be ready
+            soonest if none are.
+        :rtype: praw.Reddit
+        """
+        if len(self.clients) == 1:
+            return self.clients[0]
+
+        with self._lock:
+            start: int = self._next
+            self._next = (self._next + 1) % len(self.clients)
+
+        soonest, soonest_delay = start, float("inf")
+        for offset in range(len(self.clients)):
+            index: int = (start + offset) % len(self.clients)
+            delay: float = self.buckets[index].delay()
+            if delay <= 0:
+                return self.clients[index]
+            if delay < soonest_delay:
+                soonest, soonest_delay = index, delay
+
+        return self.clients[soonest]
+
+
+@functools.cache
+def pool() -> ClientPool:
+    """
+    Returns the shared client pool, building it on first use.
+
+    The pool (and praw itself) is only loaded once a command actually talks to
+    the API, so credentials are read once per process, and commands like
+    ``--version`` or ``license`` never touch them. Requests go through a
+    :class:`~knewkarma.core.scheduler.ScheduledRequestor`, which paces them to
+    each app's rate-limit budget and retries throttled ones, and optionally
+    serve repeated requests from a shared response cache.
+
+    :return: A memoized ``ClientPool`` instance.
+    :rtype: ClientPool
+    """
+    return ClientPool(
+        credentials=AuthHandler.read_all(),
+        shared_ratelimit=_settings["shared_ratelimit"],
+        response_cache=_settings["response_cache"],
+    )
+
+
+@functools.cache
+def existence_cache() -> "ExistenceCache":
+    """
+    Returns the process-wide cache of user and subreddit existence checks, persisted to disk
+    when the response cache is enabled.
+
+    :return: A memoized ``ExistenceCache`` instance.
+    :rtype: ExistenceCache
+    """
+    from .existence import ExistenceCache
+
+    return ExistenceCache(path=EXISTENCE_CACHE if _settings["response_cache"] else None)
+
+
+@functools.cache
+def watermarks() -> "WatermarkStore":
+    """
+    Returns the process-wide store of listing watermarks, used by incremental runs.
+
+    :return: A memoized ``WatermarkStore`` instance.
+    :rtype: WatermarkStore
+    """
+    from .watermark import WatermarkStore
+
+    return WatermarkStore(path=WATERMARKS)
+
+
+def reddit() -> "praw.Reddit":
+    """
+    Returns a Reddit client from the shared pool.
+
+    With a single set of credentials this is always the same client; with several, successive
+    calls rotate through them, so aggregate throughput scales with the number of apps.
+
+    :return: A ``praw.Reddit`` instance.
+    :rtype: praw.Reddit
+    """
+    return pool().next()
@@ -0,0 +1,165 @@
+import typing as t
+from array import array
+
+if t.TYPE_CHECKING:
+    from praw.models import Comment, Submission
+
+__all__ = ["CommentTree"]
+
+
+class CommentTree:
+    """
+    A compact, read-only comment tree, stored as parallel arrays in depth-first order.
+
+    Each comment is a row index into the arrays. Because rows are in depth-first order, the
+    replies under row ``i`` are exactly the rows in ``subtree(i)``, so child ranges are found in
+    O(1), and no per-comment objects are kept around. Repeated author names and bodies
+    (e.g., ``[deleted]``) share a single string.
+    """
+
+    def __init__(self, submission_id: str, subreddit: str, base_permalink: str):
+        """
+        :param submission_id: ID of the submission the comments belong to.
+        :type submission_id: str
+        :param subreddit: Prefixed name of the submission's subreddit (e.g., ``r/python``).
+        :type subreddit: str
+        :param base_permalink: Permalink of the submission, which comment ids are appended to.
+        :type base_permalink: str
+        """
+        self.submission_id = submission_id
+        self.subreddit = subreddit
+        self.base_permalink = base_permalink
+
+        self.ids: t.List[str] = []
+        self.parents: array = array("l")
+        self.depths: array = array("l")
+        self.scores: array = array("q")
+        self.created_utc: array = array("d")
+        self.reply_counts: array = array("l")
+        self.award_counts: array = array("l")
+        self.authors: t.List[t.Optional[str]] = []
+        self.bodies: t.List[str] = []
+
+        self._ends: array = array("l")
+        self._strings: t.Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_comments(
+        cls, submission: "Submission", comments: t.Iterable["Comment"]
+    ) -> "CommentTree":
+        """
+        Builds a tree from comments in depth-first order, such as the output of ``Post.comments``.
+
+        Only loaded attributes are read, so building the tree makes no network requests.
+
+        :param submission: The submission the comments belong to.
+        :type submission: Submission
+        :param comments: Comments in depth-first order (every reply after its parent).
+        :type comments: t.Iterable[Comment]
+        :return: The compact comment tree.
+        :rtype: CommentTree
+        """
+        tree = cls(
+            submission_id=submission.id,
+            subreddit=vars(submission).get("subreddit_name_prefixed", ""),
+            base_permalink=vars(submission).get("permalink", ""),
+        )
+        index_of: t.Dict[str, int] = {}
+
+        for comment in comments:
+            data: t.Dict[str, t.Any] = vars(comment)
+            parent: int = index_of.get(data.get("parent_id"), -1)
+            author = data.get("author")
+
+            index_of[data["name"]] = len(tree.ids)
+            tree.ids.append(data["id"])
+            tree.parents.append(parent)
+            tree.depths.append(0 if parent == -1 else tree.depths[parent] + 1)
+            tree.scores.append(data.get("score") or 0)
+            tree.created_utc.append(data.get("created_utc") or 0.0)
+            tree.reply_counts.append(data.get("_reply_count", -1))
+            tree.award_counts.append(len(data.get("all_awardings") or []))
+            tree.authors.append(
+                None
+                if author is None
+                else tree._intern(getattr(author, "name", author))
+            )
+            tree.bodies.append(tree._intern(data.get("body") or ""))
+
+        tree._index_subtrees()
+        return tree
+
+    def _intern(self, value: str) -> str:
+        return self._strings.setdefault(value, value)
+
+    def _index_subtrees(self):
+        """Records where each row's subtree ends, and fills in any missing reply counts."""
+        self._ends = array("l", [len(self.ids)] * len(self.ids))
+        open_rows: t.List[int] = []
+
+        for index, depth in enumerate(self.depths):
+            while open_rows and self.depths[open_rows[-1]] >= depth:
+                self._ends[open_rows.pop()] = index
+            open_rows.append(index)
+
+        for index, reply_count in enumerate(self.reply_counts):
+            if reply_count == -1:
+                self.reply_counts[index] = self._ends[index] - index - 1
+
+    def subtree(self, index: int) -> range:
+        """
+        Returns the rows of every reply under a comment, at any depth.
+
+        :param index: Row of the comment.
+        :type index: int
+        :return: Range of reply rows.
+        :rtype: range
+        """
+        return range(index + 1, self._ends[index])
+
+    def children(self, index: int) -> t.Iterator[int]:
+        """
+        Yields the rows of a comment's direct replies.
+
+        :param index: Row of the comment, or -1 for top-level comments.
+        :type index: int
+        :return: A generator of reply rows.
+        :rtype: t.Iterator[int]
+        """
+        row, end = (0, len(self.ids)) if index == -1 else (index + 1, self._ends[index])
+        while row < end:
+            yield row
+            row = self._ends[row]
+
+    def permalink(self, index: int) -> str:
+        """
+        :param index: Row of the comment.
+        :type index: int
+        :return: Permalink of the comment.
+        :rtype: str
+        """
+        return f"{self.base_permalink}{self.ids[index]}/"
+
+    def to_columns(self) -> t.Dict[str, t.Sequence]:
+        """
+        :return: The tree as columns, for building a DataFrame without per-row dictionaries.
+        :rtype: t.Dict[str, t.Sequence]
+        """
+        return {
+            "id": self.ids,
+            "parent_id": [
+                f"t1_{self.ids[parent]}" if parent != -1 else f"t3_{self.submission_id}"
+                for parent in self.parents
+            ],
+            "depth": self.depths,
+            "author": self.authors,
+            "body": self.bodies,
+            "score": self.scores,
+            "created_utc": self.created_utc,
+            "reply_count": self.reply_counts,
+            "award_count": self.award_counts,
+            "permalink": [self.permalink(index=index) for index in range(len(self))],
+        }
@@ -0,0 +1,129 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import typing as t
+
+from prawcore import exceptions
+
+from .client import existence_cache, reddit
+
+__all__ = ["ExistenceCache", "probe"]
+
+
+class ExistenceCache:
+    """
+    Remembers whether users and subreddits exist, along with the ``about`` payload the answer
+    came from, so a name is probed at most once while its entry is fresh.
+
+    Entries live in memory for the whole process, and are optionally persisted to SQLite so
+    later runs can reuse them. Negative entries expire sooner than positive ones, as a missing
+    name is more likely to be claimed than an existing one is to disappear.
+    """
+
+    POSITIVE_TTL: int = 60 * 60
+    NEGATIVE_TTL: int = 10 * 60
+
+    def __init__(self, path: t.Optional[str] = None):
+        """
+        :param path: Optional path to a SQLite database to persist entries to.
+        :type path: t.Optional[str]
+        """
+        self.path = path
+        # (kind, lowercased name) -> (checked_at, about payload or None)
+        self._entries: t.Dict[t.Tuple[str, str], t.Tuple] = {}
+        self._lock = threading.Lock()
+        self._connection: t.Optional[sqlite3.Connection] = None
+
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self._connection = sqlite3.connect(
+                path, timeout=30, isolation_level=None, check_same_thread=False
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("""
+                CREATE TABLE IF NOT EXISTS existence (
+                    kind TEXT, name TEXT, checked_at REAL, about TEXT,
+                    PRIMARY KEY (kind, name)
+                )
+                """)
+
+    def get(
+        self, kind: str, name: str
+    ) -> t.Optional[t.Tuple[bool, t.Optional[t.Dict]]]:
+        """
+        :param kind: Kind of thing the name belongs to (``"user"`` or ``"subreddit"``).
+        :type kind: str
+        :param name: The name to look up.
+        :type name: str
+        :return: ``(exists, about)`` if there is a fresh entry for the name, otherwise None.
+        :rtype: t.Optional[t.Tuple[bool, t.Optional[t.Dict]]]
+        """
+        key: t.Tuple[str, str] = (kind, name.lower())
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and self._connection is not None:
+                row = self._connection.execute(
+                    "SELECT checked_at, about FROM existence WHERE kind = ? AND name = ?",
+                    key,
+                ).fetchone()
+                if row is not None:
+                    entry = row[0], json.loads(row[1]) if row[1] else None
+                    self._entries[key] = entry
+
+        if entry is None:
+            return None
+
+        checked_at, about = entry
+        ttl: int = self.POSITIVE_TTL if about is not None else self.NEGATIVE_TTL
+        if time.time() - checked_at >= ttl:
+            return None
+
+        return about is not None, about
+
+    def set(self, kind: str, name: str, about: t.Optional[t.Dict]):
+        """
+        :param kind: Kind of thing the name belongs to (``"user"`` or ``"subreddit"``).
+        :type kind: str
+        :param name: The probed name.
+        :type name: str
+        :param about: The name's ``about`` payload, or None if it does not exist.
+        :type about: t.Optional[t.Dict]
+        """
+        key: t.Tuple[str, str] = (kind, name.lower())
+        checked_at: float = time.time()
+        with self._lock:
+            self._entries[key] = checked_at, about
+            if self._connection is not None:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO existence VALUES (?, ?, ?, ?)",
+                    (*key, checked_at, json.dumps(about) if about else None),
+                )
+
+
+def probe(kind: str, name: str, path: str) -> t.Optional[t.Dict]:
+    """
+    Gets a user's or subreddit's ``about`` payload, through the shared existence cache.
+
+    :param kind: Kind of thing the name belongs to (``"user"`` or ``"subreddit"``).
+    :type kind: str
+    :param name: The name to probe.
+    :type name: str
+    :param path: API path of the name's ``about`` endpoint.
+    :type path: str
+    :return: The raw ``about`` payload, or None if the name does not exist (or is private).
+    :rtype: t.Optional[t.Dict]
+    """
+    cache: ExistenceCache = existence_cache()
+    cached = cache.get(kind=kind, name=name)
+    if cached is not None:
+        return cached[1]
+
+    try:
+        about: t.Optional[t.Dict] = reddit().request(method="GET", path=path)
+    except (exceptions.Redirect, exceptions.NotFound, exceptions.Forbidden):
+        about = None
+
+    cache.set(kind=kind, name=name, about=about)
+    return about
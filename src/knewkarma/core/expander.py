@@ -0,0 +1,278 @@
+import typing as t
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from praw.models import Comment, MoreComments, Submission
+from rich.status import Status
+
+from .client import reddit
+
+__all__ = ["CommentExpander"]
+
+
+class CommentExpander:
+    """
+    Expands a submission's 'MoreComments' stubs with bounded concurrency.
+
+    Instead of resolving stubs one at a time like PRAW does, the ids hidden behind every known stub
+    are pooled and fetched from ``/api/morechildren`` in batches of up to :attr:`BATCH_SIZE`, and
+    'continue this thread' stubs are loaded from their parent comment's permalink, with up to
+    ``max_workers`` requests in flight at once. Stubs discovered in a response are queued right
+    away, so the pool stays busy until the thread is exhausted or a budget runs out.
+    """
+
+    # Maximum number of comment ids /api/morechildren accepts per request.
+    BATCH_SIZE: int = 100
+
+    def __init__(
+        self,
+        submission: Submission,
+        max_workers: int = 4,
+        max_requests: t.Optional[int] = None,
+        max_depth: t.Optional[int] = None,
+        max_comments: t.Optional[int] = None,
+    ):
+        """
+        :param submission: The submission whose comment tree to expand.
+        :type submission: Submission
+        :param max_workers: Maximum number of expansion requests in flight at once.
+        :type max_workers: int
+        :param max_requests: Maximum number of expansion requests to make (None for no limit).
+        :type max_requests: t.Optional[int]
+        :param max_depth: Stubs nested deeper than this are left unexpanded (None for no limit).
+        :type max_depth: t.Optional[int]
+        :param max_comments: Stop requesting more comments once this many have been loaded
+            (None for no limit).
+        :type max_comments: t.Optional[int]
+        """
+        self._submission = submission
+        self._max_workers = max(1, max_workers)
+        self._max_requests = max_requests
+        self._max_depth = max_depth
+        self._max_comments = max_comments
+
+        self._requests_made: int = 0
+        self._comment_count: int = 0
+
+        # Child nodes (comments and stubs) of every loaded comment, keyed by parent fullname.
+        self._children: t.Dict[str, t.List[t.Union[Comment, MoreComments]]] = {}
+        # What each resolved stub is replaced with, keyed by id() of the stub.
+        self._expansions: t.Dict[int, t.List[t.Optional[Comment]]] = {}
+        # Where a comment id requested from /api/morechildren goes: (stub, index in stub.children).
+        self._slots: t.Dict[str, t.Tuple[MoreComments, int]] = {}
+        self._fetched_ids: t.Set[str] = set()
+
+        self._id_queue: t.Deque[str] = deque()
+        self._thread_queue: t.Deque[MoreComments] = deque()
+
+    def expand(self, status: t.Optional[Status] = None) -> t.List[Comment]:
+        """
+        Expands the comment tree within the configured budgets.
+
+        Every returned comment has its replies rebuilt from the expanded tree (unexpanded stubs
+        included), and a ``_reply_count`` of all replies under it, so the result can be rendered
+        without further requests.
+
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: Flat, depth-first list of all loaded comments.
+        :rtype: t.List[Comment]
+        """
+        top_level = list(self._submission.comments)
+        self._children[self._submission.fullname] = top_level
+        self._register(nodes=top_level)
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            in_flight: t.Dict[Future, t.Tuple[str, t.Any]] = {}
+
+            while True:
+                while len(in_flight) < self._max_workers and self._can_request():
+                    job = self._next_job()
+                    if job is None:
+                        break
+
+                    kind, payload = job
+                    fetch = (
+                        self._fetch_children
+                        if kind == "children"
+                        else self._fetch_thread
+                    )
+                    in_flight[executor.submit(fetch, payload)] = job
+                    self._requests_made += 1
+
+                if not in_flight:
+                    break
+
+                if isinstance(status, Status):
+                    status.update(
+                        f"Expanding comments from post {self._submission.id} "
+                        f"({self._comment_count} loaded, {self._requests_made} requests)..."
+                    )
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, payload = in_flight.pop(future)
+                    if kind == "children":
+                        self._merge_children(ids=payload, things=future.result())
+                    else:
+                        self._merge_thread(stub=payload, replies=future.result())
+
+        return self._flatten()
+
+    def _can_request(self) -> bool:
+        if self._max_requests is not None and self._requests_made >= self._max_requests:
+            return False
+        if self._max_comments is not None and self._comment_count >= self._max_comments:
+            return False
+        return True
+
+    def _next_job(self) -> t.Optional[t.Tuple[str, t.Any]]:
+        if self._id_queue:
+            batch_size: int = min(self.BATCH_SIZE, len(self._id_queue))
+            return "children", [self._id_queue.popleft() for _ in range(batch_size)]
+        if self._thread_queue:
+            return "thread", self._thread_queue.popleft()
+        return None
+
+    def _fetch_children(
+        self, ids: t.List[str]
+    ) -> t.List[t.Union[Comment, MoreComments]]:
+        return reddit().post(
+            "api/morechildren/",
+            data={
+                "children": ",".join(ids),
+                "link_id": self._submission.fullname,
+                "sort": self._submission.comment_sort,
+            },
+        )
+
+    def _fetch_thread(
+        self, stub: MoreComments
+    ) -> t.List[t.Union[Comment, MoreComments]]:
+        _, comments = reddit().get(
+            f"comments/{self._submission.id}/_/{stub.parent_id.split('_', 1)[1]}",
+            params={"sort": self._submission.comment_sort},
+        )
+        parent: Comment = comments.children[0]
+        return list(parent._replies)
+
+    def _register(self, nodes: t.List[t.Union[Comment, MoreComments]]):
+        """Records every comment in a loaded subtree, queueing any stubs found in it."""
+        pending = deque(nodes)
+        while pending:
+            node = pending.popleft()
+            if isinstance(node, MoreComments):
+                self._enqueue(stub=node)
+            else:
+                self._comment_count += 1
+                node._submission = self._submission
+                replies = list(node._replies)
+                self._children.setdefault(node.name, []).extend(replies)
+                pending.extend(replies)
+
+    def _enqueue(self, stub: MoreComments):
+        depth: int = vars(stub).get("depth", 0)
+        if self._max_depth is not None and depth > self._max_depth:
+            return
+
+        if stub.children:
+            self._expansions[id(stub)] = [None] * len(stub.children)
+            for index, comment_id in enumerate(stub.children):
+                self._slots[comment_id] = (stub, index)
+                self._id_queue.append(comment_id)
+        elif stub.parent_id.startswith("t1_"):
+            # A 'continue this thread' stub, with no ids of its own.
+            self._thread_queue.append(stub)
+
+    def _merge_children(
+        self, ids: t.List[str], things: t.List[t.Union[Comment, MoreComments]]
+    ):
+        self._fetched_ids.update(ids)
+
+        for thing in things:
+            slot: t.Optional[t.Tuple[MoreComments, int]] = (
+                self._slots.get(thing.id) if isinstance(thing, Comment) else None
+            )
+            if slot is not None and slot[0].parent_id == thing.parent_id:
+                stub, index = self._slots.pop(thing.id)
+                self._expansions[id(stub)][index] = thing
+            else:
+                # /api/morechildren returns a flat list, so deeper comments (including ones a
+                # stub lists among its own ids) and new stubs are attached to their parents,
+                # which always precede them in the response.
+                self._children.setdefault(thing.parent_id, []).append(thing)
+
+            self._register(nodes=[thing])
+
+    def _merge_thread(
+        self, stub: MoreComments, replies: t.List[t.Union[Comment, MoreComments]]
+    ):
+        self._expansions[id(stub)] = replies
+        self._register(nodes=replies)
+
+    def _resolve(
+        self, nodes: t.List[t.Union[Comment, MoreComments]]
+    ) -> t.List[t.Union[Comment, MoreComments]]:
+        """Replaces expanded stubs with what they expanded into."""
+        resolved: t.List[t.Union[Comment, MoreComments]] = []
+
+        for node in nodes:
+            expansion = (
+                self._expansions.get(id(node))
+                if isinstance(node, MoreComments)
+                else None
+            )
+            if expansion is None:
+                resolved.append(node)
+                continue
+
+            resolved.extend(
+                self._resolve([item for item in expansion if item is not None])
+            )
+            unfetched: t.List[str] = [
+                comment_id
+                for comment_id in node.children
+                if comment_id not in self._fetched_ids
+            ]
+            if unfetched:
+                # A budget ran out before the whole stub was fetched, so it is kept for the rest.
+                node.count = max(
+                    len(unfetched),
+                    (node.count or 0) - (len(node.children) - len(unfetched)),
+                )
+                node.children = unfetched
+                resolved.append(node)
+
+        return resolved
+
+    def _flatten(self) -> t.List[Comment]:
+        flat: t.List[Comment] = []
+        stack = list(
+            reversed(self._resolve(self._children.get(self._submission.fullname, [])))
+        )
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, MoreComments):
+                continue
+
+            flat.append(node)
+            replies = self._resolve(self._children.get(node.name, []))
+            node._replies = replies
+            stack.extend(reversed(replies))
+
+        # Depth-first order lists every reply after its parent, so walking it backwards
+        # totals each subtree before the comment that owns it.
+        reply_counts: t.Dict[str, int] = {}
+        for comment in reversed(flat):
+            reply_count: int = 0
+            for reply in comment._replies:
+                if isinstance(reply, MoreComments):
+                    reply_count += reply.count or 0
+                else:
+                    reply_count += 1 + reply_counts[reply.name]
+
+            reply_counts[comment.name] = reply_count
+            comment._reply_count = reply_count
+
+        return flat
@@ -0,0 +1,292 @@
+import time
+import typing as t
+
+from rich.status import Status
+
+from .checkpoint import Checkpoint
+from .client import reddit, setting, watermarks
+from .watermark import Span, Watermark
+
+__all__ = ["PAGE_SIZE", "MAX_AGES", "Predicates", "paginate", "time_window"]
+
+# Reddit serves at most 100 items per listing request.
+PAGE_SIZE: int = 100
+
+# Oldest an item may be (in seconds) to fall within each time filter.
+MAX_AGES: t.Dict[str, t.Optional[int]] = {
+    "hour": 60 * 60,
+    "day": 24 * 60 * 60,
+    "week": 7 * 24 * 60 * 60,
+    "month": 30 * 24 * 60 * 60,
+    "year": 365 * 24 * 60 * 60,
+    "all": None,
+}
+
+
+class Predicates(t.NamedTuple):
+    """Conditions listing items (posts or comments) must meet, see :func:`paginate`."""
+
+    # Maximum age, in seconds.
+    max_age: t.Optional[float] = None
+    min_score: t.Optional[int] = None
+    # Lowercased usernames, any of which the author must be.
+    authors: t.Optional[t.FrozenSet[str]] = None
+    # Lowercased flair texts, any of which the post's flair must be.
+    flairs: t.Optional[t.FrozenSet[str]] = None
+
+    def exhausted(self, item: t.Any) -> bool:
+        """
+        :param item: A listing item.
+        :type item: t.Any
+        :return: Whether the item is older than :attr:`max_age`.
+        :rtype: bool
+        """
+        return (
+            self.max_age is not None
+            and time.time() - getattr(item, "created_utc", 0) > self.max_age
+        )
+
+    def matches(self, item: t.Any) -> bool:
+        """
+        :param item: A listing item.
+        :type item: t.Any
+        :return: Whether the item meets every condition.
+        :rtype: bool
+        """
+        if self.exhausted(item):
+            return False
+        if self.min_score is not None and getattr(item, "score", 0) < self.min_score:
+            return False
+        if (
+            self.authors is not None
+            and str(getattr(item, "author", None)).lower() not in self.authors
+        ):
+            return False
+        if (
+            self.flairs is not None
+            and str(getattr(item, "link_flair_text", None)).lower() not in self.flairs
+        ):
+            return False
+
+        return True
+
+
+def time_window(
+    listing: str, time_filter: str, where: t.Optional[Predicates] = None
+) -> t.Tuple[t.Dict[str, str], t.Optional[Predicates]]:
+    """
+    Applies a time filter to a listing: through the ``t`` parameter where Reddit supports it
+    (``top`` and ``controversial``), otherwise as a maximum age checked by :func:`paginate`.
+
+    :param listing: The listing (e.g., ``"new"``, ``"top"``, ``"comments"``).
+    :type listing: str
+    :param time_filter: The time filter (e.g., ``"day"``).
+    :type time_filter: str
+    :param where: Other conditions items must meet.
+    :type where: t.Optional[Predicates]
+    :return: The query parameters to send, and the conditions to pass to :func:`paginate`.
+    :rtype: t.Tuple[t.Dict[str, str], t.Optional[Predicates]]
+    """
+    if listing in ["top", "controversial"]:
+        return {"t": time_filter}, where
+
+    max_age: t.Optional[int] = MAX_AGES[time_filter]
+    if max_age is not None:
+        where = (where or Predicates())._replace(max_age=max_age)
+    return {}, where
+
+
+def paginate(
+    endpoint: str,
+    limit: t.Optional[int],
+    params: t.Optional[t.Dict[str, t.Any]] = None,
+    status: t.Optional[Status] = None,
+    watermark: t.Optional[t.Tuple[str, str, str]] = None,
+    where: t.Optional[Predicates] = None,
+    newest_first: bool = False,
+) -> t.Iterator[t.Any]:
+    """
+    Walks a Reddit listing endpoint with its ``after`` cursor, yielding items as each page arrives.
+
+    Pages are requested :data:`PAGE_SIZE` items at a time (or fewer, if the limit is closer), and
+    nothing is kept in memory once it has been yielded, so the first item is available after one
+    round trip, and memory stays constant regardless of the limit. Items repeated across pages
+    (as listings shift while they are walked) are yielded once.
+
+    With ``resume`` enabled (see :func:`~knewkarma.core.client.configure`), every page is also
+    saved to a :class:`~knewkarma.core.checkpoint.Checkpoint`, which is cleared once the walk
+    completes. If the walk is interrupted, running it again with ``resume`` enabled replays the
+    saved pages and continues from the last cursor, instead of fetching them again.
+
+    Chronological (newest first) listings can also be given a ``watermark`` key. With
+    ``incremental`` enabled, the walk then stops at the first item the last completed walk of
+    the same key had already reached, so frequent polls usually cost a single page. A walk the
+    limit cuts short before then doesn't move the watermark, but remembers the span it fetched:
+    the next walk skips that span and carries on below it, so no item is ever passed over.
+
+    Items are checked against ``where`` as each page arrives. On newest-first listings, the
+    first item older than ``where.max_age`` ends the walk, so a recent window costs only the
+    pages it spans, rather than a fixed number of items.
+
+    :param endpoint: API path of the listing, relative to the OAuth host (e.g., ``"r/python/new"``).
+    :type endpoint: str
+    :param limit: Maximum number of items to yield, or None to walk the listing until it ends.
+    :type limit: t.Optional[int]
+    :param params: Extra query parameters to send with every page request (e.g., ``{"t": "all"}``).
+    :type params: t.Optional[t.Dict[str, t.Any]]
+    :param status: Optional status object for updating progress.
+    :type status: t.Optional[Status]
+    :param watermark: ``(command, target, listing)`` key under which the newest item is
+        remembered, e.g., ``("subreddit", "python", "new")``. Only for newest-first listings.
+    :type watermark: t.Optional[t.Tuple[str, str, str]]
+    :param where: Conditions items must meet to be yielded (and counted towards the limit).
+    :type where: t.Optional[Predicates]
+    :param newest_first: Whether the listing is sorted newest first (e.g., ``new``), in which
+        case the walk stops at the first item too old for ``where.max_age``.
+    :type newest_first: bool
+    :return: A generator of PRAW objects (e.g., ``Submission``, ``Comment``, ``Subreddit``).
+    :rtype: t.Iterator[t.Any]
+    """
+    params = dict(params or {})
+    if where == Predicates():
+        where = None
+    resume: bool = setting("resume")
+    checkpoint = Checkpoint(endpoint=endpoint, params=params, limit=limit)
+    after: t.Optional[str] = None
+    seen: t.Set[str] = set()
+    count: int = 0
+    page_number: int = 0
+
+    # What earlier runs fetched, and the newest and oldest items fetched by this run.
+    incremental: bool = watermark is not None and setting("incremental")
+    mark: t.Optional[Watermark] = None
+    span: t.Optional[Span] = None
+    if incremental:
+        mark, span = watermarks().get(watermark)
+    newest: t.Optional[Watermark] = None
+    oldest: t.Optional[Watermark] = None
+    # Whether the walk reached the span, read everything down to the mark, or hit the limit
+    # with items left.
+    joined: bool = False
+    complete: bool = False
+    cut_short: bool = False
+
+    def finish(ended: bool):
+        checkpoint.clear()
+        if not incremental:
+            return
+
+        if complete or (ended and not cut_short):
+            # Everything down to the watermark was fetched, so it moves up to the newest item.
+            top: t.Optional[Watermark] = Watermark.newer(
+                span.newest if span else mark, newest
+            )
+            if (top, None) != (mark, span):
+                watermarks().set(watermark, top)
+        elif newest is not None:
+            top, bottom = newest, oldest
+            if span is not None and joined:
+                # The walk ran on into the span, so together they are one span.
+                top = Watermark.newer(span.newest, newest)
+                bottom = Watermark.older(span.oldest, oldest)
+            # Only one span is remembered; one the walk didn't reach is fetched again later.
+            watermarks().set(watermark, mark, Span(newest=top, oldest=bottom))
+
+    def emit(items: t.Iterable[t.Any]) -> t.Generator[t.Any, None, bool]:
+        """Yields the items that pass, and returns whether the walk is over."""
+        nonlocal count, newest, oldest, joined, complete, cut_short
+        for item in items:
+            if span is not None and span.newest.covers(item):
+                joined = True
+            if limit is not None and count >= limit:
+                cut_short = True
+                return True
+            if mark is not None and mark.covers(item):
+                # Everything from here on was fetched by an earlier run.
+                complete = True
+                return True
+            if span is not None and span.covers(item):
+                # Fetched by an earlier run that its limit cut short.
+                continue
+            if where is not None and not where.matches(item):
+                if newest_first and where.exhausted(item):
+                    # Everything from here on is older still.
+                    complete = True
+                    return True
+                continue
+
+            if incremental:
+                newest = Watermark.advance(mark=newest, item=item)
+                oldest = Watermark.retreat(mark=oldest, item=item)
+            count += 1
+            yield item
+
+        return limit is not None and count >= limit
+
+    if resume and checkpoint.exists():
+        for raw_page in checkpoint.pages():
+            page_number += 1
+            if isinstance(status, Status):
+                status.update(f"Replaying saved pages of {endpoint}...")
+
+            if (yield from emit(_new_items(page=_objectify(raw_page), seen=seen))):
+                finish(ended=False)
+                return
+
+        after = checkpoint.state()["after"]
+        if not after:
+            finish(ended=True)
+            return
+    else:
+        checkpoint.clear()
+
+    while True:
+        page_number += 1
+        page_params: t.Dict[str, t.Any] = {
+            **params,
+            # Filtered walks can't tell how many items of a page will pass, so read full ones.
+            "limit": (
+                PAGE_SIZE
+                if limit is None or where is not None
+                else min(PAGE_SIZE, limit - count)
+            ),
+        }
+        if after:
+            page_params["after"] = after
+            page_params["count"] = len(seen)
+
+        if isinstance(status, Status):
+            status.update(f"Getting {endpoint} (page {page_number})...")
+
+        raw_page: t.Dict[str, t.Any] = reddit().request(
+            method="GET", path=endpoint, params=page_params
+        )
+        page = _objectify(raw_page)
+        children: t.List[t.Any] = getattr(page, "children", [])
+        after = getattr(page, "after", None)
+
+        new_items: t.List[t.Any] = list(_new_items(page=page, seen=seen))
+        if resume:
+            checkpoint.save_page(page=raw_page, after=after)
+
+        if (yield from emit(new_items)) or not after or not children:
+            break
+
+    finish(ended=not after or not children)
+
+
+def _objectify(raw_page: t.Dict[str, t.Any]) -> t.Any:
+    """Turns a raw listing page into PRAW objects, as ``Reddit.get`` would."""
+    return reddit()._objector.objectify(raw_page)
+
+
+def _new_items(page: t.Any, seen: t.Set[str]) -> t.Iterator[t.Any]:
+    """Yields the items of a page not seen before, marking them as seen."""
+    for item in getattr(page, "children", []):
+        fullname: t.Optional[str] = getattr(item, "fullname", None)
+        if fullname in seen:
+            continue
+        if fullname is not None:
+            seen.add(fullname)
+
+        yield item
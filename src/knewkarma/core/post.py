@@ -1,22 +1,154 @@
 import typing as t
 
-from praw.models import Submission, Comment
+from praw.models import Submission
+from praw.models.comment_forest import CommentForest
 from rich.status import Status
 
+from karmakrate.riches import rich_colours
+from karmakrate.riches.rich_logging import console
 from .client import reddit
+from .comment_tree import CommentTree
+from .expander import CommentExpander
+from .shared import bounded_map, chunked
 
 
 class Post:
+    # Maximum number of fullnames /api/info accepts per request.
+    BATCH_SIZE: int = 100
+
     def __init__(self, id: str):
-        self.id = id
-        self._post = reddit.submission(id=id)
+        self.id = self.parse_id(value=id)
+        self._post = reddit().submission(id=self.id)
+
+    @staticmethod
+    def parse_id(value: str) -> str:
+        """
+        :param value: A post id, fullname (``t3_...``) or URL.
+        :type value: str
+        :return: The post's id.
+        :rtype: str
+        """
+        value = value.strip()
+        if "/" in value:
+            return Submission.id_from_url(url=value)
+        if value.startswith("t3_"):
+            return value[3:]
+        return value
+
+    @classmethod
+    def bulk_info(
+        cls, ids: t.Iterable[str], status: t.Optional[Status] = None
+    ) -> t.Iterator[Submission]:
+        """
+        Gets many posts at once, :attr:`BATCH_SIZE` per request through ``/api/info``.
+
+        :param ids: Post ids, fullnames or URLs (e.g., read from a file).
+        :type ids: t.Iterable[str]
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of posts, in input order.
+        :rtype: t.Iterator[Submission]
+        """
+        fetched: int = 0
+        for chunk in chunked(
+            items=dict.fromkeys(cls.parse_id(value=value) for value in ids),
+            size=cls.BATCH_SIZE,
+        ):
+            if isinstance(status, Status):
+                status.update(
+                    f"Getting info from posts {fetched + 1}-{fetched + len(chunk)}..."
+                )
+
+            posts: t.Dict[str, Submission] = {
+                post.id: post
+                for post in reddit().info(fullnames=[f"t3_{id}" for id in chunk])
+            }
+            for id in chunk:
+                if id in posts:
+                    yield posts[id]
+                else:
+                    console.print(
+                        f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} Post {id} was not found"
+                    )
+
+            fetched += len(chunk)
+
+    @classmethod
+    def bulk_comments(
+        cls,
+        ids: t.Iterable[str],
+        status: t.Optional[Status] = None,
+        posts: int = 4,
+        **kwargs,
+    ) -> t.Iterator[CommentTree]:
+        """
+        Gets the comments of many posts, fetching up to ``posts`` of them concurrently.
+
+        :param ids: Post ids, fullnames or URLs (e.g., read from a file).
+        :type ids: t.Iterable[str]
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :param posts: Maximum number of posts whose comments are fetched at once.
+        :type posts: int
+        :param kwargs: Keyword arguments passed on to :meth:`comments`
+            (e.g., ``expand_limit``).
+        :return: A generator of comment trees, in input order.
+        :rtype: t.Iterator[CommentTree]
+        """
+        return bounded_map(
+            func=lambda id: cls(id=id).comments(status=status, **kwargs),
+            items=dict.fromkeys(cls.parse_id(value=value) for value in ids),
+            workers=posts,
+        )
 
     def info(self, status: Status) -> Submission:
         if isinstance(status, Status):
             status.update(f"Getting info from post {self.id}...")
         return self._post
 
-    def comments(self, status: Status) -> t.List[Comment]:
+    def comments(
+        self,
+        status: Status,
+        expand_limit: t.Optional[int] = 0,
+        max_depth: t.Optional[int] = None,
+        max_comments: t.Optional[int] = None,
+        workers: int = 4,
+    ) -> CommentTree:
+        """
+        Retrieves the comments of the post, as a compact comment tree.
+
+        :param status: Optional status object for updating progress.
+        :type status: Status
+        :param expand_limit: Maximum number of 'load more comments' requests to spend expanding
+            the thread (0 keeps only the comments Reddit returns with the post, None expands it
+            completely).
+        :type expand_limit: t.Optional[int]
+        :param max_depth: Leave 'load more comments' stubs nested deeper than this unexpanded.
+        :type max_depth: t.Optional[int]
+        :param max_comments: Stop expanding once this many comments have been loaded.
+        :type max_comments: t.Optional[int]
+        :param workers: Maximum number of expansion requests to run concurrently.
+        :type workers: int
+        :return: Comment tree of the post.
+        :rtype: CommentTree
+        """
         if isinstance(status, Status):
             status.update(f"Getting comments from post {self.id}...")
-        return self._post.comments.list()
+
+        # Expanded once here, so rendering never has to go back to the API for replies.
+        expander = CommentExpander(
+            submission=self._post,
+            max_workers=workers,
+            max_requests=expand_limit,
+            max_depth=max_depth,
+            max_comments=max_comments,
+        )
+        tree = CommentTree.from_comments(
+            submission=self._post, comments=expander.expand(status=status)
+        )
+
+        # The tree holds everything needed from the comments, so the submission drops them,
+        # rather than keeping the whole forest alive for as long as this post is.
+        self._post._comments = CommentForest(self._post)
+        self._post._comments_by_id = {}
+        return tree
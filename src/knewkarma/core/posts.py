@@ -1,10 +1,10 @@
 import typing as t
 
-import requests
 from praw.models import Submission
 from rich.status import Status
 
-from .client import reddit
+from .client import TIME_FILTERS
+from .listing import paginate
 
 
 class Posts:
@@ -13,16 +13,13 @@ class Posts:
     @classmethod
     def best(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="best",
+    ) -> t.Iterator[Submission]:
+        posts = paginate(
+            endpoint="best",
             limit=limit,
-            sort="all",
+            status=status,
         )
 
         return posts
@@ -30,16 +27,15 @@ class Posts:
     @classmethod
     def controversial(
         cls,
-        session: requests.Session,
         limit: int,
+        time_filter: TIME_FILTERS = "all",
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="controversial",
+    ) -> t.Iterator[Submission]:
+        posts = paginate(
+            endpoint="controversial",
             limit=limit,
-            sort="all",
+            params={"t": time_filter},
+            status=status,
         )
 
         return posts
@@ -47,15 +43,13 @@ class Posts:
     @classmethod
     def front_page(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="front_page",
+    ) -> t.Iterator[Submission]:
+        posts = paginate(
+            endpoint="hot",
             limit=limit,
+            status=status,
         )
 
         return posts
@@ -63,16 +57,14 @@ class Posts:
     @classmethod
     def new(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
+    ) -> t.Iterator[Submission]:
 
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="new",
+        posts = paginate(
+            endpoint="new",
             limit=limit,
+            status=status,
         )
 
         return posts
@@ -80,16 +72,15 @@ class Posts:
     @classmethod
     def top(
         cls,
-        session: requests.Session,
         limit: int,
+        time_filter: TIME_FILTERS = "all",
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="top",
+    ) -> t.Iterator[Submission]:
+        posts = paginate(
+            endpoint="top",
             limit=limit,
-            sort="all",
+            params={"t": time_filter},
+            status=status,
         )
 
         return posts
@@ -97,16 +88,13 @@ class Posts:
     @classmethod
     def rising(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        posts = reddit.posts(
-            session=session,
-            status=status,
-            kind="rising",
+    ) -> t.Iterator[Submission]:
+        posts = paginate(
+            endpoint="rising",
             limit=limit,
-            sort="all",
+            status=status,
         )
 
         return posts
@@ -0,0 +1,207 @@
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import typing as t
+
+__all__ = ["CachedResponse", "ResponseCache"]
+
+
+class CachedResponse(t.NamedTuple):
+    status_code: int
+    headers: t.Dict[str, str]
+    content: bytes
+    stored_at: float
+    ttl: int
+
+
+class ResponseCache:
+    """
+    An on-disk (SQLite) cache of API responses, keyed by method, URL and query parameters.
+
+    Fresh entries are served without a request. Stale entries that came with an ``ETag`` or
+    ``Last-Modified`` header are revalidated with a conditional request, so an unchanged payload
+    costs a 304 instead of a full download. The cache is bounded in size, evicting the least
+    recently used entries first.
+    """
+
+    # Seconds a response stays fresh, by the first pattern its URL path matches.
+    TTLS: t.List[t.Tuple[str, int]] = [
+        (r"/about(/|$)", 60 * 60),
+        (r"/(new|rising)(/|$)", 60),
+        (r"/(top|controversial)(/|$)", 10 * 60),
+        (r"^/?comments/", 5 * 60),
+        (r"/search(/|$)", 5 * 60),
+    ]
+    DEFAULT_TTL: int = 5 * 60
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 100 * 1024 * 1024,
+        ttls: t.Optional[t.List[t.Tuple[str, int]]] = None,
+    ):
+        """
+        :param path: Path to the SQLite database holding the cache (created if missing).
+        :type path: str
+        :param max_bytes: Total size of cached bodies above which old entries are evicted.
+        :type max_bytes: int
+        :param ttls: ``(pattern, seconds)`` pairs overriding :attr:`TTLS`.
+        :type ttls: t.Optional[t.List[t.Tuple[str, int]]]
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self._ttls: t.List[t.Tuple[t.Pattern, int]] = [
+            (re.compile(pattern), seconds)
+            for pattern, seconds in (self.TTLS if ttls is None else ttls)
+        ]
+        self.stats: t.Dict[str, int] = {"hits": 0, "misses": 0, "revalidated": 0}
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                status_code INTEGER,
+                headers TEXT,
+                content BLOB,
+                size INTEGER,
+                stored_at REAL,
+                accessed_at REAL,
+                ttl INTEGER
+            )
+            """)
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)"
+        )
+
+    @staticmethod
+    def key(method: str, url: str, params: t.Optional[t.Mapping[str, t.Any]]) -> str:
+        """
+        :return: The cache key of a request.
+        :rtype: str
+        """
+        return json.dumps(
+            [method.upper(), url, sorted((params or {}).items())], default=str
+        )
+
+    def ttl(self, path: str) -> int:
+        """
+        :param path: URL path of a request (e.g., ``/r/python/about``).
+        :type path: str
+        :return: Seconds a response to it stays fresh.
+        :rtype: int
+        """
+        for pattern, seconds in self._ttls:
+            if pattern.search(path):
+                return seconds
+        return self.DEFAULT_TTL
+
+    def get(self, key: str) -> t.Optional[CachedResponse]:
+        """
+        :param key: Cache key of the request.
+        :type key: str
+        :return: The cached response, fresh or stale, if there is one.
+        :rtype: t.Optional[CachedResponse]
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content, stored_at, ttl "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+
+        status_code, headers, content, stored_at, ttl = row
+        return CachedResponse(status_code, json.loads(headers), content, stored_at, ttl)
+
+    @staticmethod
+    def is_fresh(cached: CachedResponse) -> bool:
+        return time.time() - cached.stored_at < cached.ttl
+
+    def set(
+        self,
+        key: str,
+        status_code: int,
+        headers: t.Mapping[str, str],
+        content: bytes,
+        ttl: int,
+    ):
+        """Stores a response, evicting the least recently used entries if over the size bound."""
+        now: float = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    status_code,
+                    json.dumps(dict(headers)),
+                    content,
+                    len(content),
+                    now,
+                    now,
+                    ttl,
+                ),
+            )
+            self._evict()
+
+    def touch(self, key: str):
+        """Marks a revalidated entry as fresh again."""
+        with self._lock:
+            now: float = time.time()
+            self._connection.execute(
+                "UPDATE responses SET stored_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def _evict(self):
+        (total,) = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+
+        freed: int = 0
+        evicted: t.List[t.Tuple[str]] = []
+        for key, size in self._connection.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        ):
+            if total - freed <= self.max_bytes:
+                break
+            evicted.append((key,))
+            freed += size
+
+        self._connection.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+    def record(self, outcome: str):
+        """
+        :param outcome: Which counter in :attr:`stats` to increment.
+        :type outcome: str
+        """
+        with self._lock:
+            self.stats[outcome] += 1
+
+    def summary(self) -> str:
+        """
+        :return: A one-line summary of the cache's hit/miss counts.
+        :rtype: str
+        """
+        lookups: int = self.stats["hits"] + self.stats["misses"]
+        hit_rate: float = self.stats["hits"] / lookups * 100 if lookups else 0
+        return (
+            f"Response cache: {self.stats['hits']} hits "
+            f"({self.stats['revalidated']} revalidated), "
+            f"{self.stats['misses']} misses ({hit_rate:.0f}% hit rate)"
+        )
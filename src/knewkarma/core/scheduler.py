@@ -0,0 +1,417 @@
+import contextlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+import typing as t
+from urllib.parse import urlsplit
+
+from prawcore import Requestor
+from prawcore.const import ACCESS_TOKEN_PATH
+from requests import Response
+
+from .response_cache import CachedResponse, ResponseCache
+from .token_cache import TokenCache
+
+__all__ = ["ScheduledRequestor", "SharedTokenBucket", "TokenBucket"]
+
+
+def _build_response(
+    url: str, status_code: int, headers: t.Mapping[str, str], content: bytes
+) -> Response:
+    """Builds a response that was never sent over the network (e.g., from a cache)."""
+    response = Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers.update(headers)
+    response._content = content
+    return response
+
+
+class TokenBucket:
+    """
+    Paces requests to the rate-limit budget Reddit reports in its response headers.
+
+    Until the first ``X-Ratelimit-*`` headers arrive, the bucket assumes Reddit's documented
+    budget of 100 requests per minute. After that, whatever is left of the current window is
+    spread evenly over the time until it resets, so a long crawl uses the whole window without
+    running dry before the reset.
+    """
+
+    def __init__(self, capacity: float = 100, period: float = 60, burst: float = 10):
+        """
+        :param capacity: Requests allowed per window, until Reddit reports the real number.
+        :type capacity: float
+        :param period: Length of the window in seconds, until Reddit reports the real one.
+        :type period: float
+        :param burst: Maximum number of requests that may be sent back-to-back.
+        :type burst: float
+        """
+        self.capacity = capacity
+        self.period = period
+        self.burst = min(burst, capacity)
+
+        self._tokens: float = self.burst
+        self._rate: float = capacity / period
+        self._updated: float = self._clock()
+        self._reset_at: t.Optional[float] = None
+        # Health is tracked per process, even when the budget itself is shared.
+        self._cooldown_until: float = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _clock() -> float:
+        return time.monotonic()
+
+    @contextlib.contextmanager
+    def _locked(self) -> t.Iterator[None]:
+        """Holds exclusive access to the bucket's state."""
+        with self._lock:
+            yield
+
+    def acquire(self):
+        """Blocks until a request may be sent, then takes a token for it."""
+        while True:
+            with self._locked():
+                now: float = self._refill()
+                wait: float = self._wait_time(now=now)
+                if wait <= 0:
+                    self._tokens -= 1
+                    return
+
+            # A little jitter keeps waiters from waking up in lockstep and racing for one token.
+            time.sleep(max(wait, 0.05) * random.uniform(1, 1.2))
+
+    def delay(self) -> float:
+        """
+        :return: Seconds until a request may be sent, without taking a token.
+        :rtype: float
+        """
+        with self._locked():
+            return self._wait_time(now=self._refill())
+
+    def cool_down(self, seconds: float):
+        """
+        Holds back requests for a while, e.g., after the server throttled or failed one.
+
+        :param seconds: How long to hold requests back for.
+        :type seconds: float
+        """
+        with self._lock:
+            self._cooldown_until = max(self._cooldown_until, time.monotonic() + seconds)
+
+    def observe(self, headers: t.Mapping[str, str]):
+        """
+        Resizes the bucket to the budget reported in a response's headers.
+
+        :param headers: Headers of a response from Reddit's API.
+        :type headers: Mapping[str, str]
+        """
+        if "x-ratelimit-remaining" not in headers:
+            return
+
+        remaining: float = float(headers["x-ratelimit-remaining"])
+        used: float = float(headers.get("x-ratelimit-used", 0))
+        reset: float = max(float(headers.get("x-ratelimit-reset", self.period)), 1)
+
+        with self._locked():
+            now: float = self._refill()
+            self.capacity = max(remaining + used, 1)
+            self.period = max(self.period, reset)
+            self._tokens = min(self._tokens, remaining, self.burst)
+            self._rate = max(remaining - self._tokens, 0) / reset
+            self._reset_at = now + reset
+
+    def _wait_time(self, now: float) -> float:
+        cooldown: float = self._cooldown_until - time.monotonic()
+        if self._tokens >= 1:
+            return max(cooldown, 0)
+        if self._rate > 0:
+            return max(cooldown, (1 - self._tokens) / self._rate)
+        return max(cooldown, (self._reset_at or now) - now, 0.05)
+
+    def _refill(self) -> float:
+        now: float = self._clock()
+
+        if self._reset_at is not None and now >= self._reset_at:
+            # The window rolled over; start from a full budget until the next headers arrive.
+            self._tokens = self.burst
+            self._rate = self.capacity / self.period
+            self._reset_at = None
+        else:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self._rate
+            )
+
+        self._updated = now
+        return now
+
+
+class SharedTokenBucket(TokenBucket):
+    """
+    A :class:`TokenBucket` whose state lives in a SQLite database, so every process on the host
+    that uses the same database and key draws from (and resizes) one shared budget.
+
+    Each acquisition runs in a ``BEGIN IMMEDIATE`` transaction, which serialises concurrent
+    processes on the database's write lock; waiting processes poll with jitter, so the budget is
+    split roughly evenly between them.
+    """
+
+    def __init__(self, path: str, key: str, **kwargs):
+        """
+        :param path: Path to the SQLite database holding the shared state (created if missing).
+        :type path: str
+        :param key: Name of the budget to share (e.g., the OAuth client id it belongs to).
+        :type key: str
+        """
+        super().__init__(**kwargs)
+        self.path = path
+        self.key = key
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._connection = sqlite3.connect(
+            path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                key TEXT PRIMARY KEY,
+                capacity REAL, period REAL, tokens REAL, rate REAL, updated REAL, reset_at REAL
+            )
+            """)
+
+    @staticmethod
+    def _clock() -> float:
+        # Monotonic clocks are per-process, so shared state is kept in wall-clock time.
+        return time.time()
+
+    @contextlib.contextmanager
+    def _locked(self) -> t.Iterator[None]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._connection.execute(
+                    "SELECT capacity, period, tokens, rate, updated, reset_at "
+                    "FROM buckets WHERE key = ?",
+                    (self.key,),
+                ).fetchone()
+                if row is not None:
+                    (
+                        self.capacity,
+                        self.period,
+                        self._tokens,
+                        self._rate,
+                        self._updated,
+                        self._reset_at,
+                    ) = row
+
+                yield
+
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        self.key,
+                        self.capacity,
+                        self.period,
+                        self._tokens,
+                        self._rate,
+                        self._updated,
+                        self._reset_at,
+                    ),
+                )
+                self._connection.execute("COMMIT")
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+
+
+class ScheduledRequestor(Requestor):
+    """
+    A prawcore requestor that paces API requests with a :class:`TokenBucket`, and retries
+    throttled (429) responses after their ``Retry-After`` (or a jittered exponential backoff),
+    cooling the bucket down meanwhile so a client pool routes other requests elsewhere.
+
+    Server errors (5xx) and connection errors are left to prawcore, which already retries them;
+    retrying them here as well would multiply the attempts (and the delays) of each request.
+    """
+
+    # prawcore raises on throttled responses instead of retrying them.
+    RETRY_STATUSES: t.Set[int] = {429}
+
+    def __init__(
+        self,
+        *args,
+        bucket: t.Optional[TokenBucket] = None,
+        max_retries: int = 5,
+        backoff_base: float = 1.0,
+        backoff_cap: float = 60.0,
+        token_cache: t.Optional[TokenCache] = None,
+        response_cache: t.Optional[ResponseCache] = None,
+        **kwargs,
+    ):
+        """
+        :param bucket: Token bucket to pace requests with (a new one by default).
+        :type bucket: t.Optional[TokenBucket]
+        :param max_retries: Maximum number of retries for a throttled request.
+        :type max_retries: int
+        :param backoff_base: Delay in seconds before the first retry, doubled on every attempt.
+        :type backoff_base: float
+        :param backoff_cap: Maximum delay in seconds between two attempts.
+        :type backoff_cap: float
+        :param token_cache: Optional on-disk cache to reuse application-only access tokens from.
+        :type token_cache: t.Optional[TokenCache]
+        :param response_cache: Optional on-disk cache to serve and revalidate GET requests from.
+        :type response_cache: t.Optional[ResponseCache]
+        """
+        super().__init__(*args, **kwargs)
+        self.token_cache = token_cache
+        self.response_cache = response_cache
+        self._client_id: t.Optional[str] = None
+        self.bucket = bucket or TokenBucket()
+        self._max_retries = max_retries
+        self._backoff_base = backoff_base
+        self._backoff_cap = backoff_cap
+
+    def request(self, *args, **kwargs) -> Response:
+        url: str = args[1] if len(args) > 1 else kwargs.get("url", "")
+        if self.token_cache is not None and url.endswith(ACCESS_TOKEN_PATH):
+            return self._request_token(*args, **kwargs)
+
+        # Only API requests count towards the budget; token requests go to another host.
+        is_api_request: bool = url.startswith(self.oauth_url)
+        method: str = args[0] if args else kwargs.get("method", "")
+
+        if (
+            self.response_cache is not None
+            and is_api_request
+            and method.upper() == "GET"
+        ):
+            return self._request_cached(url, *args, **kwargs)
+
+        return self._send(is_api_request, *args, **kwargs)
+
+    def _send(self, is_api_request: bool, *args, **kwargs) -> Response:
+        for attempt in range(self._max_retries + 1):
+            if is_api_request:
+                self.bucket.acquire()
+
+            response = super().request(*args, **kwargs)
+            if is_api_request:
+                self.bucket.observe(headers=response.headers)
+                if response.status_code == 401 and self._client_id:
+                    # The cached token was revoked; don't hand it out again.
+                    self.token_cache.discard(client_id=self._client_id)
+
+            if (
+                response.status_code not in self.RETRY_STATUSES
+                or attempt == self._max_retries
+            ):
+                return response
+
+            delay: float = self._backoff(attempt=attempt, response=response)
+            if is_api_request:
+                self.bucket.cool_down(seconds=delay)
+            time.sleep(delay)
+
+        return response
+
+    def _request_cached(self, url: str, *args, **kwargs) -> Response:
+        """
+        Serves a GET request from the response cache while the cached response is fresh, and
+        revalidates it with a conditional request once it is stale.
+        """
+        key: str = self.response_cache.key(
+            method="GET", url=url, params=kwargs.get("params")
+        )
+        cached: t.Optional[CachedResponse] = self.response_cache.get(key=key)
+
+        if cached is not None and self.response_cache.is_fresh(cached=cached):
+            self.response_cache.record(outcome="hits")
+            return _build_response(
+                url=url,
+                status_code=cached.status_code,
+                headers=cached.headers,
+                content=cached.content,
+            )
+
+        if cached is not None:
+            headers: t.Dict[str, str] = dict(kwargs.get("headers") or {})
+            if "etag" in cached.headers:
+                headers["If-None-Match"] = cached.headers["etag"]
+            if "last-modified" in cached.headers:
+                headers["If-Modified-Since"] = cached.headers["last-modified"]
+            kwargs["headers"] = headers
+
+        response = self._send(True, *args, **kwargs)
+
+        if response.status_code == 304 and cached is not None:
+            self.response_cache.touch(key=key)
+            self.response_cache.record(outcome="hits")
+            self.response_cache.record(outcome="revalidated")
+            return _build_response(
+                url=url,
+                status_code=cached.status_code,
+                headers={**cached.headers, **response.headers},
+                content=cached.content,
+            )
+
+        self.response_cache.record(outcome="misses")
+        if response.status_code == 200:
+            self.response_cache.set(
+                key=key,
+                status_code=response.status_code,
+                # Rate-limit headers describe the moment they were sent, not the payload.
+                headers={
+                    name.lower(): value
+                    for name, value in response.headers.items()
+                    if not name.lower().startswith("x-ratelimit")
+                },
+                content=response.content,
+                ttl=self.response_cache.ttl(path=urlsplit(url).path),
+            )
+
+        return response
+
+    def _request_token(self, *args, **kwargs) -> Response:
+        """
+        Serves application-only token requests from the token cache, requesting (and caching)
+        a new token only when there is no valid one.
+        """
+        client_id: str = kwargs["auth"][0]
+        grant_type: t.Optional[str] = dict(kwargs.get("data") or []).get("grant_type")
+        if grant_type != "client_credentials":
+            return super().request(*args, **kwargs)
+
+        self._client_id = client_id
+        payload: t.Optional[t.Dict[str, t.Any]] = self.token_cache.get(
+            client_id=client_id
+        )
+        if payload is not None:
+            return _build_response(
+                url=args[1] if len(args) > 1 else kwargs.get("url", ""),
+                status_code=200,
+                headers={"content-type": "application/json"},
+                content=json.dumps(payload).encode(),
+            )
+
+        issued_at: float = time.time()
+        response = super().request(*args, **kwargs)
+        if response.status_code == 200:
+            payload = response.json()
+            if "access_token" in payload and "expires_in" in payload:
+                self.token_cache.set(
+                    client_id=client_id, payload=payload, issued_at=issued_at
+                )
+
+        return response
+
+    def _backoff(self, attempt: int, response: Response) -> float:
+        delay: float = random.uniform(
+            0, min(self._backoff_cap, self._backoff_base * 2**attempt)
+        )
+        retry_after: t.Optional[str] = response.headers.get("retry-after")
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, float(retry_after))
+
+        return delay
@@ -1,10 +1,9 @@
 import typing as t
 
-import requests
 from praw.models import Submission, Subreddit, Redditor
 from rich.status import Status
 
-from .client import reddit
+from .listing import paginate
 
 
 class Search:
@@ -13,48 +12,42 @@ class Search:
 
     def posts(
         self,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Submission]:
-        search_results = reddit.search(
-            session=session,
-            status=status,
-            kind="posts",
-            query=self._query,
+    ) -> t.Iterator[Submission]:
+        search_results = paginate(
+            endpoint="search",
             limit=limit,
+            params={"q": self._query, "type": "link"},
+            status=status,
         )
 
         return search_results
 
     def subreddits(
         self,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Subreddit]:
-        search_results = reddit.search(
-            session=session,
-            status=status,
-            kind="subreddits",
-            query=self._query,
+    ) -> t.Iterator[Subreddit]:
+        search_results = paginate(
+            endpoint="subreddits/search",
             limit=limit,
+            params={"q": self._query},
+            status=status,
         )
 
         return search_results
 
     def users(
         self,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Redditor]:
-        search_results = reddit.search(
-            session=session,
-            status=status,
-            kind="users",
-            query=self._query,
+    ) -> t.Iterator[Redditor]:
+        search_results = paginate(
+            endpoint="users/search",
             limit=limit,
+            params={"q": self._query},
+            status=status,
         )
 
         return search_results
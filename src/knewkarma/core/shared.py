@@ -1,4 +1,8 @@
+import queue
+import threading
 import typing as t
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from karmakrate.riches import rich_colours
 from karmakrate.riches.rich_logging import console
@@ -23,3 +27,107 @@ def is_empty_data(data: t.List, message: str) -> t.List:
         return []
     else:
         return data
+
+
+def chunked(items: t.Iterable, size: int) -> t.Iterator[t.List]:
+    """
+    Splits items into lists of up to ``size`` items, without reading ahead of the last chunk.
+
+    :param items: Items to split.
+    :type items: t.Iterable
+    :param size: Maximum number of items per chunk.
+    :type size: int
+    :return: A generator of chunks.
+    :rtype: t.Iterator[t.List]
+    """
+    chunk: t.List = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def bounded_map(func: t.Callable, items: t.Iterable, workers: int) -> t.Iterator:
+    """
+    Calls ``func`` on every item from a thread pool, yielding results in input order.
+
+    Unlike ``Executor.map``, items are only read (and calls only queued) a couple of calls
+    ahead of the consumer, so long or endless inputs are streamed, and abandoning the generator
+    cancels the calls that have not started.
+
+    :param func: Function to call on every item.
+    :type func: t.Callable
+    :param items: Items to call the function on.
+    :type items: t.Iterable
+    :param workers: Maximum number of calls running at once.
+    :type workers: int
+    :return: A generator of results.
+    :rtype: t.Iterator
+    """
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        pending: t.Deque[Future] = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(func, item))
+                if len(pending) >= workers * 2:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def merge_concurrently(iterables: t.Iterable[t.Iterable], workers: int) -> t.Iterator:
+    """
+    Drains several iterables (e.g., paginated listings) on a thread pool, up to ``workers`` at
+    once, yielding every item as soon as it is produced, whichever iterable it came from.
+
+    An error raised by any iterable is re-raised to the consumer, and abandoning the generator
+    stops the iterables still running after their current item.
+
+    :param iterables: Iterables to drain.
+    :type iterables: t.Iterable[t.Iterable]
+    :param workers: Maximum number of iterables drained at once.
+    :type workers: int
+    :return: A generator of items, in arrival order.
+    :rtype: t.Iterator
+    """
+    results: queue.Queue = queue.Queue()
+    stopped = threading.Event()
+    finished = object()
+
+    def drain(iterable: t.Iterable):
+        try:
+            for item in iterable:
+                if stopped.is_set():
+                    break
+                results.put((item, None))
+        except BaseException as error:
+            results.put((None, error))
+        finally:
+            results.put((finished, None))
+
+    executor = ThreadPoolExecutor(max_workers=max(1, workers))
+    running: int = 0
+    for iterable in iterables:
+        executor.submit(drain, iterable)
+        running += 1
+
+    try:
+        while running:
+            item, error = results.get()
+            if error is not None:
+                raise error
+            if item is finished:
+                running -= 1
+                continue
+            yield item
+    finally:
+        stopped.set()
+        executor.shutdown(wait=False, cancel_futures=True)
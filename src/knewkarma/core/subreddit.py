@@ -1,72 +1,397 @@
 import typing as t
+from collections import Counter
 
 from praw.models import Submission, Comment
+from praw.models import Subreddit as PrawSubreddit
 from praw.models.reddit.subreddit import SubredditWiki
-from prawcore import exceptions
 from rich.status import Status
 
 from karmakrate.riches import rich_colours
 from karmakrate.riches.rich_logging import console
-from .client import reddit, TIME_FILTERS, SORT, LISTINGS
-from .shared import is_empty_data
+from .client import existence_cache, reddit, TIME_FILTERS, SORT, LISTINGS
+from .existence import probe
+from .listing import Predicates, paginate, time_window
+from .shared import bounded_map, chunked, is_empty_data, merge_concurrently
 
 
 class Subreddit:
+    # Maximum number of names /api/info accepts per request.
+    BATCH_SIZE: int = 100
+    # Maximum number of subreddits combined into one r/a+b+c request.
+    GROUP_SIZE: int = 50
+
     def __init__(self, display_name: str):
         self._display_name = display_name
-        self._subreddit = reddit.subreddit(display_name=display_name)
+        self._subreddit = reddit().subreddit(display_name=display_name)
+        self._verdict: t.Optional[bool] = None
+
+    @classmethod
+    def bulk_profiles(
+        cls, names: t.Iterable[str], status: t.Optional[Status] = None
+    ) -> t.Iterator[PrawSubreddit]:
+        """
+        Looks up many subreddits at once, yielding the profile of every one that exists.
+
+        Names are resolved up to :attr:`BATCH_SIZE` per request through ``/api/info``, and
+        every answer (including the names it omits) goes into the existence cache, so names
+        already checked are not requested again.
+
+        :param names: Subreddit names (e.g., read from a file).
+        :type names: t.Iterable[str]
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of subreddit profiles, in input order.
+        :rtype: t.Iterator[PrawSubreddit]
+        """
+        cache = existence_cache()
+        resolved: int = 0
+
+        for chunk in chunked(items=dict.fromkeys(names), size=cls.BATCH_SIZE):
+            cached: t.Dict[str, t.Optional[t.Tuple[bool, t.Optional[t.Dict]]]] = {
+                name: cache.get(kind="subreddit", name=name) for name in chunk
+            }
+            missing: t.List[str] = [name for name in chunk if cached[name] is None]
+            found: t.Dict[str, t.Dict] = {}
+
+            if missing:
+                if isinstance(status, Status):
+                    status.update(
+                        f"Getting subreddit profiles ({resolved + 1}-{resolved + len(chunk)})..."
+                    )
+
+                listing: t.Dict = reddit().request(
+                    method="GET",
+                    path="api/info",
+                    params={"sr_name": ",".join(missing)},
+                )
+                found = {
+                    child["data"]["display_name"].lower(): child
+                    for child in listing["data"]["children"]
+                    if child.get("kind") == "t5"
+                }
+
+            for name in chunk:
+                if cached[name] is not None:
+                    about: t.Optional[t.Dict] = cached[name][1]
+                else:
+                    about = found.get(name.lower())
+                    cache.set(kind="subreddit", name=name, about=about)
+
+                if about is not None:
+                    subreddit = PrawSubreddit(reddit(), _data=about["data"])
+                    subreddit._fetched = True
+                    yield subreddit
+                else:
+                    console.print(
+                        f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {name} is not a real subreddit"
+                    )
+
+            resolved += len(chunk)
+
+    @classmethod
+    def group_posts(
+        cls,
+        names: t.Iterable[str],
+        limit: int,
+        listing: LISTINGS,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
+        workers: int = 4,
+        status: t.Optional[Status] = None,
+    ) -> t.Iterator[Submission]:
+        """
+        Gets up to ``limit`` posts from each of many subreddits, through ``r/a+b+c`` requests.
+
+        :param names: Subreddit names.
+        :type names: t.Iterable[str]
+        :param limit: Maximum number of posts per subreddit.
+        :type limit: int
+        :param listing: Type of listing to retrieve (e.g., 'hot', 'new', 'top').
+        :type listing: LISTINGS
+        :param time_filter: How recent the posts must be.
+        :type time_filter: TIME_FILTERS
+        :param where: Other conditions the posts must meet.
+        :type where: t.Optional[Predicates]
+        :param workers: Maximum number of groups crawled at once.
+        :type workers: int
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of posts tagged with ``source_subreddit``, in arrival order.
+        :rtype: t.Iterator[Submission]
+        """
+        params, where = time_window(
+            listing=listing, time_filter=time_filter, where=where
+        )
+        return cls._crawl_groups(
+            names=names,
+            path=listing,
+            limit=limit,
+            params=params,
+            where=where,
+            newest_first=listing == "new",
+            workers=workers,
+            status=status,
+        )
+
+    @classmethod
+    def group_comments(
+        cls,
+        names: t.Iterable[str],
+        limit: int,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
+        workers: int = 4,
+        status: t.Optional[Status] = None,
+    ) -> t.Iterator[Comment]:
+        """
+        Gets up to ``limit`` recent comments from each of many subreddits, through ``r/a+b+c``
+        requests.
+
+        :param names: Subreddit names.
+        :type names: t.Iterable[str]
+        :param limit: Maximum number of comments per subreddit.
+        :type limit: int
+        :param time_filter: How recent the comments must be.
+        :type time_filter: TIME_FILTERS
+        :param where: Other conditions the comments must meet.
+        :type where: t.Optional[Predicates]
+        :param workers: Maximum number of groups crawled at once.
+        :type workers: int
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of comments tagged with ``source_subreddit``, in arrival order.
+        :rtype: t.Iterator[Comment]
+        """
+        params, where = time_window(
+            listing="comments", time_filter=time_filter, where=where
+        )
+        return cls._crawl_groups(
+            names=names,
+            path="comments",
+            limit=limit,
+            params=params,
+            where=where,
+            newest_first=True,
+            workers=workers,
+            status=status,
+        )
+
+    @classmethod
+    def group_search(
+        cls,
+        names: t.Iterable[str],
+        query: str,
+        limit: int,
+        sort: SORT,
+        time_filter: TIME_FILTERS,
+        workers: int = 4,
+        status: t.Optional[Status] = None,
+    ) -> t.Iterator[Submission]:
+        """
+        Searches posts in many subreddits, through ``r/a+b+c`` requests.
+
+        :param names: Subreddit names.
+        :type names: t.Iterable[str]
+        :param query: Search query string.
+        :type query: str
+        :param limit: Maximum number of results per subreddit.
+        :type limit: int
+        :param sort: Sorting method for the search results.
+        :type sort: SORT
+        :param time_filter: Time filter for the search results.
+        :type time_filter: TIME_FILTERS
+        :param workers: Maximum number of groups searched at once.
+        :type workers: int
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of posts tagged with ``source_subreddit``, in arrival order.
+        :rtype: t.Iterator[Submission]
+        """
+        return cls._crawl_groups(
+            names=names,
+            path="search",
+            limit=limit,
+            params={"q": query, "restrict_sr": True, "sort": sort, "t": time_filter},
+            workers=workers,
+            status=status,
+        )
+
+    @classmethod
+    def fan_out(
+        cls,
+        names: t.Iterable[str],
+        method: str,
+        workers: int = 4,
+        status: t.Optional[Status] = None,
+        **kwargs,
+    ) -> t.Iterator[t.Any]:
+        """
+        Calls a method (e.g., ``"wiki_pages"``) on many subreddits concurrently, for data that
+        can't be requested for several subreddits at once.
+
+        :param names: Subreddit names.
+        :type names: t.Iterable[str]
+        :param method: Name of the :class:`Subreddit` method to call.
+        :type method: str
+        :param workers: Maximum number of subreddits handled at once.
+        :type workers: int
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :param kwargs: Keyword arguments passed on to the method.
+        :return: A generator of the results' items tagged with ``source_subreddit``.
+        :rtype: t.Iterator[t.Any]
+        """
+
+        def call(name: str) -> t.List[t.Any]:
+            subreddit = cls(display_name=name)
+            items: t.List[t.Any] = getattr(subreddit, method)(status=status, **kwargs)
+            for item in items or []:
+                item.source_subreddit = subreddit._display_name
+            return items or []
+
+        for items in bounded_map(func=call, items=names, workers=workers):
+            yield from items
+
+    @classmethod
+    def _crawl_groups(
+        cls,
+        names: t.Iterable[str],
+        path: str,
+        limit: int,
+        params: t.Optional[t.Dict[str, t.Any]] = None,
+        where: t.Optional[Predicates] = None,
+        newest_first: bool = False,
+        workers: int = 4,
+        status: t.Optional[Status] = None,
+    ) -> t.Iterator[t.Any]:
+        """
+        Crawls a listing of many subreddits by combining them into ``r/a+b+c`` groups of up to
+        :attr:`GROUP_SIZE`, which are paginated concurrently.
+
+        The names are first resolved with :meth:`bulk_profiles` (which also drops nonexistent
+        ones, as those would fail the whole group). A group's listing interleaves its
+        subreddits, so it is read until every subreddit has ``limit`` items that meet
+        ``where``, or the listing ends, whichever comes first; quiet subreddits may end up
+        with fewer.
+        """
+        existing: t.List[str] = [
+            subreddit.display_name
+            for subreddit in cls.bulk_profiles(names=names, status=status)
+        ]
+
+        def crawl(group: t.List[str]) -> t.Iterator[t.Any]:
+            counts: t.Counter[str] = Counter()
+            for item in paginate(
+                endpoint=f"r/{'+'.join(group)}/{path}",
+                limit=limit * len(group),
+                params=params,
+                status=status,
+                where=where,
+                newest_first=newest_first,
+            ):
+                source: str = item.subreddit.display_name
+                if counts[source.lower()] >= limit:
+                    continue
+
+                counts[source.lower()] += 1
+                item.source_subreddit = source
+                yield item
+
+                if len(counts) == len(group) and min(counts.values()) >= limit:
+                    return
+
+        return merge_concurrently(
+            iterables=[
+                crawl(group) for group in chunked(items=existing, size=cls.GROUP_SIZE)
+            ],
+            workers=workers,
+        )
 
     def comments(
-        self, limit: int, status: t.Optional[Status] = None
-    ) -> t.Union[t.List[Comment], None]:
+        self,
+        limit: int,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
+        status: t.Optional[Status] = None,
+    ) -> t.Union[t.Iterator[Comment], None]:
         """
-        Retrieves a list of comments from the subreddit.
+        Retrieves comments from the subreddit, streaming them as each page arrives.
 
         :param limit: Maximum number of comments to retrieve.
         :type limit: int
+        :param time_filter: How recent the comments must be.
+        :type time_filter: TIME_FILTERS
+        :param where: Other conditions the comments must meet.
+        :type where: t.Optional[Predicates]
         :param status: Optional status object for updating progress.
         :type status: t.Optional[Status]
-        :return: List of comments from the subreddit, or None if the subreddit does not exist.
-        :rtype: t.Union[t.List[Comment], None]
+        :return: A generator of comments from the subreddit, or None if the subreddit does not exist.
+        :rtype: t.Union[t.Iterator[Comment], None]
         """
         if self.exists(status=status):
             if isinstance(status, Status):
                 status.update(
                     f"Getting {limit} comments from {self._subreddit.display_name_prefixed}..."
                 )
-            comments = [
-                comment.refresh() for comment in self._subreddit.comments(limit=limit)
-            ]
-            return is_empty_data(
-                data=comments,
-                message=f"No comments found in {self._subreddit.display_name_prefixed}.",
+            params, where = time_window(
+                listing="comments", time_filter=time_filter, where=where
+            )
+            return paginate(
+                endpoint=f"r/{self._subreddit.display_name}/comments",
+                limit=limit,
+                params=params,
+                status=status,
+                watermark=("subreddit", self._subreddit.display_name, "comments"),
+                where=where,
+                newest_first=True,
             )
         else:
             return None
 
     def posts(
-        self, limit: int, listing: LISTINGS, status: t.Optional[Status] = None
-    ) -> t.Union[t.List[Submission], None]:
+        self,
+        limit: int,
+        listing: LISTINGS,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
+        status: t.Optional[Status] = None,
+    ) -> t.Union[t.Iterator[Submission], None]:
         """
-        Retrieves a list of posts from the subreddit based on the specified listing type.
+        Retrieves posts from the subreddit based on the specified listing type, streaming them
+        as each page arrives.
 
         :param limit: Maximum number of posts to retrieve.
         :type limit: int
         :param listing: Type of listing to retrieve (e.g., 'hot', 'new', 'top').
+        :param time_filter: How recent the posts must be.
+        :type time_filter: TIME_FILTERS
+        :param where: Other conditions the posts must meet.
+        :type where: t.Optional[Predicates]
         :param status: Optional status object for updating progress.
         :type status: t.Optional[Status]
-        :return: List of posts from the subreddit, or None if the subreddit does not exist.
-        :rtype: t.Union[t.List[Submission], None]
+        :return: A generator of posts from the subreddit, or None if the subreddit does not exist.
+        :rtype: t.Union[t.Iterator[Submission], None]
         """
         if self.exists(status=status):
             if isinstance(status, Status):
                 status.update(
                     f"Getting {limit} {listing} posts from {self._subreddit.display_name_prefixed}..."
                 )
-            func = getattr(self._subreddit, listing)
-            return is_empty_data(
-                data=list(func(limit=limit)),
-                message=f"No {listing} posts found in {self._subreddit.display_name_prefixed}.",
+            params, where = time_window(
+                listing=listing, time_filter=time_filter, where=where
+            )
+            return paginate(
+                endpoint=f"r/{self._subreddit.display_name}/{listing}",
+                limit=limit,
+                params=params,
+                status=status,
+                watermark=(
+                    ("subreddit", self._subreddit.display_name, listing)
+                    if listing == "new"
+                    else None
+                ),
+                where=where,
+                newest_first=listing == "new",
             )
         else:
             return None
@@ -152,25 +477,32 @@ class Subreddit:
 
     def exists(self, status: t.Optional[Status] = None) -> bool:
         """
-        Checks if the subreddit exists by attempting to access its ID.
+        Checks if the subreddit exists by getting its about page, at most once per command.
+
+        The probe's payload becomes the subreddit's profile data, so ``profile()`` does not
+        fetch it again. Private and banned subreddits count as nonexistent.
 
         :param status: Optional status object for updating progress.
         :type status: t.Optional[Status]
         :return: True if the subreddit exists, False otherwise.
         :rtype: bool
         """
+        if self._verdict is not None:
+            return self._verdict
+
         if isinstance(status, Status):
             status.update(f"Checking subreddit availability...")
 
-        try:
-            _ = self._subreddit.id
-            verdict = True
-        except exceptions.Redirect:
-            verdict = False
-        except exceptions.NotFound:
-            verdict = False
-        except exceptions.Forbidden:
-            verdict = False
+        about: t.Optional[t.Dict] = probe(
+            kind="subreddit",
+            name=self._display_name,
+            path=f"r/{self._display_name}/about",
+        )
+        verdict: bool = about is not None and about.get("kind") == "t5"
+        if verdict:
+            self._subreddit = PrawSubreddit(reddit(), _data=about["data"])
+            # The payload is the full profile, so missing attributes must not refetch it.
+            self._subreddit._fetched = True
 
         if verdict:
             console.print(
@@ -181,4 +513,6 @@ class Subreddit:
             console.print(
                 f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {self._display_name} is not a real subreddit"
             )
+
+        self._verdict = verdict
         return verdict
@@ -1,25 +1,22 @@
 import typing as t
 
-import requests
 from praw.models import Subreddit
 from rich.status import Status
 
-from .client import reddit
+from .listing import paginate
 
 
 class Subreddits:
     @classmethod
     def all(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Subreddit]:
-        all_subreddits = reddit.subreddits(
-            session=session,
-            status=status,
-            kind="all",
+    ) -> t.Iterator[Subreddit]:
+        all_subreddits = paginate(
+            endpoint="subreddits",
             limit=limit,
+            status=status,
         )
 
         return all_subreddits
@@ -28,15 +25,12 @@ class Subreddits:
     def default(
         cls,
         limit: int,
-        session: requests.Session,
         status: t.Optional[Status] = None,
-    ) -> t.List[Subreddit]:
-        default_subreddits = reddit.subreddits(
-            session=session,
-            status=status,
-            kind="default",
-            timeframe="all",
+    ) -> t.Iterator[Subreddit]:
+        default_subreddits = paginate(
+            endpoint="subreddits/default",
             limit=limit,
+            status=status,
         )
 
         return default_subreddits
@@ -44,15 +38,13 @@ class Subreddits:
     @classmethod
     def new(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Subreddit]:
-        new_subreddits = reddit.subreddits(
-            session=session,
-            status=status,
-            kind="new",
+    ) -> t.Iterator[Subreddit]:
+        new_subreddits = paginate(
+            endpoint="subreddits/new",
             limit=limit,
+            status=status,
         )
 
         return new_subreddits
@@ -60,15 +52,13 @@ class Subreddits:
     @classmethod
     def popular(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Subreddit]:
-        popular_subreddits = reddit.subreddits(
-            session=session,
-            status=status,
-            kind="popular",
+    ) -> t.Iterator[Subreddit]:
+        popular_subreddits = paginate(
+            endpoint="subreddits/popular",
             limit=limit,
+            status=status,
         )
 
         return popular_subreddits
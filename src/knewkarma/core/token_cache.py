@@ -0,0 +1,113 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import typing as t
+
+__all__ = ["TokenCache"]
+
+
+class TokenCache:
+    """
+    Keeps application-only OAuth access tokens on disk, keyed by client id, so short-lived
+    processes can reuse a token until it expires instead of requesting a new one on every run.
+
+    The file is only ever readable by its owner, and is replaced atomically, so concurrent
+    processes never see a partially written cache.
+    """
+
+    # Tokens this close to expiring are treated as expired, so none expires mid-request.
+    EXPIRY_MARGIN: int = 60
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the cache file (created on the first write).
+        :type path: str
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def get(self, client_id: str) -> t.Optional[t.Dict[str, t.Any]]:
+        """
+        :param client_id: Client id the token was issued to.
+        :type client_id: str
+        :return: The cached token payload with ``expires_in`` counting down from now, or None
+            if there is no token that is still valid.
+        :rtype: t.Optional[t.Dict[str, t.Any]]
+        """
+        entry: t.Optional[t.Dict[str, t.Any]] = self._load().get(client_id)
+        if not entry:
+            return None
+
+        expires_in: int = int(entry["expires_at"] - time.time())
+        if expires_in <= self.EXPIRY_MARGIN:
+            return None
+
+        return {
+            "access_token": entry["access_token"],
+            "token_type": entry.get("token_type", "bearer"),
+            "expires_in": expires_in,
+            "scope": entry.get("scope", "*"),
+        }
+
+    def set(self, client_id: str, payload: t.Dict[str, t.Any], issued_at: float):
+        """
+        :param client_id: Client id the token was issued to.
+        :type client_id: str
+        :param payload: The token endpoint's JSON response.
+        :type payload: t.Dict[str, t.Any]
+        :param issued_at: When the token was requested, as a Unix timestamp.
+        :type issued_at: float
+        """
+        self._update(
+            client_id,
+            {
+                "access_token": payload["access_token"],
+                "token_type": payload.get("token_type", "bearer"),
+                "expires_at": issued_at + payload["expires_in"],
+                "scope": payload.get("scope", "*"),
+            },
+        )
+
+    def discard(self, client_id: str):
+        """
+        Forgets a client's token, e.g., after the API rejected it.
+
+        :param client_id: Client id the token was issued to.
+        :type client_id: str
+        """
+        self._update(client_id, None)
+
+    def _load(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        try:
+            with open(self.path) as cache_file:
+                return json.load(cache_file)
+        except (OSError, ValueError):
+            return {}
+
+    def _update(self, client_id: str, entry: t.Optional[t.Dict[str, t.Any]]):
+        with self._lock:
+            entries = self._load()
+            now: float = time.time()
+            # Drop expired tokens while the file is being rewritten anyway.
+            entries = {
+                key: value
+                for key, value in entries.items()
+                if value.get("expires_at", 0) > now and key != client_id
+            }
+            if entry is not None:
+                entries[client_id] = entry
+
+            directory: str = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+
+            # mkstemp creates the file with 0600 permissions.
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w") as temp_file:
+                    json.dump(entries, temp_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
@@ -7,28 +7,136 @@ from rich.status import Status
 from karmakrate.riches import rich_colours
 from karmakrate.riches.rich_logging import console
 from karmakrate.riches.rich_render import Render
-from .client import reddit, LISTINGS
+from .client import reddit, LISTINGS, TIME_FILTERS
+from .existence import probe
+from .listing import Predicates, paginate, time_window
+from .shared import bounded_map, chunked
 
 
 class User:
+    # Maximum number of account ids /api/user_data_by_account_ids accepts per request.
+    BATCH_SIZE: int = 100
+
     def __init__(self, username: str):
-        self._redditor = reddit.redditor(name=username)
+        self._redditor = reddit().redditor(name=username)
         self._username = username
+        self._verdict: t.Optional[bool] = None
+
+    @classmethod
+    def bulk_profiles(
+        cls,
+        names: t.Iterable[str],
+        workers: int = 8,
+        status: t.Optional[Status] = None,
+    ) -> t.Iterator[Redditor]:
+        """
+        Looks up many users at once, yielding the profile of every one that exists.
+
+        Account ids (``t2_...``) are resolved up to :attr:`BATCH_SIZE` per request through
+        ``/api/user_data_by_account_ids``, which returns partial profiles (name, creation date
+        and karma). Reddit has no batch endpoint for usernames, so those are probed concurrently
+        (``workers`` at a time) through the existence cache, which yields full profiles.
+
+        :param names: Usernames and/or account ids (e.g., read from a file).
+        :type names: t.Iterable[str]
+        :param workers: Maximum number of username lookups in flight at once.
+        :type workers: int
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: A generator of profiles, in input order within each kind.
+        :rtype: t.Iterator[Redditor]
+        """
+        account_ids: t.List[str] = []
+        usernames: t.List[str] = []
+        for name in dict.fromkeys(names):
+            (account_ids if name.startswith("t2_") else usernames).append(name)
+
+        for chunk in chunked(items=account_ids, size=cls.BATCH_SIZE):
+            if isinstance(status, Status):
+                status.update(f"Getting {len(chunk)} users by account id...")
+
+            partials: t.Dict[str, t.Dict] = reddit().request(
+                method="GET",
+                path="api/user_data_by_account_ids",
+                params={"ids": ",".join(chunk)},
+            )
+            for account_id in chunk:
+                if account_id in partials:
+                    # Left unfetched on purpose: exports and panels only read what the partial
+                    # profile has, and fetching the rest would cost a request per user.
+                    yield Redditor(
+                        reddit(), _data={**partials[account_id], "id": account_id[3:]}
+                    )
+                else:
+                    console.print(
+                        f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {account_id} is not a real user"
+                    )
+
+        for index, (username, about) in enumerate(
+            bounded_map(
+                func=lambda username: (
+                    username,
+                    probe(kind="user", name=username, path=f"user/{username}/about"),
+                ),
+                items=usernames,
+                workers=workers,
+            ),
+            start=1,
+        ):
+            if isinstance(status, Status):
+                status.update(f"Getting user profiles ({index}/{len(usernames)})...")
+
+            if about is not None:
+                redditor = Redditor(reddit(), _data=about["data"])
+                redditor._fetched = True
+                yield redditor
+            else:
+                console.print(
+                    f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {username} is not a real user"
+                )
+
+    @staticmethod
+    def _listing_params(
+        listing: LISTINGS, time_filter: TIME_FILTERS, where: t.Optional[Predicates]
+    ) -> t.Tuple[t.Dict[str, str], t.Optional[Predicates]]:
+        """
+        :return: Query parameters selecting a listing of a user's posts or comments, and the
+            conditions its items must meet.
+        :rtype: t.Tuple[t.Dict[str, str], t.Optional[Predicates]]
+        """
+        params, where = time_window(
+            listing=listing, time_filter=time_filter, where=where
+        )
+        return {"sort": listing, **params}, where
 
     def comments(
         self,
         limit: int,
         listing: LISTINGS,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
         status: t.Optional[Status] = None,
-    ) -> t.Union[t.List[Comment], None]:
+    ) -> t.Union[t.Iterator[Comment], None]:
         if self.exists(status=status):
             if isinstance(status, Status):
                 status.update(
                     f"Getting {limit} {listing} comments from u/{self._username}..."
                 )
 
-            func = getattr(self._redditor, listing)
-            return list(func(limit=limit))
+            params, where = self._listing_params(
+                listing=listing, time_filter=time_filter, where=where
+            )
+            return paginate(
+                endpoint=f"user/{self._username}/comments",
+                limit=limit,
+                params=params,
+                status=status,
+                watermark=(
+                    ("user", self._username, "comments") if listing == "new" else None
+                ),
+                where=where,
+                newest_first=listing == "new",
+            )
 
         else:
             return None
@@ -38,8 +146,6 @@ class User:
     ) -> t.Union[t.List[Subreddit], None]:
         if self.exists(status=status):
             if isinstance(status, Status):
-                self.exists(status=status)
-
                 status.update(
                     f"Getting moderated subreddits from u/{self._username}..."
                 )
@@ -65,16 +171,30 @@ class User:
         self,
         limit: t.Optional[int],
         listing: LISTINGS,
+        time_filter: TIME_FILTERS = "all",
+        where: t.Optional[Predicates] = None,
         status: t.Optional[Status] = None,
-    ) -> t.Union[t.List[Submission], None]:
+    ) -> t.Union[t.Iterator[Submission], None]:
         if self.exists(status=status):
             if isinstance(status, Status):
                 status.update(
                     f"Getting {limit} {listing} posts from u/{self._username}..."
                 )
 
-            func = getattr(self._redditor.submissions, listing)
-            return list(func(limit=limit))
+            params, where = self._listing_params(
+                listing=listing, time_filter=time_filter, where=where
+            )
+            return paginate(
+                endpoint=f"user/{self._username}/submitted",
+                limit=limit,
+                params=params,
+                status=status,
+                watermark=(
+                    ("user", self._username, "submitted") if listing == "new" else None
+                ),
+                where=where,
+                newest_first=listing == "new",
+            )
         else:
             return None
 
@@ -97,11 +217,11 @@ class User:
         status: t.Optional[Status] = None,
     ):
         if self.exists(status=status):
-            posts = self.posts(status=status, limit=None, listing="top")
+            posts = list(self.posts(status=status, limit=None, listing="top"))
 
             if posts:
                 # Extract subreddit names
-                subreddits = [post.data.subreddit for post in posts]
+                subreddits = [post.subreddit.display_name for post in posts]
 
                 # Count the occurrences of each subreddit
                 subreddit_counts: t.Counter = Counter(subreddits)
@@ -130,12 +250,31 @@ class User:
         self,
         status: t.Optional[Status] = None,
     ) -> bool:
+        """
+        Checks if the user exists, probing their profile at most once per command.
+
+        The probe's payload becomes the user's profile data, so ``profile()`` and friends
+        do not fetch it again.
+
+        :param status: Optional status object for updating progress.
+        :type status: t.Optional[Status]
+        :return: True if the user exists, False otherwise.
+        :rtype: bool
+        """
+        if self._verdict is not None:
+            return self._verdict
+
         if isinstance(status, Status):
             status.update(f"Checking user availability...")
 
-        verdict: bool = (
-            True if not reddit.username_available(name=self._username) else False
+        about: t.Optional[t.Dict] = probe(
+            kind="user", name=self._username, path=f"user/{self._username}/about"
         )
+        verdict: bool = about is not None
+        if verdict:
+            self._redditor = Redditor(reddit(), _data=about["data"])
+            # The payload is the full profile, so missing attributes must not refetch it.
+            self._redditor._fetched = True
 
         if verdict:
             console.print(
@@ -146,4 +285,6 @@ class User:
             console.print(
                 f"{rich_colours.BOLD_YELLOW}✘{rich_colours.BOLD_YELLOW_RESET} {self._username} is not a real user"
             )
+
+        self._verdict = verdict
         return verdict
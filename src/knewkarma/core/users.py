@@ -1,10 +1,9 @@
 import typing as t
 
-import requests
 from praw.models import Redditor
 from rich.status import Status
 
-from .client import reddit
+from .listing import paginate
 
 
 class Users:
@@ -13,15 +12,13 @@ class Users:
     @classmethod
     def new(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Redditor]:
-        new_users = reddit.users(
-            session=session,
-            status=status,
-            kind="new",
+    ) -> t.Iterator[Redditor]:
+        new_users = paginate(
+            endpoint="users/new",
             limit=limit,
+            status=status,
         )
 
         return new_users
@@ -29,15 +26,13 @@ class Users:
     @classmethod
     def popular(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Redditor]:
-        popular_users = reddit.users(
-            session=session,
-            status=status,
-            kind="popular",
+    ) -> t.Iterator[Redditor]:
+        popular_users = paginate(
+            endpoint="users/popular",
             limit=limit,
+            status=status,
         )
 
         return popular_users
@@ -45,15 +40,13 @@ class Users:
     @classmethod
     def all(
         cls,
-        session: requests.Session,
         limit: int,
         status: t.Optional[Status] = None,
-    ) -> t.List[Redditor]:
-        all_users = reddit.users(
-            session=session,
-            status=status,
-            kind="all",
+    ) -> t.Iterator[Redditor]:
+        all_users = paginate(
+            endpoint="users",
             limit=limit,
+            status=status,
         )
 
         return all_users
@@ -0,0 +1,221 @@
+import json
+import os
+import tempfile
+import threading
+import typing as t
+
+__all__ = ["Span", "Watermark", "WatermarkStore"]
+
+
+class Watermark(t.NamedTuple):
+    """The newest point of a chronological listing seen so far."""
+
+    created_utc: float
+    # Fullnames of the items created at ``created_utc``, as several can share a second.
+    fullnames: t.Tuple[str, ...]
+
+    def covers(self, item: t.Any) -> bool:
+        """
+        :param item: An item of the listing (e.g., a ``Submission``).
+        :type item: t.Any
+        :return: Whether the item was already seen as of this watermark.
+        :rtype: bool
+        """
+        created_utc: float = getattr(item, "created_utc", 0)
+        return created_utc < self.created_utc or (
+            created_utc == self.created_utc
+            and getattr(item, "fullname", None) in self.fullnames
+        )
+
+    @staticmethod
+    def advance(mark: t.Optional["Watermark"], item: t.Any) -> t.Optional["Watermark"]:
+        """
+        :param mark: The watermark so far, if any.
+        :type mark: t.Optional[Watermark]
+        :param item: An item just seen.
+        :type item: t.Any
+        :return: The watermark moved up to the item, if it is newer.
+        :rtype: t.Optional[Watermark]
+        """
+        created_utc: t.Optional[float] = getattr(item, "created_utc", None)
+        fullname: t.Optional[str] = getattr(item, "fullname", None)
+        if created_utc is None or fullname is None:
+            return mark
+
+        if mark is None or created_utc > mark.created_utc:
+            return Watermark(created_utc=created_utc, fullnames=(fullname,))
+        if created_utc == mark.created_utc and fullname not in mark.fullnames:
+            return mark._replace(fullnames=mark.fullnames + (fullname,))
+        return mark
+
+    @staticmethod
+    def retreat(mark: t.Optional["Watermark"], item: t.Any) -> t.Optional["Watermark"]:
+        """
+        :param mark: The oldest point seen so far, if any.
+        :type mark: t.Optional[Watermark]
+        :param item: An item just seen.
+        :type item: t.Any
+        :return: The point moved down to the item, if it is older.
+        :rtype: t.Optional[Watermark]
+        """
+        created_utc: t.Optional[float] = getattr(item, "created_utc", None)
+        fullname: t.Optional[str] = getattr(item, "fullname", None)
+        if created_utc is None or fullname is None:
+            return mark
+
+        if mark is None or created_utc < mark.created_utc:
+            return Watermark(created_utc=created_utc, fullnames=(fullname,))
+        if created_utc == mark.created_utc and fullname not in mark.fullnames:
+            return mark._replace(fullnames=mark.fullnames + (fullname,))
+        return mark
+
+    @staticmethod
+    def newer(
+        mark: t.Optional["Watermark"], other: t.Optional["Watermark"]
+    ) -> t.Optional["Watermark"]:
+        """
+        :return: The newer of two points (either may be None), merging them if they're tied.
+        :rtype: t.Optional[Watermark]
+        """
+        if mark is None or other is None:
+            return mark or other
+        if mark.created_utc != other.created_utc:
+            return max(mark, other, key=lambda point: point.created_utc)
+        return mark._replace(
+            fullnames=tuple(dict.fromkeys(mark.fullnames + other.fullnames))
+        )
+
+    @staticmethod
+    def older(
+        mark: t.Optional["Watermark"], other: t.Optional["Watermark"]
+    ) -> t.Optional["Watermark"]:
+        """
+        :return: The older of two points (either may be None), merging them if they're tied.
+        :rtype: t.Optional[Watermark]
+        """
+        if mark is None or other is None:
+            return mark or other
+        if mark.created_utc != other.created_utc:
+            return min(mark, other, key=lambda point: point.created_utc)
+        return Watermark.newer(mark, other)
+
+
+class Span(t.NamedTuple):
+    """
+    The items a walk cut short by its limit fetched above the watermark, from ``newest`` down
+    to ``oldest``. Those between ``oldest`` and the watermark are still to be fetched.
+    """
+
+    newest: Watermark
+    oldest: Watermark
+
+    def covers(self, item: t.Any) -> bool:
+        """
+        :param item: An item of the listing (e.g., a ``Submission``).
+        :type item: t.Any
+        :return: Whether the item lies within the span.
+        :rtype: bool
+        """
+        created_utc: float = getattr(item, "created_utc", 0)
+        return self.newest.covers(item) and (
+            created_utc > self.oldest.created_utc
+            or getattr(item, "fullname", None) in self.oldest.fullnames
+        )
+
+
+class WatermarkStore:
+    """
+    Keeps a :class:`Watermark` per ``(command, target, listing)`` on disk, so a scheduled run
+    can stop reading a listing once it reaches what an earlier run already fetched, along with
+    the :class:`Span` fetched by a run its limit cut short, so the next run fills in the rest.
+
+    The file is replaced atomically, so concurrent processes never see a partially written store.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Path to the store file (created on the first write).
+        :type path: str
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(key: t.Tuple[str, str, str]) -> str:
+        command, target, listing = key
+        return f"{command}:{target.lower()}:{listing}"
+
+    def get(
+        self, key: t.Tuple[str, str, str]
+    ) -> t.Tuple[t.Optional[Watermark], t.Optional[Span]]:
+        """
+        :param key: The ``(command, target, listing)`` the watermark belongs to,
+            e.g., ``("subreddit", "python", "new")``.
+        :type key: t.Tuple[str, str, str]
+        :return: The stored watermark (None if no walk of the listing ever completed), and the
+            span fetched above it by a walk cut short, if any.
+        :rtype: t.Tuple[t.Optional[Watermark], t.Optional[Span]]
+        """
+        entry: t.Dict[str, t.Any] = self._load().get(self._key(key)) or {}
+        span: t.Optional[t.Dict[str, t.Any]] = entry.get("span")
+        return self._watermark(entry.get("mark")), (
+            Span(
+                newest=self._watermark(span["newest"]),
+                oldest=self._watermark(span["oldest"]),
+            )
+            if span
+            else None
+        )
+
+    def set(
+        self,
+        key: t.Tuple[str, str, str],
+        mark: t.Optional[Watermark],
+        span: t.Optional[Span] = None,
+    ):
+        """
+        :param key: The ``(command, target, listing)`` the watermark belongs to.
+        :type key: t.Tuple[str, str, str]
+        :param mark: The newest point up to which everything was fetched.
+        :type mark: t.Optional[Watermark]
+        :param span: What was fetched above ``mark`` by a walk cut short, if any.
+        :type span: t.Optional[Span]
+        """
+        with self._lock:
+            entries = self._load()
+            entries[self._key(key)] = {
+                "mark": mark._asdict() if mark else None,
+                "span": (
+                    {"newest": span.newest._asdict(), "oldest": span.oldest._asdict()}
+                    if span
+                    else None
+                ),
+            }
+
+            directory: str = os.path.dirname(self.path) or "."
+            os.makedirs(directory, exist_ok=True)
+
+            descriptor, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            try:
+                with os.fdopen(descriptor, "w") as temp_file:
+                    json.dump(entries, temp_file)
+                os.replace(temp_path, self.path)
+            except BaseException:
+                os.unlink(temp_path)
+                raise
+
+    @staticmethod
+    def _watermark(entry: t.Optional[t.Dict[str, t.Any]]) -> t.Optional[Watermark]:
+        if not entry:
+            return None
+
+        return Watermark(
+            created_utc=entry["created_utc"], fullnames=tuple(entry["fullnames"])
+        )
+
+    def _load(self) -> t.Dict[str, t.Dict[str, t.Any]]:
+        try:
+            with open(self.path) as store_file:
+                return json.load(store_file)
+        except (OSError, ValueError):
+            return {}
@@ -0,0 +1,129 @@
+import typing as t
+from types import SimpleNamespace
+
+import praw
+import pytest
+
+from knewkarma.core import client, listing
+from knewkarma.core.checkpoint import Checkpoint
+from knewkarma.core.watermark import WatermarkStore
+
+
+class FakeAPI:
+    """
+    Answers ``reddit().request(...)`` calls from canned payloads, keyed by path, and records
+    every request made.
+
+    A payload may be a callable, which is called with the request's params.
+    """
+
+    def __init__(self):
+        self.routes: t.Dict[str, t.Any] = {}
+        self.calls: t.List[t.Tuple[str, t.Dict[str, t.Any]]] = []
+        self.reddit = praw.Reddit(
+            client_id="client-id", client_secret="client-secret", user_agent="tests"
+        )
+        self.reddit.request = self.request
+
+    def request(self, method: str, path: str, params=None, **kwargs) -> t.Any:
+        params = dict(params or {})
+        self.calls.append((path, params))
+        if path not in self.routes:
+            raise AssertionError(f"unexpected request: {method} {path} {params}")
+
+        payload = self.routes[path]
+        return payload(params) if callable(payload) else payload
+
+    def paths(self) -> t.List[str]:
+        return [path for path, _ in self.calls]
+
+
+def listing_page(
+    children: t.List[t.Dict[str, t.Any]], after: t.Optional[str] = None
+) -> t.Dict[str, t.Any]:
+    return {"kind": "Listing", "data": {"children": children, "after": after}}
+
+
+def paged(children: t.List[t.Dict[str, t.Any]]) -> t.Callable[[t.Dict], t.Dict]:
+    """A listing route serving ``children`` a page at a time, as Reddit does."""
+
+    def route(params: t.Dict[str, t.Any]) -> t.Dict[str, t.Any]:
+        fullnames = [child["data"]["name"] for child in children]
+        start = fullnames.index(params["after"]) + 1 if "after" in params else 0
+        page = children[start : start + int(params.get("limit", 25))]
+        more = start + len(page) < len(children)
+        return listing_page(page, after=page[-1]["data"]["name"] if more else None)
+
+    return route
+
+
+def submission(number: int, created_utc: float, **data) -> t.Dict[str, t.Any]:
+    return {
+        "kind": "t3",
+        "data": {
+            "id": f"p{number}",
+            "name": f"t3_p{number}",
+            "title": f"Post {number}",
+            "author": "someone",
+            "subreddit": "python",
+            "score": number,
+            "created_utc": created_utc,
+            **data,
+        },
+    }
+
+
+def comment(id: str, parent_id: str, **data) -> t.Dict[str, t.Any]:
+    return {
+        "kind": "t1",
+        "data": {
+            "id": id,
+            "name": f"t1_{id}",
+            "parent_id": parent_id,
+            "link_id": "t3_x",
+            "author": "someone",
+            "body": id,
+            "replies": "",
+            **data,
+        },
+    }
+
+
+def submission_with(
+    api: FakeAPI, comments: t.List[t.Dict[str, t.Any]]
+) -> praw.models.Submission:
+    """Serves a post ``x`` with the given comments, and returns it unfetched."""
+    api.routes["comments/x/"] = [
+        {
+            "kind": "Listing",
+            "data": {
+                "children": [{"kind": "t3", "data": {"id": "x", "name": "t3_x"}}],
+                "after": None,
+            },
+        },
+        {"kind": "Listing", "data": {"children": comments, "after": None}},
+    ]
+    return api.reddit.submission(id="x")
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+    """Keeps settings, caches, checkpoints and watermarks from leaking between tests."""
+    for name, value in list(client._settings.items()):
+        monkeypatch.setitem(client._settings, name, value)
+    monkeypatch.setattr(Checkpoint, "DIRECTORY", str(tmp_path / "checkpoints"))
+    store = WatermarkStore(path=str(tmp_path / "watermarks.json"))
+    monkeypatch.setattr(listing, "watermarks", lambda: store)
+
+    client.existence_cache.cache_clear()
+    yield
+    client.existence_cache.cache_clear()
+
+
+@pytest.fixture
+def api(monkeypatch) -> FakeAPI:
+    fake = FakeAPI()
+    monkeypatch.setattr(
+        client, "pool", lambda: SimpleNamespace(next=lambda: fake.reddit)
+    )
+    return fake
@@ -0,0 +1,23 @@
+import os
+import subprocess
+import sys
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(__file__)), "src")
+
+
+def test_importing_commands_skips_heavy_dependencies():
+    # A fresh interpreter, as this one may already have imported them for other tests.
+    loaded = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, knewkarma.cli.commands; "
+            "print(*(name for name in ('pandas', 'praw') if name in sys.modules))",
+        ],
+        env={**os.environ, "PYTHONPATH": SRC},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    assert loaded.stdout.split() == []
@@ -0,0 +1,42 @@
+from conftest import comment, submission_with
+from knewkarma.core.expander import CommentExpander
+
+
+def test_nested_morechildren_are_attached_to_their_parents(api):
+    # A top-level stub lists every hidden id under it, including nested replies.
+    submission = submission_with(
+        api,
+        [
+            comment("a", "t3_x"),
+            {
+                "kind": "more",
+                "data": {
+                    "id": "b",
+                    "name": "t1_b",
+                    "parent_id": "t3_x",
+                    "children": ["b", "c", "d"],
+                    "count": 3,
+                    "depth": 0,
+                },
+            },
+        ],
+    )
+    api.routes["api/morechildren/"] = {
+        "json": {
+            "data": {
+                "things": [
+                    comment("b", "t3_x"),
+                    comment("c", "t1_b"),
+                    comment("d", "t3_x"),
+                ]
+            }
+        }
+    }
+
+    flat = CommentExpander(submission=submission).expand()
+    by_id = {comment.id: comment for comment in flat}
+
+    assert [comment.id for comment in flat] == ["a", "b", "c", "d"]
+    assert [reply.id for reply in by_id["b"]._replies] == ["c"]
+    assert by_id["a"]._replies == [] and by_id["d"]._replies == []
+    assert by_id["b"]._reply_count == 1
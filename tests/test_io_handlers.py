@@ -0,0 +1,64 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pandas as pd
+
+from karmakrate.handlers.io_handlers import DataFrameHandler, StreamHandler
+from knewkarma.core.comment_tree import CommentTree
+
+
+def comment_tree() -> CommentTree:
+    return CommentTree.from_comments(
+        submission=SimpleNamespace(id="x"),
+        comments=[
+            SimpleNamespace(
+                id=id,
+                name=f"t1_{id}",
+                parent_id=parent_id,
+                author="someone",
+                body=id,
+                score=1,
+                created_utc=1000.0,
+            )
+            for id, parent_id in [("a", "t3_x"), ("b", "t1_a")]
+        ],
+    )
+
+
+def test_export_writes_every_format(tmp_path):
+    dataframe = pd.DataFrame({"id": ["a", "b"], "tags": [["x"], []], "score": [1, 2]})
+    for file_format in ("csv", "json", "xml"):
+        (tmp_path / file_format).mkdir()
+
+    DataFrameHandler.export(
+        dataframe=dataframe,
+        filename="export",
+        directory=str(tmp_path),
+        formats=["csv", "json", "xml"],
+        status=None,
+    )
+
+    csv = (tmp_path / "csv" / "export.csv").read_text()
+    assert csv.splitlines()[0] == ",id,tags,score"
+    exported = json.loads((tmp_path / "json" / "export.json").read_text())
+    assert exported["id"] == {"0": "a", "1": "b"}
+    assert "<score>2</score>" in (tmp_path / "xml" / "export.xml").read_text()
+
+
+def test_comment_trees_are_exported_with_typed_columns():
+    dataframe = DataFrameHandler.build(data=[comment_tree()], status=None)
+
+    assert str(dataframe["created_utc"].dtype).startswith("datetime64")
+    assert str(dataframe["created_utc"].dtype).endswith("UTC]")
+    assert dataframe["author"].dtype == "category"
+    assert dataframe["submission_id"].dtype == "category"
+    assert dataframe["depth"].tolist() == [0, 1]
+
+
+def test_streamed_comment_trees_have_datetimes():
+    rows = list(StreamHandler.rows(item=comment_tree()))
+
+    assert [row["created_utc"] for row in rows] == [
+        datetime.fromtimestamp(1000.0, tz=timezone.utc)
+    ] * 2
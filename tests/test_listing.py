@@ -0,0 +1,99 @@
+import pytest
+
+from conftest import paged, submission
+from knewkarma.core import client, listing
+from knewkarma.core.checkpoint import Checkpoint
+from knewkarma.core.listing import paginate
+
+KEY = ("subreddit", "python", "new")
+
+
+@pytest.fixture
+def incremental(monkeypatch):
+    monkeypatch.setitem(client._settings, "incremental", True)
+
+
+def fetch(limit):
+    return [
+        item.id
+        for item in paginate(
+            endpoint="r/python/new", limit=limit, watermark=KEY, newest_first=True
+        )
+    ]
+
+
+def test_limit_does_not_skip_unfetched_items(api, incremental):
+    posts = [
+        submission(number, created_utc=1000.0 + number) for number in range(5, 0, -1)
+    ]
+    api.routes["r/python/new"] = paged(posts)
+
+    assert fetch(limit=2) == ["p5", "p4"]
+    assert fetch(limit=None) == ["p3", "p2", "p1"]
+    assert fetch(limit=None) == []
+
+
+def test_limited_runs_fill_in_what_earlier_ones_left(api, incremental):
+    posts = [
+        submission(number, created_utc=1000.0 + number) for number in range(5, 0, -1)
+    ]
+    api.routes["r/python/new"] = paged(posts)
+
+    runs = [fetch(limit=2), fetch(limit=2), fetch(limit=2)]
+    assert runs == [["p5", "p4"], ["p3", "p2"], ["p1"]]
+
+    # New items are fetched first, and the walk stops where the completed one began.
+    posts.insert(0, submission(6, created_utc=1006.0))
+    assert fetch(limit=2) == ["p6"]
+    assert fetch(limit=2) == []
+
+
+def test_limited_run_above_an_older_span(api, incremental):
+    posts = [
+        submission(number, created_utc=1000.0 + number) for number in range(4, 0, -1)
+    ]
+    api.routes["r/python/new"] = paged(posts)
+    assert fetch(limit=2) == ["p4", "p3"]
+
+    for number in (5, 6, 7):
+        posts.insert(0, submission(number, created_utc=1000.0 + number))
+    assert fetch(limit=2) == ["p7", "p6"]
+
+    # The older span is read again rather than remembered, so nothing is skipped.
+    assert fetch(limit=None) == ["p5", "p4", "p3", "p2", "p1"]
+    assert fetch(limit=None) == []
+
+
+def test_pages_are_only_checkpointed_to_resume(api, tmp_path):
+    posts = [submission(number, created_utc=1000.0 + number) for number in range(3)]
+    api.routes["r/python/new"] = paged(posts)
+
+    assert len(list(paginate(endpoint="r/python/new", limit=None))) == 3
+    assert not (tmp_path / "checkpoints").exists()
+
+
+def test_resume_replays_saved_pages(api, monkeypatch):
+    monkeypatch.setattr(listing, "PAGE_SIZE", 2)
+    monkeypatch.setitem(client._settings, "resume", True)
+    posts = [submission(number, created_utc=1000.0 + number) for number in range(5)]
+    api.routes["r/python/new"] = paged(posts)
+
+    walk = paginate(endpoint="r/python/new", limit=None)
+    assert [next(walk).id for _ in range(3)] == ["p0", "p1", "p2"]
+    walk.close()
+
+    checkpoint = Checkpoint(endpoint="r/python/new", params={}, limit=None)
+    state = checkpoint.state()
+    assert state["after"] == "t3_p3" and "ids" not in state
+
+    # The saved pages are replayed, and only those after the last cursor are fetched.
+    api.calls.clear()
+    assert [item.id for item in paginate(endpoint="r/python/new", limit=None)] == [
+        "p0",
+        "p1",
+        "p2",
+        "p3",
+        "p4",
+    ]
+    assert [params.get("after") for _, params in api.calls] == ["t3_p3"]
+    assert not checkpoint.exists()
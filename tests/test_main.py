@@ -0,0 +1,72 @@
+import threading
+import time
+from concurrent.futures import Future
+
+import pytest
+
+from knewkarma.cli import main
+
+
+def run_prefetch(method):
+    ready, stop = Future(), threading.Event()
+    worker = threading.Thread(
+        target=main.prefetch_method,
+        kwargs={"method": method, "ready": ready, "stop": stop},
+    )
+    worker.start()
+    return ready, stop, worker
+
+
+def test_streamed_results_are_read_ahead_boundedly(monkeypatch):
+    monkeypatch.setattr(main, "PREFETCH_SIZE", 5)
+    read: list = []
+
+    def listing():
+        for number in range(100):
+            read.append(number)
+            yield number
+
+    ready, stop, worker = run_prefetch(lambda: listing())
+    result = ready.result(timeout=5)
+    assert isinstance(result, main.Prefetched)
+
+    time.sleep(0.2)
+    # Five items queued, and one more waiting for room.
+    assert len(read) <= 6
+
+    assert list(result) == list(range(100))
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_errors_reach_the_reader():
+    def listing():
+        yield 1
+        raise ValueError("page failed")
+
+    ready, stop, worker = run_prefetch(lambda: listing())
+    result = ready.result(timeout=5)
+
+    assert next(result) == 1
+    with pytest.raises(ValueError, match="page failed"):
+        next(result)
+    worker.join(timeout=5)
+
+
+def test_closing_frees_the_worker(monkeypatch):
+    monkeypatch.setattr(main, "PREFETCH_SIZE", 1)
+
+    ready, stop, worker = run_prefetch(lambda: iter(range(100)))
+    result = ready.result(timeout=5)
+    assert next(result) == 0
+
+    result.close()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_non_streamed_results_are_handed_over_as_they_are():
+    ready, stop, worker = run_prefetch(lambda: [1, 2, 3])
+
+    assert ready.result(timeout=5) == [1, 2, 3]
+    worker.join(timeout=5)
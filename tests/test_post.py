@@ -0,0 +1,32 @@
+import gc
+import weakref
+
+from conftest import comment, submission_with
+from knewkarma.core.comment_tree import CommentTree
+from knewkarma.core.post import Post
+
+
+def test_comments_are_released_once_the_tree_is_built(api, monkeypatch):
+    submission_with(
+        api,
+        [
+            comment("a", "t3_x"),
+            comment("b", "t3_x"),
+        ],
+    )
+    references = []
+    from_comments = CommentTree.from_comments
+
+    def tracked(submission, comments):
+        references.extend(weakref.ref(item) for item in comments)
+        return from_comments(submission=submission, comments=comments)
+
+    monkeypatch.setattr(CommentTree, "from_comments", tracked)
+
+    post = Post(id="x")
+    tree = post.comments(status=None)
+    gc.collect()
+
+    assert tree.ids == ["a", "b"]
+    assert len(references) == 2
+    assert all(reference() is None for reference in references)
@@ -0,0 +1,14 @@
+import pytest
+
+from conftest import listing_page, submission
+from knewkarma.core.posts import Posts
+
+
+@pytest.mark.parametrize("listing", ["controversial", "top"])
+def test_time_filter_is_forwarded(api, listing):
+    api.routes[listing] = listing_page([submission(1, created_utc=1000.0)])
+
+    posts = list(getattr(Posts, listing)(limit=10, time_filter="month"))
+
+    assert [post.id for post in posts] == ["p1"]
+    assert api.calls == [(listing, {"t": "month", "limit": 10})]
@@ -0,0 +1,72 @@
+from concurrent.futures import Future
+
+from karmakrate.everything import runtime_things
+from karmakrate.everything.runtime_things import RuntimeThings
+from knewkarma.meta.version import Version
+
+
+def test_report_checks_names_the_check_that_timed_out(monkeypatch):
+    logged, reported = [], []
+    monkeypatch.setattr(runtime_things.console, "log", logged.append)
+    monkeypatch.setattr(
+        RuntimeThings,
+        "report_status",
+        staticmethod(lambda *result: reported.append(result)),
+    )
+
+    server_status = Future()
+    server_status.set_result(({"status": {"indicator": "none"}}, None))
+    checks = {"update": Future(), "server status": server_status}
+    RuntimeThings(package_name="knewkarma", version_cls=Version).report_checks(
+        checks=checks, timeout=0.01
+    )
+
+    assert len(logged) == 1 and "update check: timed out" in logged[0]
+    assert reported == [({"status": {"indicator": "none"}}, None)]
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Answers every request with the same JSON, recording the keyword arguments sent."""
+
+    def __init__(self, data):
+        self.data = data
+        self.sent = []
+
+    def get(self, **kwargs) -> FakeResponse:
+        self.sent.append(kwargs)
+        return FakeResponse(data=self.data)
+
+
+def test_requests_have_a_timeout(monkeypatch, tmp_path):
+    monkeypatch.setattr(RuntimeThings, "CACHE_FILE", str(tmp_path / "runtime.json"))
+    session = FakeSession(data={"status": {"indicator": "none"}})
+
+    RuntimeThings.send_request(url="https://example.com", session=session, ttl=60)
+
+    assert session.sent[0]["timeout"] == RuntimeThings.REQUEST_TIMEOUT
+
+
+def test_failed_cache_writes_leave_nothing_behind(monkeypatch, tmp_path):
+    monkeypatch.setattr(RuntimeThings, "CACHE_FILE", str(tmp_path / "runtime.json"))
+
+    def fail(*args, **kwargs):
+        raise OSError("No space left on device")
+
+    monkeypatch.setattr(runtime_things.json, "dump", fail)
+    RuntimeThings._write_cache(url="https://example.com", data={})
+
+    assert list(tmp_path.iterdir()) == []
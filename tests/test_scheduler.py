@@ -0,0 +1,101 @@
+import multiprocessing
+import time
+
+import pytest
+from requests import Response
+
+from knewkarma.core import scheduler
+from knewkarma.core.scheduler import (
+    ScheduledRequestor,
+    SharedTokenBucket,
+    TokenBucket,
+)
+
+URL = "https://oauth.reddit.com/r/python/new"
+
+
+class FakeSession:
+    """Answers every request with the next of the given status codes."""
+
+    def __init__(self, *statuses: int, headers=None):
+        self.statuses = list(statuses)
+        self.headers = {}
+        self.sent = 0
+        self._headers = headers or {}
+
+    def request(self, *args, **kwargs) -> Response:
+        self.sent += 1
+        response = Response()
+        response.status_code = self.statuses.pop(0)
+        response.headers.update(self._headers)
+        return response
+
+
+class FakeBucket(TokenBucket):
+    """Never holds a request back, and records how long it was asked to cool down for."""
+
+    def __init__(self):
+        super().__init__()
+        self.cooldowns = []
+
+    def acquire(self):
+        pass
+
+    def cool_down(self, seconds: float):
+        self.cooldowns.append(seconds)
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    slept = []
+    monkeypatch.setattr(scheduler.time, "sleep", slept.append)
+    return slept
+
+
+def test_throttled_requests_wait_for_retry_after(sleeps):
+    session = FakeSession(429, 429, 200, headers={"retry-after": "7"})
+    bucket = FakeBucket()
+    requestor = ScheduledRequestor("knewkarma tests", session=session, bucket=bucket)
+
+    assert requestor.request("GET", URL).status_code == 200
+    assert session.sent == 3
+    assert sleeps == bucket.cooldowns == [7.0, 7.0]
+
+
+@pytest.mark.parametrize("status_code", [500, 502, 503, 504, 522])
+def test_server_errors_are_left_to_prawcore(sleeps, status_code):
+    session = FakeSession(status_code, 200)
+    bucket = FakeBucket()
+    requestor = ScheduledRequestor("knewkarma tests", session=session, bucket=bucket)
+
+    assert requestor.request("GET", URL).status_code == status_code
+    assert session.sent == 1
+    assert sleeps == bucket.cooldowns == []
+
+
+def acquire_until(path: str, start: float, end: float) -> int:
+    """Takes tokens from a shared bucket from ``start`` until ``end``, and counts them."""
+    bucket = SharedTokenBucket(path=path, key="app", capacity=20, period=2, burst=5)
+    time.sleep(max(start - time.time(), 0))
+
+    acquired = 0
+    while True:
+        bucket.acquire()
+        if time.time() > end:
+            return acquired
+        acquired += 1
+
+
+def test_processes_share_one_budget(tmp_path):
+    processes, window = 4, 1.5
+    start = time.time() + 2
+    path = str(tmp_path / "ratelimit.sqlite3")
+
+    with multiprocessing.get_context("spawn").Pool(processes) as pool:
+        counts = pool.starmap(
+            acquire_until, [(path, start, start + window)] * processes
+        )
+
+    # A full burst, plus whatever the bucket refills (10 tokens a second) over the window.
+    assert sum(counts) <= 5 + 10 * window
+    assert sum(counts) >= 10 * window / 2
@@ -0,0 +1,34 @@
+import sqlite3
+from types import SimpleNamespace
+
+from rich.status import Status
+
+from karmakrate.handlers.sqlite_handler import SQLiteHandler
+from knewkarma.core.comment_tree import CommentTree
+
+
+class RecordingStatus(Status):
+    def __init__(self):
+        super().__init__("")
+        self.updates = []
+
+    def update(self, status=None, **kwargs):
+        self.updates.append(status)
+
+
+def test_tee_reports_the_last_upsert(tmp_path):
+    path = str(tmp_path / "reddit.sqlite3")
+    tree = CommentTree.from_comments(
+        submission=SimpleNamespace(id="x"),
+        comments=[
+            SimpleNamespace(id="a", name="t1_a", parent_id="t3_x", created_utc=1.0)
+        ],
+    )
+    status = RecordingStatus()
+
+    assert list(SQLiteHandler.tee(items=[tree], path=path, status=status)) == [tree]
+    assert status.updates == [f"Upserting the last rows into {path}..."]
+    with sqlite3.connect(path) as connection:
+        assert connection.execute("SELECT fullname FROM comments").fetchall() == [
+            ("t1_a",)
+        ]
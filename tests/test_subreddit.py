@@ -0,0 +1,122 @@
+import time
+
+import pytest
+from praw.models import Subreddit as PrawSubreddit
+
+from conftest import listing_page, submission
+from knewkarma.core.listing import Predicates
+from knewkarma.core.subreddit import Subreddit
+
+
+@pytest.fixture
+def no_fetch(monkeypatch):
+    def fetch(self):
+        raise AssertionError(f"{self!r} was fetched again")
+
+    monkeypatch.setattr(PrawSubreddit, "_fetch", fetch)
+
+
+def test_exists_profile_is_not_fetched_again(api, no_fetch):
+    api.routes["r/python/about"] = {
+        "kind": "t5",
+        "data": {"id": "2qh0y", "display_name": "Python", "subscribers": 10},
+    }
+
+    subreddit = Subreddit(display_name="python")
+    assert subreddit.exists()
+    profile = subreddit.profile()
+
+    assert not hasattr(profile, "description")
+    assert profile.subscribers == 10
+    assert api.paths() == ["r/python/about"]
+
+
+def test_bulk_profiles_request_count(api, no_fetch):
+    from karmakrate.handlers import schemas
+
+    api.routes["api/info"] = lambda params: {
+        "kind": "Listing",
+        "data": {
+            "children": [
+                {"kind": "t5", "data": {"id": name, "display_name": name.title()}}
+                for name in params["sr_name"].split(",")
+                if name != "missing"
+            ]
+        },
+    }
+
+    profiles = list(
+        Subreddit.bulk_profiles(names=["python", "missing", "rust", "python"])
+    )
+    again = list(Subreddit.bulk_profiles(names=["rust"]))
+
+    assert [profile.display_name for profile in profiles + again] == [
+        "Python",
+        "Rust",
+        "Rust",
+    ]
+    for profile in profiles:
+        row = schemas.project(obj=profile, schema=schemas.SCHEMAS["Subreddit"])
+        assert row["display_name"] == profile.display_name
+        assert not hasattr(profile, "subscribers")
+
+    assert api.paths() == ["api/info"]
+
+
+def test_group_posts_forwards_time_filter(api):
+    api.routes["api/info"] = {
+        "kind": "Listing",
+        "data": {"children": [{"kind": "t5", "data": {"display_name": "python"}}]},
+    }
+    api.routes["r/python/top"] = listing_page([submission(1, created_utc=1000.0)])
+
+    posts = list(
+        Subreddit.group_posts(
+            names=["python"], limit=5, listing="top", time_filter="week"
+        )
+    )
+
+    assert [post.id for post in posts] == ["p1"]
+    assert api.calls[-1] == ("r/python/top", {"t": "week", "limit": 5})
+
+
+def test_group_comments_apply_predicates_and_time_window(api):
+    now = time.time()
+    api.routes["api/info"] = {
+        "kind": "Listing",
+        "data": {"children": [{"kind": "t5", "data": {"display_name": "python"}}]},
+    }
+    api.routes["r/python/comments"] = listing_page(
+        [
+            {
+                "kind": "t1",
+                "data": {
+                    "id": f"c{number}",
+                    "name": f"t1_c{number}",
+                    "author": author,
+                    "subreddit": "python",
+                    "body": "...",
+                    "created_utc": created_utc,
+                },
+            }
+            for number, author, created_utc in [
+                (1, "alice", now - 60),
+                (2, "bob", now - 120),
+                (3, "alice", now - 2 * 24 * 60 * 60),
+            ]
+        ],
+        after="t1_c3",
+    )
+
+    comments = list(
+        Subreddit.group_comments(
+            names=["python"],
+            limit=5,
+            time_filter="day",
+            where=Predicates(authors=frozenset({"alice"})),
+        )
+    )
+
+    assert [comment.id for comment in comments] == ["c1"]
+    # The comment older than a day ends the walk, so the next page is never requested.
+    assert api.paths() == ["api/info", "r/python/comments"]
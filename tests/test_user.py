@@ -0,0 +1,74 @@
+import pytest
+from praw.models import Redditor
+
+from knewkarma.core.user import User
+
+
+@pytest.fixture
+def no_fetch(monkeypatch):
+    def fetch(self):
+        raise AssertionError(f"{self!r} was fetched again")
+
+    monkeypatch.setattr(Redditor, "_fetch", fetch)
+
+
+def test_exists_profile_is_not_fetched_again(api, no_fetch):
+    api.routes["user/spez/about"] = {
+        "kind": "t2",
+        "data": {"id": "1w72", "name": "spez", "link_karma": 1, "comment_karma": 2},
+    }
+
+    user = User(username="spez")
+    assert user.exists()
+    profile = user.profile()
+
+    assert not hasattr(profile, "is_suspended")
+    assert profile.link_karma == 1
+    assert api.paths() == ["user/spez/about"]
+
+
+def test_bulk_profiles_request_count(api, no_fetch):
+    from karmakrate.handlers import schemas
+    from karmakrate.riches.rich_render import Render
+
+    api.routes["api/user_data_by_account_ids"] = {
+        "t2_a1": {
+            "name": "alice",
+            "created_utc": 1.0,
+            "link_karma": 3,
+            "comment_karma": 4,
+        },
+        "t2_b2": {
+            "name": "bob",
+            "created_utc": 2.0,
+            "link_karma": 5,
+            "comment_karma": 6,
+        },
+    }
+    for name in ("carol", "dave"):
+        api.routes[f"user/{name}/about"] = {
+            "kind": "t2",
+            "data": {
+                "id": name,
+                "name": name,
+                "created_utc": 3.0,
+                "link_karma": 7,
+                "comment_karma": 8,
+            },
+        }
+
+    profiles = list(
+        User.bulk_profiles(names=["t2_a1", "carol", "t2_b2", "dave"], workers=2)
+    )
+
+    assert [profile.name for profile in profiles] == ["alice", "bob", "carol", "dave"]
+    for profile in profiles:
+        row = schemas.project(obj=profile, schema=schemas.SCHEMAS["Redditor"])
+        assert row["name"] == profile.name
+        assert Render._user(data=profile, print_panel=False) is not None
+
+    assert sorted(api.paths()) == [
+        "api/user_data_by_account_ids",
+        "user/carol/about",
+        "user/dave/about",
+    ]